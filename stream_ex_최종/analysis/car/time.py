@@ -1,36 +1,47 @@
-import matplotlib.pyplot as plt
 import pandas as pd
 from statsmodels.tsa.arima.model import ARIMA
 from statsmodels.tsa.stattools import adfuller, kpss
 
-# ------------------
-# 한글 폰트 설정
-# ------------------
-plt.rcParams['font.family'] = 'Malgun Gothic'
-plt.rcParams['axes.unicode_minus'] = False
+from analysis.common.cache import cached_result
+from analysis.common.downsample import downsample, marker_for, max_points, thin_ticks
+from analysis.common.metrics import track_fit
+from analysis.common.singleflight import single_flight
+from analysis.common.plotting import new_figure
 
+# 기간을 잘라서 볼 때 정상성 검정 / ARIMA 를 돌릴 최소 개월 수
+MIN_WINDOW_MONTHS = 24
 
-def plot_monthly(df):
-    fig, ax = plt.subplots(figsize=(14, 6))
-    ax.plot(df.index, df['car_count_month'], marker='o', linewidth=2)
-    ax.set_title("서울시 월별 자동차 등록 현황")
+# 점진 렌더링 때 먼저 보여 주는 근사 ARIMA 는 최근 이 개월 수로만 적합
+APPROX_MONTHS = 36
+
+
+@cached_result
+def plot_monthly(df, region="서울시"):
+    fig, ax = new_figure(figsize=(14, 6))
+    x, y = downsample(df.index, df['car_count_month'], max_points(fig))
+    ax.plot(x, y, marker=marker_for(len(y)), linewidth=2)
+    ax.set_title(f"{region} 월별 자동차 등록 현황")
     ax.set_xlabel("날짜")
     ax.set_ylabel("등록 차량 수")
     ax.grid(True, alpha=0.3)
-    plt.xticks(rotation=45)
+    thin_ticks(ax)
     return fig
 
 
-def plot_diff_1(df):
-    diff_1 = df['car_count_month'].diff().dropna()
-    fig, ax = plt.subplots(figsize=(14, 6))
-    ax.plot(diff_1, marker='o', linewidth=2)
+@cached_result
+def plot_diff_1(features, region="서울시"):
+    # 1차 차분은 feature store 에서 계산된 값 사용
+    diff_1 = features.set_index('datetime')['diff_1'].dropna()
+    fig, ax = new_figure(figsize=(14, 6))
+    # 차분은 부호가 바뀌는 급등락이 중요하므로 min-max 버킷 사용
+    x, y = downsample(diff_1.index, diff_1, max_points(fig), method="minmax")
+    ax.plot(x, y, marker=marker_for(len(y)), linewidth=2)
     ax.axhline(0, linestyle='--', alpha=0.7)
-    ax.set_title("서울시 월별 자동차 등록 수 1차 차분")
+    ax.set_title(f"{region} 월별 자동차 등록 수 1차 차분")
     ax.set_xlabel("날짜")
     ax.set_ylabel("전월 대비 증감")
     ax.grid(True, alpha=0.3)
-    plt.xticks(rotation=45)
+    thin_ticks(ax)
     return fig, diff_1
 
 
@@ -48,6 +59,9 @@ def stationarity_test(diff_1):
     }
 
 
+@cached_result
+@single_flight
+@track_fit("fit_arima")
 def fit_arima(df, order=(1, 1, 1)):
     model = ARIMA(
         df['car_count_month'],
@@ -56,6 +70,16 @@ def fit_arima(df, order=(1, 1, 1)):
     result = model.fit()
     return result
 
+def approx_arima(df, order=(1, 1, 1)):
+    """최근 APPROX_MONTHS 개월로 적합한 근사 모델 (기간이 그보다 짧으면 None)."""
+    if len(df) <= APPROX_MONTHS:
+        return None
+    return fit_arima(df.iloc[-APPROX_MONTHS:], order)
+
+def arima_summary(result):
+    return result.summary().as_text()
+
+
 def forecast_12_months(result, last_date):
 
     last_date = pd.to_datetime(last_date)
@@ -74,13 +98,14 @@ def forecast_12_months(result, last_date):
 
     return mean, conf
 
-def plot_forecast(df, forecast_mean, conf_int):
-    fig, ax = plt.subplots(figsize=(14, 6))
+def plot_forecast(df, forecast_mean, conf_int, region="서울시"):
+    fig, ax = new_figure(figsize=(14, 6))
 
     # 실제 값
+    x, y = downsample(df.index, df['car_count_month'], max_points(fig))
     ax.plot(
-        df.index,
-        df['car_count_month'],
+        x,
+        y,
         label="Observed",
         linewidth=2
     )
@@ -102,10 +127,11 @@ def plot_forecast(df, forecast_mean, conf_int):
         label="95% Confidence Interval"
     )
 
-    ax.set_title("서울시 자동차 등록 대수 12개월 예측")
+    ax.set_title(f"{region} 자동차 등록 대수 12개월 예측")
     ax.set_xlabel("날짜")
     ax.set_ylabel("등록 차량 수")
     ax.legend()
     ax.grid(alpha=0.3)
+    thin_ticks(ax, rotation=0)
 
     return fig
\ No newline at end of file
@@ -0,0 +1,78 @@
+# analysis/cctv/batch.py
+
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from analysis.cctv.model import FEATURES
+
+CHUNK_SIZE = 50_000
+
+
+# ------------------
+# 업로드 파일 → 청크 단위 DataFrame
+# ------------------
+def iter_chunks(file, file_name, chunksize=CHUNK_SIZE):
+    if file_name.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(file)
+        for batch in parquet.iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(file, chunksize=chunksize)
+
+
+def check_columns(df):
+    missing = [c for c in FEATURES if c not in df.columns]
+    if missing:
+        raise ValueError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+
+
+# ------------------
+# 청크별 예측 (심각정도 + 클래스별 확률)
+# ------------------
+def score_chunk(model, le, df):
+    check_columns(df)
+
+    X = df[FEATURES].to_numpy(dtype=np.float64)
+    proba = model.predict_proba(X)
+
+    result = df.copy()
+    result["예측_심각정도"] = le.classes_[model.classes_[proba.argmax(axis=1)]]
+    for i, code in enumerate(model.classes_):
+        result[f"확률_{le.classes_[code]}"] = proba[:, i].round(4)
+
+    return result
+
+
+def score_file(model, le, file, file_name, out=None, chunksize=CHUNK_SIZE):
+    """업로드 파일을 청크 단위로 예측해 out(바이너리 파일)에 CSV 로 이어 쓴다.
+
+    out 이 없으면 건수 / 분포만 집계 (화면 요약용).
+    """
+    n_rows = 0
+    counts = {}
+
+    # 같은 업로드를 요약 / 다운로드에서 다시 읽으므로 처음부터
+    file.seek(0)
+    for i, chunk in enumerate(iter_chunks(file, file_name, chunksize)):
+        scored = score_chunk(model, le, chunk)
+        if out is not None:
+            header = (i == 0)
+            out.write(scored.to_csv(index=False, header=header).encode("utf-8-sig" if header else "utf-8"))
+
+        n_rows += len(scored)
+        for label, cnt in scored["예측_심각정도"].value_counts().items():
+            counts[label] = counts.get(label, 0) + int(cnt)
+
+    return {"rows": n_rows, "counts": counts}
+
+
+def scored_file(model, le, file, file_name, chunksize=CHUNK_SIZE):
+    """예측 결과 CSV 임시 파일 (다운로드 버튼을 눌렀을 때만 실행, 파일은 닫히면 삭제)."""
+    f = tempfile.TemporaryFile()
+    score_file(model, le, file, file_name, f, chunksize)
+    f.seek(0)
+    return f
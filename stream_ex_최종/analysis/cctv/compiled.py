@@ -0,0 +1,138 @@
+# analysis/cctv/compiled.py
+
+import numpy as np
+
+
+# ------------------
+# 컴파일된 추론 모델
+# StandardScaler + RandomForest 파이프라인을
+# 연속된 NumPy 노드 배열로 펼쳐서 DataFrame / sklearn 검증 없이 예측
+# 스케일링은 노드 임계값에 미리 반영 → 입력을 원래 단위 그대로 비교
+# ------------------
+class CompiledForest:
+
+    def __init__(self, feature, threshold, left, right,
+                 value, roots, depth, classes):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.depth = depth
+        self.classes_ = classes
+        self.n_trees = len(roots)
+
+    def predict_proba(self, X, block_size=4096):
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        # 중간 배열 (행 x 트리) 크기를 제한하기 위해 블록 단위로 처리
+        proba = np.empty((len(X), self.value.shape[1]))
+        for start in range(0, len(X), block_size):
+            block = X[start:start + block_size]
+            proba[start:start + block_size] = self._traverse(block)
+        return proba
+
+    def _traverse(self, X):
+        # 모든 트리를 동시에 한 단계씩 내려감 (리프는 자기 자신을 가리킴)
+        rows = np.arange(len(X))[:, None]
+        node = np.broadcast_to(self.roots, (len(X), self.n_trees))
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+
+        return self.value[node].sum(axis=1) / self.n_trees
+
+    def predict(self, X):
+        proba = self.predict_proba(X)
+        return self.classes_[proba.argmax(axis=1)]
+
+
+# ------------------
+# 임계값을 원래 단위로 옮기기
+# sklearn 은 float32((x - mean) / scale) <= t 로 비교하므로
+# 이 조건을 만족하는 가장 큰 float64 x 를 찾아 x <= T 비교와 정확히 같게 함
+# (단순히 t * scale + mean 으로 바꾸면 float32 반올림 때문에 경계에서 어긋남)
+# ------------------
+_SIGN = np.int64(-0x8000000000000000)
+
+
+def _to_key(x):
+    # float64 → 크기 순서가 같은 정수
+    i = x.view(np.int64)
+    return np.where(i < 0, _SIGN - i, i)
+
+
+def _from_key(k):
+    return np.where(k < 0, _SIGN - k, k).view(np.float64)
+
+
+def _raw_thresholds(t, mean, scale):
+    def goes_left(x):
+        return ((x - mean) / scale).astype(np.float32) <= t
+
+    guess = t * scale + mean
+    margin = (np.abs(t) + 1) * scale * 1e-3
+    lo, hi = _to_key(guess - margin), _to_key(guess + margin)
+
+    # goes_left(lo) 는 참, goes_left(hi) 는 거짓인 구간을 반씩 줄임
+    while np.any(hi - lo > 1):
+        mid = lo + (hi - lo) // 2
+        left = goes_left(_from_key(mid))
+        lo = np.where(left, mid, lo)
+        hi = np.where(left, hi, mid)
+    return _from_key(lo)
+
+
+def compile_pipeline(pipe):
+    scaler = pipe.named_steps["scaler"]
+    forest = pipe.named_steps["clf"]
+    mean = scaler.mean_.astype(np.float64)
+    scale = scaler.scale_.astype(np.float64)
+
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    depth = 0
+
+    for est in forest.estimators_:
+        tree = est.tree_
+        n = tree.node_count
+        ids = np.arange(n)
+        is_leaf = tree.children_left == -1
+
+        # ------------------
+        # 리프 노드: 자기 자신으로 이동하도록 설정
+        # ------------------
+        left = np.where(is_leaf, ids, tree.children_left) + offset
+        right = np.where(is_leaf, ids, tree.children_right) + offset
+
+        # 노드별 클래스 확률 (정규화)
+        value = tree.value[:, 0, :]
+        value = value / value.sum(axis=1, keepdims=True)
+
+        # 스케일된 공간의 임계값 → 원래 단위 (scale > 0 이라 부등호 방향은 그대로)
+        feature = np.where(is_leaf, 0, tree.feature)
+        threshold = _raw_thresholds(tree.threshold, mean[feature], scale[feature])
+
+        features.append(feature)
+        thresholds.append(threshold)
+        lefts.append(left)
+        rights.append(right)
+        values.append(value)
+        roots.append(offset)
+
+        offset += n
+        depth = max(depth, tree.max_depth)
+
+    return CompiledForest(
+        feature=np.ascontiguousarray(np.concatenate(features), dtype=np.intp),
+        threshold=np.ascontiguousarray(np.concatenate(thresholds), dtype=np.float64),
+        left=np.ascontiguousarray(np.concatenate(lefts), dtype=np.intp),
+        right=np.ascontiguousarray(np.concatenate(rights), dtype=np.intp),
+        value=np.ascontiguousarray(np.concatenate(values), dtype=np.float64),
+        roots=np.asarray(roots, dtype=np.intp),
+        depth=depth,
+        classes=forest.classes_
+    )
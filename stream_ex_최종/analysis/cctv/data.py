@@ -1,10 +1,12 @@
 # analysis/population_car/data.py
 
 import pandas as pd
-import streamlit as st
 
-@st.cache_data
+from analysis.common.cache import cached_loader
+from analysis.common.schema import apply_schema
+
+@cached_loader
 def load_data_cctv():
     df = pd.read_csv('data/cctv_accident.csv')
 
-    return df
+    return apply_schema(df, "cctv_accident")
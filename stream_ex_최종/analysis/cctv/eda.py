@@ -1,9 +1,15 @@
 # analysis/accident/eda.py
-import matplotlib.pyplot as plt
+import math
+
 import seaborn as sns
 
+from analysis.common.cache import cached_result
+from analysis.common.plotting import new_figure
+
+
+@cached_result
 def plot_cctv_vs_death(df):
-    fig, ax = plt.subplots(figsize=(7,5))
+    fig, ax = new_figure(figsize=(7,5))
     ax.scatter(df['CCTV설치대수'], df['사고당사망률'])
     ax.set_xlabel('CCTV 설치 대수')
     ax.set_ylabel('사고당 사망률')
@@ -12,14 +18,24 @@ def plot_cctv_vs_death(df):
     return fig
 
 
+@cached_result
 def plot_histograms(df, num_cols):
-    fig = df[num_cols].hist(bins=20, figsize=(12,8))
-    plt.tight_layout()
-    return plt.gcf()
+    ncols = math.ceil(math.sqrt(len(num_cols)))
+    nrows = math.ceil(len(num_cols) / ncols)
+
+    fig, axes = new_figure(figsize=(12,8), nrows=nrows, ncols=ncols, squeeze=False)
+    axes = axes.ravel()
+    for ax in axes[len(num_cols):]:
+        fig.delaxes(ax)
+
+    df[num_cols].hist(bins=20, ax=axes[:len(num_cols)])
+    fig.tight_layout()
+    return fig
 
 
+@cached_result
 def plot_corr_heatmap(df, num_cols):
-    fig, ax = plt.subplots(figsize=(8,6))
+    fig, ax = new_figure(figsize=(8,6))
     sns.heatmap(
         df[num_cols].corr(),
         annot=True, fmt=".2f", cmap="coolwarm", ax=ax
@@ -28,8 +44,9 @@ def plot_corr_heatmap(df, num_cols):
     return fig
 
 
+@cached_result
 def plot_severity_box(df):
-    fig, ax = plt.subplots(figsize=(6,4))
+    fig, ax = new_figure(figsize=(6,4))
     sns.boxplot(
         x='심각정도',
         y='사고당사망률',
@@ -1,4 +1,5 @@
 # analysis/accident/model.py
+import numpy as np
 import pandas as pd
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 from sklearn.model_selection import train_test_split
@@ -6,12 +7,24 @@ from sklearn.pipeline import Pipeline
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import classification_report, confusion_matrix
 
+from analysis.cctv.compiled import CompiledForest, compile_pipeline
+from analysis.common.cache import cached_result
+from analysis.common.metrics import track_fit
+from analysis.common.singleflight import single_flight
+
 FEATURES = [
     '발생건수(건)', '부상자수(명)',
     '사고당사망률', '사고당부상률', 'CCTV설치대수'
 ]
 
-def train_model(df):
+N_ESTIMATORS = 200
+
+# 점진 렌더링 때 먼저 보여 주는 근사 모델의 트리 수
+APPROX_TREES = 20
+
+@single_flight
+@track_fit("train_model")
+def train_model(df, n_estimators=N_ESTIMATORS):
     X = df[FEATURES]
     y = df['심각정도']
 
@@ -28,7 +41,7 @@ def train_model(df):
     pipe = Pipeline([
         ("scaler", StandardScaler()),
         ("clf", RandomForestClassifier(
-            n_estimators=200,
+            n_estimators=n_estimators,
             random_state=42
         ))
     ])
@@ -38,6 +51,12 @@ def train_model(df):
     return pipe, le, X_test, y_test
 
 
+@cached_result
+def build_severity_model(df, n_estimators=N_ESTIMATORS):
+    pipe, le, X_test, y_test = train_model(df, n_estimators)
+    return pipe, le, X_test, y_test, compile_pipeline(pipe)
+
+
 def evaluate_model(pipe, X_test, y_test, le):
     y_pred = pipe.predict(X_test)
 
@@ -53,6 +72,12 @@ def evaluate_model(pipe, X_test, y_test, le):
 
 
 def predict_severity(pipe, le, sample_dict):
+    # 컴파일된 모델이면 DataFrame 없이 바로 예측
+    if isinstance(pipe, CompiledForest):
+        x = np.array([sample_dict[f] for f in FEATURES], dtype=np.float64)
+        code = pipe.predict(x)[0]
+        return le.classes_[code]
+
     df = pd.DataFrame([sample_dict])
     code = pipe.predict(df)[0]
     return le.inverse_transform([code])[0]
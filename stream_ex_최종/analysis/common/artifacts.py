@@ -0,0 +1,103 @@
+# analysis/common/artifacts.py
+
+import glob
+import hashlib
+import json
+import os
+import pickle
+import time
+from functools import lru_cache
+
+from matplotlib.figure import Figure
+
+from analysis.common.plotting import FIGURE_DPI, render_png
+
+ARTIFACT_ROOT = os.environ.get("ARTIFACT_DIR", "artifacts")
+LATEST_FILE = "LATEST"
+
+
+def serve_only():
+    """SERVE_ONLY=1 이면 app.py 는 계산 없이 미리 만든 아티팩트만 읽는다."""
+    return os.environ.get("SERVE_ONLY", "0") == "1"
+
+
+def artifact_name(func, key=None):
+    name = func.__name__
+    if key is not None:
+        name += "__" + hashlib.md5(str(key).encode("utf-8")).hexdigest()[:10]
+    return name
+
+
+# ------------------
+# Figure → PNG 로 인코딩 (튜플 / 리스트 안쪽까지)
+# ------------------
+def encode(value, dpi=FIGURE_DPI):
+    if isinstance(value, Figure):
+        return render_png(value, dpi)
+    if isinstance(value, tuple):
+        return tuple(encode(v, dpi) for v in value)
+    if isinstance(value, list):
+        return [encode(v, dpi) for v in value]
+    return value
+
+
+# ------------------
+# 버전 디렉터리
+# ------------------
+def data_fingerprint(data_dir="data"):
+    h = hashlib.sha1()
+    for path in sorted(glob.glob(os.path.join(data_dir, "*.csv"))):
+        h.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:12]
+
+
+def new_version_dir(root=ARTIFACT_ROOT):
+    version = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(root, version)
+    os.makedirs(path, exist_ok=True)
+    return version, path
+
+
+def publish(version, root=ARTIFACT_ROOT):
+    """모든 아티팩트를 쓴 뒤에 LATEST 를 바꿔서 반쯤 만든 버전이 읽히지 않게 함."""
+    tmp = os.path.join(root, LATEST_FILE + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(version)
+    os.replace(tmp, os.path.join(root, LATEST_FILE))
+
+
+def current_version(root=ARTIFACT_ROOT):
+    pinned = os.environ.get("ARTIFACT_VERSION")
+    if pinned:
+        return pinned
+
+    with open(os.path.join(root, LATEST_FILE), encoding="utf-8") as f:
+        return f.read().strip()
+
+
+def save(path, name, value):
+    with open(os.path.join(path, name + ".pkl"), "wb") as f:
+        pickle.dump(encode(value), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def write_manifest(path, manifest):
+    with open(os.path.join(path, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, default=str)
+
+
+@lru_cache(maxsize=None)
+def load(name, version=None, root=ARTIFACT_ROOT):
+    version = version or current_version(root)
+    with open(os.path.join(root, version, name + ".pkl"), "rb") as f:
+        return pickle.load(f)
+
+
+# ------------------
+# app.py 용: serve-only 면 아티팩트, 아니면 직접 계산
+# ------------------
+def artifact(func, *args, key=None, **kwargs):
+    if serve_only():
+        return load(artifact_name(func, key), current_version())
+    return func(*args, **kwargs)
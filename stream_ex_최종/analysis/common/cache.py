@@ -0,0 +1,97 @@
+# analysis/common/cache.py
+
+import functools
+import os
+import threading
+import time
+
+import streamlit as st
+
+from analysis.common.deps import register_node
+from analysis.common.metrics import LOADER_REQUESTS, LOADER_SECONDS
+from analysis.common.singleflight import single_flight
+from analysis.common.tasks import compute
+
+# 함수마다 보관하는 결과 수 (인자 조합 기준, 오래 안 쓴 것부터 버림)
+# 자치구 × 기간 같은 선택값마다 항목이 생기므로 오래 도는 서버에서 메모리가 계속 늘지 않도록
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", "64"))
+
+_local = threading.local()
+
+
+def cached_loader(func=None, **cache_kwargs):
+    """st.cache_data 와 같지만 호출 수 / hit / miss / 지연 시간을 기록한다.
+
+    @cached_loader
+    def load_x(): ...
+
+    @cached_loader(ttl=600)
+    def load_y(): ...
+
+    max_entries 기본값은 CACHE_MAX_ENTRIES (None 이면 제한 없음).
+    """
+    if func is None:
+        return lambda f: cached_loader(f, **cache_kwargs)
+
+    cache_kwargs.setdefault("max_entries", CACHE_MAX_ENTRIES)
+
+    name = func.__name__
+
+    # 실제로 DB 를 조회하는 함수 (single-flight leader 만 실행)
+    # 안에서 다른 로더를 불러도 결과 표시가 덮이지 않도록 끝난 뒤에 기록
+    @single_flight
+    @functools.wraps(func)
+    def load(*args, **kwargs):
+        value = func(*args, **kwargs)
+        _local.result = "miss"
+        return value
+
+    # 캐시 miss 일 때만 실행되는 안쪽 함수
+    # 동시에 miss 난 호출은 leader 의 결과를 기다려서 받음 → "shared"
+    @functools.wraps(func)
+    def compute(*args, **kwargs):
+        _local.result = "shared"
+        return load(*args, **kwargs)
+
+    cached = st.cache_data(**cache_kwargs)(compute)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _local.result = "hit"
+        start = time.perf_counter()
+        result = cached(*args, **kwargs)
+
+        LOADER_SECONDS.observe(time.perf_counter() - start, loader=name)
+        LOADER_REQUESTS.inc(loader=name, result=_local.result)
+        return result
+
+    wrapper.clear = cached.clear
+    register_node(name, cached.clear)
+    return wrapper
+
+
+def cached_result(func=None, **cache_kwargs):
+    """모델 / 그림 / 요약표 캐시 (st.cache_resource).
+
+    Figure 는 PNG 로 바꿔서 보관하므로 세션끼리 같은 객체를 그리지 않고,
+    hit 일 때는 렌더링 비용도 없다. 의존하는 로더가 바뀌면 deps 가 비운다.
+    max_entries 기본값은 CACHE_MAX_ENTRIES — @cached_result(max_entries=..., ttl=...) 로 변경.
+    """
+    if func is None:
+        return lambda f: cached_result(f, **cache_kwargs)
+
+    cache_kwargs.setdefault("max_entries", CACHE_MAX_ENTRIES)
+
+    @functools.wraps(func)
+    def miss(*args, **kwargs):
+        return compute(func, args, kwargs)
+
+    cached = st.cache_resource(**cache_kwargs)(miss)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return cached(*args, **kwargs)
+
+    wrapper.clear = cached.clear
+    register_node(func.__name__, cached.clear)
+    return wrapper
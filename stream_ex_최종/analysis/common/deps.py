@@ -0,0 +1,190 @@
+# analysis/common/deps.py
+
+import os
+import threading
+import time
+from collections import deque
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from analysis.common.db import table_versions
+from analysis.region.store import MANIFEST_FILE, PARTITION_ROOT
+
+DATA_DIR = "data"
+WATCH_INTERVAL = float(os.environ.get("WATCH_INTERVAL", "5"))
+
+# ------------------
+# 의존 그래프: 노드 → 바로 위 노드 목록
+#   CSV 경로 → 테이블 / 뷰 → 로더 → 모델 / 그림
+# ------------------
+GRAPH = {
+    # 테이블 ← CSV (init_db.py)
+    "district": ["data/district.csv"],
+    "population": ["data/population.csv"],
+    "car": ["data/car.csv"],
+    "cctv": ["data/cctv.csv"],
+    "car_month": ["data/car_month.csv"],
+    "public_transit": ["data/public_transit.csv"],
+    "parking_car": ["data/parking_car.csv"],
+    "vehicle": ["data/vehicle.csv"],
+    "traffic": ["data/traffic.csv"],
+    "vehicle_fact": ["data/vehicle.csv"],
+    "ml_base_view": ["district", "population", "car"],
+    "feature_monthly": ["car", "population", "car_month", "vehicle_fact"],
+    "feature_yearly": ["car", "population", "car_month", "vehicle_fact"],
+    "anomaly_event": ["car", "population", "car_month"],
+
+    # 로더
+    "load_data_car_month": ["car_month"],
+    "load_data_cctv": ["data/cctv_accident.csv"],
+    "load_data_traffic": ["vehicle", "traffic"],
+    "load_vehicle_fact": ["vehicle_fact"],
+    "load_data_transit": ["public_transit"],
+    "load_data": ["ml_base_view"],
+    "load_data_parking": ["parking_car"],
+    "load_anomaly_events": ["anomaly_event"],
+    "load_regions": ["partitions"],
+    "load_region_counts": ["partitions"],
+    "load_features": ["feature_monthly", "feature_yearly"],
+    "load_feature_months": ["feature_monthly"],
+    "load_district_names": ["district"],
+
+    # 시계열
+    "plot_monthly": ["load_data_car_month", "load_features"],
+    "plot_diff_1": ["load_features"],
+    "fit_arima": ["load_data_car_month", "load_features"],
+
+    # CCTV
+    "plot_cctv_vs_death": ["load_data_cctv"],
+    "plot_histograms": ["load_data_cctv"],
+    "plot_severity_box": ["load_data_cctv"],
+    "plot_corr_heatmap": ["load_data_cctv"],
+    "build_severity_model": ["load_data_cctv"],
+
+    # 교통량
+    "make_monthly_summary": ["load_data_traffic"],
+    "plot_vehicle_trend": ["make_monthly_summary"],
+    "make_yearly_summary": ["load_features"],
+    "plot_traffic_growth_bar": ["load_data_traffic"],
+    "analyze_correlation": ["load_features", "load_data_traffic"],
+    "build_cube": ["load_vehicle_fact"],
+
+    # 대중교통
+    "run_visual_transit": ["load_data_transit"],
+    "run_multireg": ["load_data_transit"],
+
+    # 인구
+    "run_clustering": ["load_data"],
+    "run_regression": ["load_data"],
+    "run_logistic": ["load_data"],
+
+    # 주차면
+    "plot_correlation": ["load_data_parking"],
+    "run_parking_regression": ["load_data_parking"],
+    "run_ridge": ["load_data_parking"],
+    "run_parking_poly_regression": ["load_data_parking"],
+}
+
+# 노드 이름 → 캐시 비우는 함수 (cached_loader / cached_result 가 등록)
+_clearers = {}
+
+# 최근 무효화 기록 (사이드바 표시용)
+INVALIDATIONS = deque(maxlen=50)
+
+# 지금까지 무효화 횟수 (캐시 워밍업을 다시 돌릴지 판단)
+_generation = 0
+
+
+def register_node(name, clear):
+    _clearers[name] = clear
+
+
+def dependents(sources):
+    """sources 가 바뀌었을 때 영향을 받는 모든 하위 노드."""
+    children = {}
+    for node, parents in GRAPH.items():
+        for parent in parents:
+            children.setdefault(parent, []).append(node)
+
+    seen = set()
+    stack = list(sources)
+    while stack:
+        for child in children.get(stack.pop(), []):
+            if child not in seen:
+                seen.add(child)
+                stack.append(child)
+    return seen
+
+
+def generation():
+    return _generation
+
+
+def invalidate(sources):
+    global _generation
+
+    cleared = sorted(n for n in dependents(sources) if n in _clearers)
+    for name in cleared:
+        _clearers[name]()
+    _generation += 1
+
+    INVALIDATIONS.append({
+        "ts": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "sources": sorted(sources),
+        "cleared": cleared,
+    })
+    return cleared
+
+
+# ------------------
+# 변경 감시: CSV (mtime, 크기) + 테이블 갱신 마커 + 파티션 manifest
+# ------------------
+def snapshot(data_dir=DATA_DIR):
+    state = {}
+    for name in os.listdir(data_dir):
+        if name.endswith(".csv"):
+            st = os.stat(os.path.join(data_dir, name))
+            state[f"{DATA_DIR}/{name}"] = (st.st_mtime_ns, st.st_size)
+
+    # partition.py 는 다 쓴 뒤 디렉터리를 교체하므로 manifest 만 보면 됨
+    manifest_path = os.path.join(PARTITION_ROOT, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        state["partitions"] = os.stat(manifest_path).st_mtime_ns
+
+    try:
+        state.update(table_versions())
+    except SQLAlchemyError:
+        # DB 에 못 붙으면 CSV 만 감시
+        pass
+
+    return state
+
+
+_watch_lock = threading.Lock()
+_last_state = None
+_last_check = 0.0
+
+
+def check_for_changes(data_dir=DATA_DIR):
+    """바뀐 소스를 찾아 하위 캐시만 비우고, 비운 노드 이름을 돌려준다.
+
+    WATCH_INTERVAL 초에 한 번만 실제로 확인하고, 첫 호출은 기준 상태만 기록.
+    """
+    global _last_state, _last_check
+
+    with _watch_lock:
+        now = time.monotonic()
+        if _last_state is not None and now - _last_check < WATCH_INTERVAL:
+            return []
+        _last_check = now
+
+        state = snapshot(data_dir)
+        previous, _last_state = _last_state, state
+        if previous is None:
+            return []
+
+        changed = {k for k in state.keys() | previous.keys() if state.get(k) != previous.get(k)}
+        if not changed:
+            return []
+
+        return invalidate(changed)
@@ -0,0 +1,117 @@
+# analysis/common/downsample.py
+
+import math
+
+import numpy as np
+import pandas as pd
+from matplotlib.dates import AutoDateLocator
+from matplotlib.ticker import FixedLocator
+
+PX_PER_POINT = 3      # 화면상 점 하나당 가로 픽셀 수
+MARKER_LIMIT = 60     # 이 개수 이하일 때만 마커 표시
+MAX_TICKS = 12
+
+
+def _as_float(x):
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+
+# ------------------
+# LTTB (Largest-Triangle-Three-Buckets)
+# 구간마다 직전 선택점 / 다음 구간 평균과 만드는 삼각형이 가장 큰 점을 고름
+# ------------------
+def lttb(x, y, n_out):
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = _as_float(x)
+    y = np.asarray(y, dtype=np.float64)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0], idx[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+        cx = x[end:nxt_end].mean()
+        cy = y[end:nxt_end].mean()
+
+        area = np.abs(
+            (x[a] - cx) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (cy - y[a])
+        )
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+
+    return idx
+
+
+# ------------------
+# Min-Max 버킷: 구간별 최솟값 / 최댓값을 모두 유지
+# ------------------
+def minmax(y, n_out):
+    n = len(y)
+    n_buckets = max(n_out // 2, 1)
+    if n_out >= n:
+        return np.arange(n)
+
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(0, n, n_buckets + 1).astype(int)
+
+    idx = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end <= start:
+            continue
+        seg = y[start:end]
+        lo, hi = start + int(np.nanargmin(seg)), start + int(np.nanargmax(seg))
+        idx.extend(sorted({lo, hi}))
+
+    return np.asarray(idx, dtype=np.intp)
+
+
+def max_points(fig, px_per_point=PX_PER_POINT):
+    width_px = fig.get_figwidth() * fig.dpi
+    return max(int(width_px / px_per_point), 3)
+
+
+def downsample(x, y, n_out, method="lttb"):
+    """(x, y) 를 n_out 개 이하의 점으로 줄인다. 양 끝점과 극값은 유지."""
+    y_arr = np.asarray(y, dtype=np.float64)
+    if method == "minmax":
+        idx = minmax(y_arr, n_out)
+    else:
+        idx = lttb(x, y_arr, n_out)
+
+    if isinstance(x, (pd.Index, pd.Series)):
+        x_out = x[idx] if isinstance(x, pd.Index) else x.iloc[idx]
+    else:
+        x_out = np.asarray(x)[idx]
+
+    return x_out, y_arr[idx]
+
+
+def marker_for(n_points, marker="o"):
+    return marker if n_points <= MARKER_LIMIT else None
+
+
+# ------------------
+# x 축 눈금 솎아내기
+# ------------------
+def thin_ticks(ax, labels=None, max_ticks=MAX_TICKS, rotation=45):
+    """labels 가 있으면 0..n-1 위치의 범주형 눈금을, 없으면 날짜 눈금을 max_ticks 개 이하로."""
+    if labels is None:
+        ax.xaxis.set_major_locator(AutoDateLocator(maxticks=max_ticks))
+    else:
+        labels = list(labels)
+        step = max(math.ceil(len(labels) / max_ticks), 1)
+        pos = list(range(0, len(labels), step))
+        ax.xaxis.set_major_locator(FixedLocator(pos))
+        ax.set_xticklabels([labels[i] for i in pos])
+
+    ax.tick_params(axis="x", rotation=rotation)
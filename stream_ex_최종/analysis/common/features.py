@@ -0,0 +1,213 @@
+# analysis/common/features.py
+
+import pandas as pd
+from sqlalchemy import DateTime, Float, Integer, String, bindparam, text
+
+from analysis.common.cache import cached_loader
+from analysis.common.db import read_sql, touch_table
+from analysis.common.schema import VEHICLE_KINDS
+
+MONTHLY_TABLE = "feature_monthly"
+YEARLY_TABLE = "feature_yearly"
+
+# 서울 전체 (자치구 합계) 의 district_id — district.csv 와 같음
+TOTAL_DISTRICT = 0
+
+# vehicle_fact 에서 만드는 차종별 / 전체 등록 시계열 이름
+VEHICLE_SERIES = [f"{kind}합계" for kind in VEHICLE_KINDS] + ["등록합계"]
+
+ROLLING_WINDOWS = [3, 12]
+
+
+# ------------------
+# 원천 시계열 → (series, district_id, datetime, value)
+# ------------------
+def _read_district_series(engine, table, column):
+    df = pd.read_sql(f"SELECT district_id, datetime, {column} AS value FROM {table}", engine)
+    df["series"] = column
+    return df
+
+
+def _read_car_month(engine):
+    df = pd.read_sql("SELECT datetime, car_count_month AS value FROM car_month", engine)
+    df["series"] = "car_count_month"
+    df["district_id"] = TOTAL_DISTRICT
+    return df
+
+
+def _read_vehicle(engine):
+    fact = pd.read_sql("SELECT * FROM vehicle_fact", engine)
+    fact["datetime"] = pd.to_datetime(fact["년월"].astype(str), format="%Y%m")
+
+    by_kind = fact.groupby(["datetime", "district_id", "차종"], as_index=False)["count"].sum()
+    by_kind["series"] = by_kind["차종"] + "합계"
+
+    total = fact.groupby(["datetime", "district_id"], as_index=False)["count"].sum()
+    total["series"] = "등록합계"
+
+    # 자치구 합계를 서울 전체 (district_id 0) 로 추가
+    df = pd.concat([by_kind, total], ignore_index=True)
+    seoul = df.groupby(["datetime", "series"], as_index=False)["count"].sum()
+    seoul["district_id"] = TOTAL_DISTRICT
+
+    return pd.concat([df, seoul], ignore_index=True).rename(columns={"count": "value"})
+
+
+def read_sources(engine):
+    frames = [
+        _read_district_series(engine, "car", "car_count"),
+        _read_district_series(engine, "population", "population"),
+        _read_car_month(engine),
+        _read_vehicle(engine),
+    ]
+    df = pd.concat(
+        [f[["series", "district_id", "datetime", "value"]] for f in frames],
+        ignore_index=True
+    )
+    df["datetime"] = pd.to_datetime(df["datetime"])
+    df["value"] = df["value"].astype(float)
+    return df.dropna(subset=["value"])
+
+
+# ------------------
+# 월별 파생 변수
+# (series, district_id) 를 열로 펼쳐 빈 달까지 채운 뒤 한 번에 계산
+# → 중간에 빠진 달이 있어도 shift 가 정확히 1 / 12 개월
+# ------------------
+def monthly_features(long):
+    wide = long.pivot_table(
+        index="datetime", columns=["series", "district_id"], values="value"
+    ).asfreq("MS")
+
+    lag_1 = wide.shift(1)
+    lag_12 = wide.shift(12)
+
+    features = {
+        "value": wide,
+        "lag_1": lag_1,
+        "lag_12": lag_12,
+        "diff_1": wide - lag_1,
+        "mom_pct": (wide / lag_1 - 1) * 100,
+        "yoy_pct": (wide / lag_12 - 1) * 100,
+    }
+    for window in ROLLING_WINDOWS:
+        features[f"roll_{window}"] = wide.rolling(window).mean()
+
+    # 모든 frame 이 같은 모양 → melt 순서가 같으므로 값만 이어 붙임
+    df = wide.melt(ignore_index=False).reset_index()
+    for name, frame in features.items():
+        df[name] = frame.melt(ignore_index=False)["value"].to_numpy()
+
+    # 채워 넣은 빈 달은 다시 제거
+    df = df.dropna(subset=["value"])
+    return df[["series", "district_id", "datetime", *features]].sort_values(
+        ["series", "district_id", "datetime"]
+    ).reset_index(drop=True)
+
+
+# ------------------
+# 연도별 집계 (평균 / 연말 값 / 개월 수 / 전년 대비 평균 증감률)
+# ------------------
+def yearly_features(long):
+    df = long.assign(year=long["datetime"].dt.year).sort_values("datetime")
+
+    yearly = (
+        df.groupby(["series", "district_id", "year"], as_index=False)
+        .agg(mean=("value", "mean"), last=("value", "last"), n_months=("value", "size"))
+    )
+    yearly["yoy_pct"] = (
+        yearly.groupby(["series", "district_id"])["mean"].pct_change() * 100
+    )
+    return yearly
+
+
+# ------------------
+# 적재 시 실행 (init_db.py / localdb) — 원천 테이블이 모두 생성된 뒤
+# ------------------
+TABLE_DTYPES = {
+    MONTHLY_TABLE: {"series": String(32), "district_id": Integer(), "datetime": DateTime()},
+    YEARLY_TABLE: {"series": String(32), "district_id": Integer(), "year": Integer(),
+                   "mean": Float(), "last": Float()},
+}
+
+TABLE_INDEXES = [
+    f"CREATE UNIQUE INDEX ux_{MONTHLY_TABLE} ON {MONTHLY_TABLE} (series, district_id, datetime)",
+    f"CREATE UNIQUE INDEX ux_{YEARLY_TABLE} ON {YEARLY_TABLE} (series, district_id, year)",
+]
+
+
+def build_feature_store(engine):
+    long = read_sources(engine)
+    tables = {
+        MONTHLY_TABLE: monthly_features(long),
+        YEARLY_TABLE: yearly_features(long),
+    }
+
+    for name, df in tables.items():
+        df.to_sql(name, engine, if_exists="replace", index=False,
+                  dtype=TABLE_DTYPES[name])
+
+    with engine.begin() as conn:
+        for ddl in TABLE_INDEXES:
+            conn.execute(text(ddl))
+
+    for name in tables:
+        touch_table(engine, name)
+
+    return {name: len(df) for name, df in tables.items()}
+
+
+# ------------------
+# 로더: 모든 페이지가 파생 변수를 여기서만 읽음
+#   load_features(["car_count_month"])
+#   load_features(VEHICLE_SERIES, districts=[0], yearly=True)
+#   load_features(["car_count"], [1], start="2021-01-01", end="2023-12-01")
+# start / end 는 월 단위 (양 끝 포함), ux_feature_monthly 인덱스 범위 조회
+# ------------------
+def _month_range(start, end):
+    params = {}
+    if start is not None:
+        params["start"] = pd.Timestamp(start).to_pydatetime()
+    if end is not None:
+        # 저장된 datetime 문자열 형식과 상관없이 마지막 달을 포함하도록 반열린 구간
+        params["end"] = (pd.Timestamp(end) + pd.DateOffset(months=1)).to_pydatetime()
+    return params
+
+
+@cached_loader
+def load_features(series, districts=None, yearly=False, start=None, end=None):
+    table = YEARLY_TABLE if yearly else MONTHLY_TABLE
+    order = "year" if yearly else "datetime"
+
+    query = f"SELECT * FROM {table} WHERE series IN :series"
+    params = {"series": list(series)}
+    if districts is not None:
+        query += " AND district_id IN :districts"
+        params["districts"] = [int(d) for d in districts]
+
+    window = {} if yearly else _month_range(start, end)
+    if "start" in window:
+        query += " AND datetime >= :start"
+    if "end" in window:
+        query += " AND datetime < :end"
+    query += f" ORDER BY series, district_id, {order}"
+
+    stmt = text(query).bindparams(
+        *[bindparam(name, expanding=True) for name in params]
+    )
+    params.update(window)
+    return read_sql(stmt, loader="load_features", params=params, schema=table)
+
+
+@cached_loader
+def load_feature_months(series, district_id=TOTAL_DISTRICT):
+    """시계열 하나에 값이 있는 달 목록 (기간 선택 위젯용, 인덱스만 읽음)."""
+    df = read_sql(
+        text(
+            f"SELECT datetime FROM {MONTHLY_TABLE} "
+            "WHERE series = :series AND district_id = :district_id ORDER BY datetime"
+        ),
+        loader="load_feature_months",
+        params={"series": series, "district_id": int(district_id)},
+    )
+    return list(pd.to_datetime(df["datetime"]))
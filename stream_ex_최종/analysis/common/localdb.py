@@ -0,0 +1,62 @@
+# analysis/common/localdb.py
+
+import os
+
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from analysis.common.db import touch_table
+from analysis.common.features import build_feature_store
+from analysis.population_car.anomaly import update_anomalies
+from analysis.traffic_car.fact import write_fact_table
+
+# init_db.py 와 같은 테이블 구성
+TABLES = [
+    "district", "population", "car", "cctv", "car_month",
+    "public_transit", "parking_car", "vehicle", "traffic",
+]
+
+ML_BASE_VIEW = """
+    CREATE VIEW ml_base_view AS
+    SELECT
+        d.district,
+        p.district_id,
+        p.datetime,
+        p.population,
+        p.population_diff,
+        c.car_count,
+        c.car_diff
+    FROM population p
+    JOIN car c
+      ON p.district_id = c.district_id
+     AND p.datetime = c.datetime
+    JOIN district d
+      ON p.district_id = d.district_id
+"""
+
+
+# ------------------
+# MySQL 대신 쓰는 로컬 SQLite DB (부하 테스트 / 오프라인 실행용)
+# ------------------
+def build_sqlite(path, data_dir="data"):
+    if os.path.exists(path):
+        os.remove(path)
+
+    url = f"sqlite:///{os.path.abspath(path)}"
+    engine = create_engine(url)
+
+    for table in TABLES:
+        df = pd.read_csv(os.path.join(data_dir, f"{table}.csv"))
+        df.to_sql(table, engine, if_exists="replace", index=False)
+        touch_table(engine, table)
+
+    write_fact_table(engine, os.path.join(data_dir, "vehicle.csv"))
+    build_feature_store(engine)
+
+    with engine.begin() as conn:
+        conn.execute(text(ML_BASE_VIEW))
+
+    update_anomalies(engine)
+    engine.dispose()
+
+    return url
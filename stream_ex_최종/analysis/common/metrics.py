@@ -0,0 +1,254 @@
+# analysis/common/metrics.py
+
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METRICS_PORT = int(os.environ.get("METRICS_PORT", "9108"))
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+def _label_str(labels):
+    if not labels:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in labels
+    )
+    return "{" + body + "}"
+
+
+# ------------------
+# Counter / Gauge / Histogram (라벨별 값, 스레드 안전)
+# ------------------
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(tuple(sorted(labels.items())), 0)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, key, v) for key, v in self._values.items()]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def __init__(self, name, help_text, func=None):
+        super().__init__(name, help_text)
+        self._func = func
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[tuple(sorted(labels.items()))] = value
+
+    def samples(self):
+        if self._func is not None:
+            self.set(self._func())
+        return super().samples()
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(buckets)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            counts, total, n = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            counts = [c + (value <= b) for c, b in zip(counts, self.buckets)]
+            self._values[key] = (counts, total + value, n + 1)
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels):
+        return self._values.get(tuple(sorted(labels.items())), (None, 0.0, 0))[2]
+
+    def samples(self):
+        out = []
+        with self._lock:
+            for key, (counts, total, n) in self._values.items():
+                for b, c in zip(self.buckets, counts):
+                    out.append((self.name + "_bucket", key + (("le", repr(float(b))),), c))
+                out.append((self.name + "_bucket", key + (("le", "+Inf"),), n))
+                out.append((self.name + "_sum", key, total))
+                out.append((self.name + "_count", key, n))
+        return out
+
+
+# ------------------
+# 레지스트리
+# ------------------
+REGISTRY = []
+
+
+def register(metric):
+    REGISTRY.append(metric)
+    return metric
+
+
+def render():
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            lines.append(f"{name}{_label_str(labels)} {value}")
+    return "\n".join(lines) + "\n"
+
+
+# ------------------
+# 프로세스 메모리 (RSS)
+# ------------------
+def process_rss_bytes():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# ------------------
+# 대시보드 지표
+# ------------------
+LOADER_REQUESTS = register(Counter(
+    "dashboard_loader_requests_total",
+    "Data loader calls by cache result (hit / miss / shared = waited for a concurrent miss)."
+))
+LOADER_SECONDS = register(Histogram(
+    "dashboard_loader_seconds",
+    "Data loader call latency including cache lookup."
+))
+MODEL_FITS = register(Counter(
+    "dashboard_model_fits_total",
+    "Number of times a model / analysis was actually (re)computed."
+))
+MODEL_FIT_SECONDS = register(Histogram(
+    "dashboard_model_fit_seconds",
+    "Model / analysis fit duration."
+))
+SINGLEFLIGHT_CALLS = register(Counter(
+    "dashboard_singleflight_calls_total",
+    "Single-flight calls by role (leader computed, follower shared the result)."
+))
+TASK_SECONDS = register(Histogram(
+    "dashboard_page_task_seconds",
+    "Duration of analysis calls run concurrently by the page task executor."
+))
+WARMUP_SECONDS = register(Histogram(
+    "dashboard_warmup_seconds",
+    "Duration of background cache warm-up calls made while on the Home page."
+))
+PROGRESSIVE_RESULTS = register(Counter(
+    "dashboard_progressive_results_total",
+    "Results shown by progressive rendering (exact / approx / stale)."
+))
+FIGURE_RENDER_SECONDS = register(Histogram(
+    "dashboard_figure_render_seconds",
+    "Time to encode a matplotlib figure for the browser."
+))
+PROCESS_RSS = register(Gauge(
+    "dashboard_process_resident_memory_bytes",
+    "Resident set size of the dashboard process.",
+    func=process_rss_bytes
+))
+
+
+def track_fit(name):
+    """모델 학습 / 무거운 분석 함수의 실행 횟수와 소요 시간 기록."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            MODEL_FITS.inc(model=name)
+            with MODEL_FIT_SECONDS.time(model=name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ------------------
+# /metrics HTTP 엔드포인트
+# ------------------
+class _MetricsHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.rstrip("/") not in ("", "/metrics"):
+            self.send_error(404)
+            return
+
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server = None
+_server_failed = False
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port=METRICS_PORT, host="127.0.0.1"):
+    """프로세스당 한 번만 백그라운드 스레드로 띄운다. 포트가 사용 중이면 None.
+
+    실패도 기억해서 rerun 마다 다시 bind 하지 않음 (경고는 한 번만).
+    """
+    global _server, _server_failed
+
+    with _server_lock:
+        if _server_failed:
+            return None
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError as e:
+                _server_failed = True
+                logging.getLogger("metrics").warning(
+                    "metrics 서버를 띄우지 못했습니다 (%s:%s): %s", host, port, e
+                )
+                return None
+
+            thread = threading.Thread(target=_server.serve_forever, daemon=True)
+            thread.start()
+
+    return _server
@@ -0,0 +1,173 @@
+# analysis/common/panel.py
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+import numpy as np
+import pandas as pd
+
+# 패널 배열을 .npy 로 저장하는 곳 — 같은 데이터 버전이면 프로세스끼리 같은 파일을 memmap
+# 빈 값이면 디스크에 쓰지 않고 프로세스 메모리에만 둠
+PANEL_DIR = os.environ.get("PANEL_DIR", "panels")
+
+VALUES_FILE = "values.npy"
+META_FILE = "meta.json"
+
+
+# ------------------
+# 자치구 × 월 × 변수 3차원 배열
+# 빈 칸 (그 달에 없는 자치구) 은 NaN
+# 모든 접근 함수는 values 의 view 를 돌려줌 (복사 없음, 읽기 전용)
+# ------------------
+class Panel:
+
+    def __init__(self, values, districts, months, features, version=None):
+        self.values = values
+        self.districts = pd.Index(districts)
+        self.months = pd.DatetimeIndex(months)
+        self.features = list(features)
+        self.version = version
+
+    def __repr__(self):
+        d, t, f = self.values.shape
+        return f"Panel({d} districts × {t} months × {f} features, version={self.version})"
+
+    def _feature(self, name):
+        return self.features.index(name)
+
+    def feature(self, name):
+        """(자치구, 월) 2차원 view."""
+        return self.values[:, :, self._feature(name)]
+
+    def series(self, district, feature):
+        """자치구 하나의 월별 값 (1차원 view)."""
+        return self.values[self.districts.get_loc(district), :, self._feature(feature)]
+
+    def cross_section(self, month, feature):
+        """한 달의 자치구별 값 (1차원 view)."""
+        return self.values[:, self.months.get_loc(pd.Timestamp(month)), self._feature(feature)]
+
+    def growth(self, feature, periods=1, pct=True):
+        """periods 개월 전 대비 증감 (률) — (자치구, 월), 앞쪽 periods 개월은 NaN."""
+        x = self.feature(feature)
+        out = np.full(x.shape, np.nan)
+        if pct:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                np.divide(x[:, periods:], x[:, :-periods], out=out[:, periods:])
+            out[:, periods:] = (out[:, periods:] - 1) * 100
+        else:
+            np.subtract(x[:, periods:], x[:, :-periods], out=out[:, periods:])
+        return out
+
+    def mean(self, features):
+        """자치구별 기간 평균 (자치구, 변수) — 빈 달은 빼고 평균."""
+        idx = [self._feature(f) for f in features]
+        return np.nanmean(self.values, axis=1)[:, idx]
+
+    def observed(self, district, features):
+        """자치구 하나에서 features 가 모두 있는 달만 고르는 boolean mask."""
+        i = self.districts.get_loc(district)
+        idx = [self._feature(f) for f in features]
+        return ~np.isnan(self.values[i][:, idx]).any(axis=1)
+
+    def frame(self, district, features):
+        """자치구 하나의 월별 DataFrame (features 가 모두 있는 달만) — sklearn 입력용."""
+        month = self.observed(district, features)
+        return pd.DataFrame(
+            {f: self.series(district, f)[month] for f in features},
+            index=self.months[month],
+        )
+
+
+# ------------------
+# long DataFrame → Panel
+# ------------------
+def build_panel(df, features, district_col="district", time_col="datetime", version=None):
+    d_codes, districts = pd.factorize(df[district_col], sort=True)
+    t_codes, months = pd.factorize(df[time_col], sort=True)
+
+    values = np.full((len(districts), len(months), len(features)), np.nan)
+    values[d_codes, t_codes, :] = df[features].to_numpy(dtype="float64")
+    values.flags.writeable = False
+
+    return Panel(values, [str(d) for d in districts], months, features, version)
+
+
+def data_version(df, columns):
+    """데이터 내용 해시 — 값이 같으면 프로세스 / 재시작과 상관없이 같은 버전."""
+    hashed = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+    h = hashlib.sha1(hashed.tobytes())
+    h.update(json.dumps(list(columns)).encode())
+    return h.hexdigest()[:16]
+
+
+# ------------------
+# 디스크 저장 / memmap 열기
+# 새 디렉터리에 다 쓴 뒤 이름을 바꿔서 다른 프로세스가 반쯤 쓴 파일을 열지 않음
+# ------------------
+def save_panel(panel, path):
+    tmp = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    os.makedirs(tmp, exist_ok=True)
+
+    np.save(os.path.join(tmp, VALUES_FILE), panel.values)
+    with open(os.path.join(tmp, META_FILE), "w", encoding="utf-8") as f:
+        json.dump({
+            "districts": list(panel.districts),
+            "months": [m.isoformat() for m in panel.months],
+            "features": panel.features,
+            "version": panel.version,
+        }, f, ensure_ascii=False)
+
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        # 다른 프로세스가 같은 버전을 먼저 저장함
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def open_panel(path):
+    with open(os.path.join(path, META_FILE), encoding="utf-8") as f:
+        meta = json.load(f)
+
+    values = np.load(os.path.join(path, VALUES_FILE), mmap_mode="r")
+    return Panel(values, meta["districts"], meta["months"], meta["features"], meta["version"])
+
+
+def _remove_old(root, name, keep):
+    for entry in os.listdir(root):
+        if entry.startswith(f"{name}-") and entry != keep and ".tmp-" not in entry:
+            shutil.rmtree(os.path.join(root, entry), ignore_errors=True)
+
+
+# ------------------
+# 데이터 버전당 한 번만 만듦
+#   같은 프로세스: 만든 Panel 객체를 그대로 재사용
+#   다른 프로세스 (TASK_EXECUTOR=process 워커): 같은 .npy 를 읽기 전용 memmap
+# ------------------
+_lock = threading.Lock()
+_panels = {}
+
+
+def panel_for(df, name, features, district_col="district", time_col="datetime", root=PANEL_DIR):
+    version = data_version(df, [district_col, time_col, *features])
+
+    with _lock:
+        cached = _panels.get(name)
+        if cached is not None and cached.version == version:
+            return cached
+
+        if not root:
+            panel = build_panel(df, features, district_col, time_col, version)
+        else:
+            path = os.path.join(root, f"{name}-{version}")
+            if not os.path.exists(path):
+                os.makedirs(root, exist_ok=True)
+                save_panel(build_panel(df, features, district_col, time_col, version), path)
+                _remove_old(root, name, keep=os.path.basename(path))
+            panel = open_panel(path)
+
+        _panels[name] = panel
+        return panel
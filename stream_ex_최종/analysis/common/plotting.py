@@ -0,0 +1,114 @@
+# analysis/common/plotting.py
+
+import io
+import os
+import threading
+from functools import lru_cache
+
+import matplotlib
+import matplotlib.font_manager as fm
+import matplotlib.style as mstyle
+from matplotlib.figure import Figure
+
+from analysis.common.metrics import FIGURE_RENDER_SECONDS
+
+FONT_PATH = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
+FONT_FAMILIES = ["Malgun Gothic", "NanumGothic", "AppleGothic"]
+
+# 캐시 / 아티팩트에 넣는 그림 해상도 (st.pyplot 기본값과 같음)
+# 라이브 계산과 serve-only 가 같은 PNG 를 보여 주도록 한 곳에서 정함
+FIGURE_DPI = 200
+
+# rcParams 는 프로세스 전역 → 시작할 때 폰트만 한 번 고정하고 이후에는 바꾸지 않음
+# (스타일은 Figure / Axes 에 직접 적용하므로 여러 세션이 동시에 그려도 안전)
+_FONT_LOCK = threading.Lock()
+_fonts_ready = False
+
+
+# ------------------
+# 한글 폰트 (프로세스당 한 번만 탐색)
+# ------------------
+@lru_cache(maxsize=1)
+def korean_font():
+    if os.path.exists(FONT_PATH):
+        fm.fontManager.addfont(FONT_PATH)
+        return fm.FontProperties(fname=FONT_PATH).get_name()
+
+    available = {f.name for f in fm.fontManager.ttflist}
+    for name in FONT_FAMILIES:
+        if name in available:
+            return name
+    return None
+
+
+def font_rc():
+    rc = {"axes.unicode_minus": False}
+    font = korean_font()
+    if font:
+        rc["font.family"] = font
+    return rc
+
+
+def setup_fonts():
+    """시작 시 한 번 호출: 기본 rcParams 에 한글 폰트를 고정한다."""
+    global _fonts_ready
+    with _FONT_LOCK:
+        if not _fonts_ready:
+            matplotlib.rcParams.update(font_rc())
+            _fonts_ready = True
+
+
+# ------------------
+# 스타일 (matplotlib.style 이름) 을 Axes 에 직접 적용
+# mstyle.context 처럼 전역 rcParams 를 바꾸지 않음
+# 범례 테두리 (legend.frameon) 는 ax.legend(frameon=...) 로 호출하는 쪽에서
+# ------------------
+def style_axes(ax, style):
+    rc = mstyle.library[style]
+
+    ax.set_facecolor(rc.get("axes.facecolor", ax.get_facecolor()))
+    ax.set_axisbelow(rc.get("axes.axisbelow", True))
+    for spine in ax.spines.values():
+        spine.set_edgecolor(rc.get("axes.edgecolor", spine.get_edgecolor()))
+        spine.set_linewidth(rc.get("axes.linewidth", spine.get_linewidth()))
+
+    if rc.get("axes.grid"):
+        ax.grid(True, color=rc.get("grid.color"), linestyle=rc.get("grid.linestyle"))
+
+    for axis in ("x", "y"):
+        color = rc.get(f"{axis}tick.color")
+        ax.tick_params(
+            axis=axis, which="major", color=color, labelcolor=color,
+            direction=rc.get(f"{axis}tick.direction"), length=rc.get(f"{axis}tick.major.size")
+        )
+        ax.tick_params(axis=axis, which="minor", length=rc.get(f"{axis}tick.minor.size"))
+
+    ax.xaxis.label.set_color(rc.get("axes.labelcolor"))
+    ax.yaxis.label.set_color(rc.get("axes.labelcolor"))
+    ax.title.set_color(rc.get("text.color"))
+
+
+# ------------------
+# Figure 생성 (pyplot 전역 상태 미사용)
+# ------------------
+def new_figure(figsize, nrows=1, ncols=1, style=None, **kwargs):
+    """plt.subplots 대체: pyplot 에 등록되지 않는 Figure 와 Axes 를 돌려준다."""
+    setup_fonts()
+
+    fig = Figure(figsize=figsize)
+    axes = fig.subplots(nrows, ncols, **kwargs)
+    if style:
+        fig.set_facecolor(mstyle.library[style].get("figure.facecolor", "white"))
+        for ax in fig.axes:
+            style_axes(ax, style)
+    return fig, axes
+
+
+# ------------------
+# 렌더링
+# ------------------
+def render_png(fig, dpi=100):
+    buf = io.BytesIO()
+    with FIGURE_RENDER_SECONDS.time():
+        fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
+    return buf.getvalue()
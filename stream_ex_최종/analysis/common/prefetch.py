@@ -0,0 +1,92 @@
+# analysis/common/prefetch.py
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from analysis.common.metrics import WARMUP_SECONDS
+
+# 0 이면 워밍업 안 함
+WARMUP = os.environ.get("WARMUP", "1") == "1"
+
+# 사용자 세션과 CPU 를 나눠 쓰므로 적게
+WARMUP_WORKERS = int(os.environ.get("WARMUP_WORKERS", "2"))
+
+THREAD_PREFIX = "warmup"
+
+
+# 워밍업 등 백그라운드 스레드는 세션 밖에서 캐시를 채우므로 'missing ScriptRunContext' 경고가 정상
+class _BackgroundThreadFilter(logging.Filter):
+    def __init__(self, prefix):
+        super().__init__()
+        self.prefix = prefix
+
+    def filter(self, record):
+        return not threading.current_thread().name.startswith(self.prefix)
+
+
+def quiet_background_threads(prefix):
+    """prefix 로 시작하는 스레드의 missing ScriptRunContext 경고를 숨김."""
+    logging.getLogger(
+        "streamlit.runtime.scriptrunner_utils.script_run_context"
+    ).addFilter(_BackgroundThreadFilter(prefix))
+
+
+quiet_background_threads(THREAD_PREFIX)
+
+
+@lru_cache(maxsize=1)
+def warmup_pool():
+    return ThreadPoolExecutor(max_workers=WARMUP_WORKERS, thread_name_prefix=THREAD_PREFIX)
+
+
+_lock = threading.Lock()
+_state = {"generation": None, "futures": {}}
+
+
+def _run(name, func):
+    start = time.perf_counter()
+    try:
+        func()
+    finally:
+        WARMUP_SECONDS.observe(time.perf_counter() - start, task=name)
+
+
+def warm_up(tasks, generation=0):
+    """tasks: {이름: 인자 없는 함수} — 백그라운드에서 실행해 각 함수의 캐시를 채운다.
+
+    프로세스에 하나만 돌고, 같은 generation 으로는 다시 돌리지 않는다.
+    (데이터가 바뀌어 캐시가 비워지면 generation 이 올라가서 다음 Home 방문 때 다시 실행)
+    """
+    if not WARMUP:
+        return
+
+    with _lock:
+        if _state["generation"] == generation:
+            return
+        if any(not f.done() for f in _state["futures"].values()):
+            return
+
+        _state["generation"] = generation
+        _state["futures"] = {
+            name: warmup_pool().submit(_run, name, func)
+            for name, func in tasks.items()
+        }
+
+
+def warm_status():
+    with _lock:
+        futures = dict(_state["futures"])
+
+    finished = {name: f for name, f in futures.items() if f.done()}
+    return {
+        "total": len(futures),
+        "done": len(finished),
+        "failed": {
+            name: repr(f.exception())
+            for name, f in finished.items() if f.exception() is not None
+        },
+    }
@@ -0,0 +1,160 @@
+# analysis/common/progressive.py
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from analysis.common.artifacts import artifact, serve_only
+from analysis.common.cache import CACHE_MAX_ENTRIES
+from analysis.common.metrics import PROGRESSIVE_RESULTS
+from analysis.common.prefetch import quiet_background_threads
+from analysis.common.singleflight import call_key
+
+# 0 이면 항상 정밀 결과를 기다림 (기존 동작)
+PROGRESSIVE = os.environ.get("PROGRESSIVE", "1") == "1"
+
+# 정밀 결과가 이 시간 안에 나오면 (캐시 hit 등) 근사 없이 바로 표시
+EXACT_WAIT = float(os.environ.get("PROGRESSIVE_WAIT", "0.3"))
+
+# 근사 결과를 그린 뒤 정밀 계산이 끝났는지 확인하는 간격
+POLL_SECONDS = float(os.environ.get("PROGRESSIVE_POLL", "0.5"))
+
+# 정밀 계산은 페이지 작업 풀과 따로 (근사 / 다른 페이지 작업을 막지 않도록)
+EXACT_WORKERS = int(os.environ.get("PROGRESSIVE_WORKERS", "2"))
+
+THREAD_PREFIX = "exact"
+
+EXACT = "exact"
+APPROX = "approx"
+STALE = "stale"
+
+quiet_background_threads(THREAD_PREFIX)
+
+
+@lru_cache(maxsize=1)
+def exact_pool():
+    return ThreadPoolExecutor(max_workers=EXACT_WORKERS, thread_name_prefix=THREAD_PREFIX)
+
+
+_lock = threading.Lock()
+
+# 호출 키 → 정밀 계산 Future (세션끼리 공유, 결과를 가져가면 제거)
+_jobs = {}
+
+# slot → 마지막 정밀 결과 (데이터가 바뀌어 캐시가 비워져도 남음 → stale 로 표시)
+# slot 은 선택값 (자치구 × 기간 등) 마다 생기므로 캐시와 같은 개수까지만, 오래 안 쓴 것부터 버림
+_last = OrderedDict()
+
+
+def _remember(slot, value):
+    with _lock:
+        _last[slot] = value
+        _last.move_to_end(slot)
+        while len(_last) > CACHE_MAX_ENTRIES:
+            _last.popitem(last=False)
+
+
+def _stale(slot):
+    # _lock 안에서 호출
+    value = _last.get(slot)
+    if value is not None:
+        _last.move_to_end(slot)
+    return value
+
+
+def _exact(slot, func, args, kwargs):
+    value = func(*args, **kwargs)
+    _remember(slot, value)
+    return value
+
+
+class Progressive:
+    """페이지 (또는 fragment) 한 번 실행 동안의 근사 → 정밀 결과.
+
+    run = Progressive()
+    value, state = run.result(fit_arima, df, approx=lambda: approx_arima(df), key=window)
+    ...
+    run.refresh()   # 근사를 보여 줬으면 정밀 결과가 끝날 때 다시 실행
+    """
+
+    def __init__(self):
+        self.pending = []
+
+    def result(self, func, *args, approx=None, key=None, **kwargs):
+        """(값, 상태) — 상태는 EXACT / APPROX (approx() 결과) / STALE (이전 데이터의 정밀 결과).
+
+        approx 가 없거나 None 을 돌려주고 이전 결과도 없으면 정밀 결과를 기다림.
+        serve-only 에서는 미리 만든 (정밀) 아티팩트.
+        """
+        if serve_only():
+            return artifact(func, *args, key=key, **kwargs), EXACT
+        if not PROGRESSIVE:
+            return func(*args, **kwargs), EXACT
+
+        name = func.__name__
+        slot = f"{name}:{key}"
+        job = call_key(f"{func.__module__}.{name}", args, kwargs)
+
+        with _lock:
+            future = _jobs.get(job)
+            if future is None:
+                # 아무도 가져가지 않은 (페이지를 떠난) 끝난 작업 정리 — 결과는 캐시에 있음
+                for done in [k for k, f in _jobs.items() if f.done()]:
+                    del _jobs[done]
+                future = exact_pool().submit(_exact, slot, func, args, kwargs)
+                _jobs[job] = future
+            stale = _stale(slot)
+
+        if not wait([future], timeout=EXACT_WAIT).done:
+            value = approx() if approx is not None else None
+            state = APPROX if value is not None else None
+            if state is None and stale is not None:
+                value, state = stale, STALE
+
+            if state is not None:
+                # 정밀 결과는 다음 실행에서 가져감 (그때까지 _jobs 에 남겨 둠)
+                self.pending.append(future)
+                PROGRESSIVE_RESULTS.inc(function=name, state=state)
+                return value, state
+
+        # 정밀 결과 (보여 줄 근사가 없으면 끝날 때까지 기다림)
+        # 가져간 작업은 제거 → 이후 호출은 캐시 hit
+        try:
+            value = future.result()
+        finally:
+            with _lock:
+                if _jobs.get(job) is future:
+                    del _jobs[job]
+
+        PROGRESSIVE_RESULTS.inc(function=name, state=EXACT)
+        return value, EXACT
+
+    def refresh(self, message="⏳ 근사 결과를 먼저 표시했습니다. 정밀 계산이 끝나면 자동으로 바뀝니다."):
+        """근사 / stale 결과를 보여 줬으면 정밀 계산이 모두 끝날 때까지 기다렸다가 다시 실행.
+
+        fragment 만 다시 실행 중이면 그 fragment 만, 아니면 앱 전체를 다시 실행.
+        """
+        if not self.pending:
+            return
+
+        status = st.empty()
+        pending = set(self.pending)
+        while pending:
+            status.caption(f"{message} ({len(self.pending) - len(pending)}/{len(self.pending)})")
+            # 위젯 조작으로 rerun 이 요청되면 status 갱신 시점에 이 실행이 멈춤
+            _, pending = wait(pending, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+
+        self.pending = []
+
+        # fragment 만 다시 실행된 경우 (그 fragment 의 위젯 조작) 에는 fragment 만
+        # 전체 실행 중이면 fragment 안에서 호출해도 scope="fragment" 를 쓸 수 없으므로 앱 전체
+        ctx = get_script_run_ctx(suppress_warning=True)
+        if ctx is not None and ctx.fragment_ids_this_run:
+            st.rerun(scope="fragment")
+        else:
+            st.rerun()
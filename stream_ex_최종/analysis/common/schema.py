@@ -0,0 +1,160 @@
+# analysis/common/schema.py
+
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+# 1 이면 read_sql 결과를 pyarrow dtype 으로 바로 받음 (문자열 object 생성 없음)
+ARROW_DTYPES = os.environ.get("ARROW_DTYPES", "0") == "1"
+
+# ------------------
+# 테이블별 컬럼 종류
+#   count    : 0 이상 정수 → 가장 작은 정수 타입 (NaN 있으면 float 유지)
+#   diff     : 부호 있는 정수 증감
+#   code     : district_id 같은 작은 정수 코드
+#   category : 자치구 / 시군구 같은 반복 문자열 → categorical
+#   datetime : 'YYYY-MM-DD' 문자열 → datetime64
+# 적히지 않은 컬럼은 그대로 둠
+# ------------------
+VEHICLE_KINDS = ["승용", "승합", "화물", "특수"]
+VEHICLE_USES = ["관용", "자가용", "영업용"]
+VEHICLE_COUNTS = [f"{kind}{use}" for kind in VEHICLE_KINDS for use in VEHICLE_USES]
+
+SCHEMAS = {
+    "car_month": {
+        "datetime": "datetime",
+        "car_count_month": "count",
+        "car_diff_month": "diff",
+    },
+    "ml_base_view": {
+        "district": "category",
+        "district_id": "code",
+        "datetime": "datetime",
+        "population": "count",
+        "population_diff": "diff",
+        "car_count": "count",
+        "car_diff": "diff",
+    },
+    "public_transit": {
+        "district_id": "code",
+        "district": "category",
+        "year": "code",
+        "total": "count",
+        "bus": "count",
+        "subway": "count",
+        "taxi": "count",
+        "population": "count",
+        "car_count": "count",
+        "car_diff_year": "diff",
+    },
+    "parking_car": {
+        "year": "code",
+        "car_count": "count",
+        "parking_area": "count",
+    },
+    "vehicle": {
+        "district_id": "code",
+        "년월": "code",
+        "시군구": "category",
+        **{c: "count" for c in VEHICLE_COUNTS},
+    },
+    "vehicle_fact": {
+        "년월": "code",
+        "district_id": "code",
+        "차종": "category",
+        "용도": "category",
+        "count": "count",
+    },
+    "feature_monthly": {
+        "series": "category",
+        "district_id": "code",
+        "datetime": "datetime",
+    },
+    "feature_yearly": {
+        "series": "category",
+        "district_id": "code",
+        "year": "code",
+        "n_months": "code",
+    },
+    "traffic": {
+        "유형": "category",
+        "지점": "count",
+        "year": "code",
+        "volume": "count",
+    },
+    "cctv_accident": {
+        "사망자수(명)": "count",
+        "심각정도": "category",
+        "발생건수(건)": "count",
+        "부상자수(명)": "count",
+        "CCTV설치대수": "count",
+    },
+    "anomaly_event": {
+        "district_id": "code",
+        "district": "category",
+        "datetime": "datetime",
+        "metric": "category",
+        "method": "category",
+    },
+}
+
+
+def _to_int(s):
+    s = pd.to_numeric(s)
+    if s.isna().any():
+        return s
+    # 부호 있는 타입만 사용 (unsigned 는 뺄셈에서 wrap-around 위험)
+    return pd.to_numeric(s.astype(np.int64), downcast="integer")
+
+
+CONVERTERS = {
+    "count": _to_int,
+    "diff": _to_int,
+    "code": _to_int,
+    "category": lambda s: s.astype("category"),
+    "datetime": pd.to_datetime,
+}
+
+
+# ------------------
+# 테이블별 메모리 (타입 적용 전 / 후)
+# ------------------
+MEMORY = {}
+_MEMORY_LOCK = threading.Lock()
+
+
+def _nbytes(df):
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+def apply_schema(df, table):
+    schema = SCHEMAS.get(table, {})
+    before = _nbytes(df)
+
+    df = df.copy()
+    for col, kind in schema.items():
+        if col in df.columns:
+            df[col] = CONVERTERS[kind](df[col])
+
+    with _MEMORY_LOCK:
+        MEMORY[table] = {
+            "table": table,
+            "rows": len(df),
+            "raw_bytes": before,
+            "typed_bytes": _nbytes(df),
+        }
+    return df
+
+
+def memory_report():
+    """테이블별 행 수 / 타입 적용 전후 바이트 / 축소 비율."""
+    with _MEMORY_LOCK:
+        df = pd.DataFrame(list(MEMORY.values()))
+
+    if df.empty:
+        return df
+
+    df["ratio"] = (df["raw_bytes"] / df["typed_bytes"]).round(1)
+    return df.sort_values("raw_bytes", ascending=False).reset_index(drop=True)
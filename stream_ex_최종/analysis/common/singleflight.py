@@ -0,0 +1,151 @@
+# analysis/common/singleflight.py
+
+import functools
+import hashlib
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+
+from analysis.common.metrics import SINGLEFLIGHT_CALLS
+
+# 파일 lock: POSIX 는 fcntl, Windows 는 msvcrt
+# 둘 다 없으면 프로세스 간 공유 없이 프로세스 안 single-flight 만 사용
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# 설정하면 워커 프로세스끼리도 lock 파일로 한 번만 계산
+LOCK_DIR = os.environ.get("SINGLEFLIGHT_DIR")
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+# ------------------
+# 호출 키: 함수 이름 + 인자 (DataFrame 은 내용 해시)
+# ------------------
+def _arg_token(value):
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        return "pd:" + str(pd.util.hash_pandas_object(value, index=True).sum())
+    if isinstance(value, np.ndarray):
+        return "np:" + hashlib.md5(np.ascontiguousarray(value).tobytes()).hexdigest()
+    if isinstance(value, (list, tuple)):
+        return "(" + ",".join(_arg_token(v) for v in value) + ")"
+    return repr(value)
+
+
+def call_key(name, args, kwargs):
+    parts = [name] + [_arg_token(a) for a in args]
+    parts += [f"{k}={_arg_token(v)}" for k, v in sorted(kwargs.items())]
+    return hashlib.md5("|".join(parts).encode("utf-8")).hexdigest()
+
+
+# ------------------
+# 프로세스 간: lock 파일 + 결과 파일
+# lock 을 기다린 쪽은 기다리는 동안 쓰인 결과가 있으면 그걸 읽음
+# ------------------
+def _file_locks():
+    return fcntl is not None or msvcrt is not None
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        return
+
+    # msvcrt.LK_LOCK 은 10번 (약 10초) 재시도 후 OSError → 풀릴 때까지 다시 시도
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f, fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _run_locked(key, fn, args, kwargs):
+    os.makedirs(LOCK_DIR, exist_ok=True)
+    lock_path = os.path.join(LOCK_DIR, key + ".lock")
+    result_path = os.path.join(LOCK_DIR, key + ".pkl")
+    waited_since = time.time()
+
+    with open(lock_path, "w") as lock_file:
+        _lock_file(lock_file)
+        try:
+            if os.path.exists(result_path) and os.path.getmtime(result_path) >= waited_since:
+                with open(result_path, "rb") as f:
+                    return pickle.load(f)
+
+            value = fn(*args, **kwargs)
+
+            tmp = result_path + f".{os.getpid()}.tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, result_path)
+            except Exception:
+                # pickle 안 되는 결과는 공유만 못 할 뿐 계산 결과는 그대로 반환
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            return value
+        finally:
+            _unlock_file(lock_file)
+
+
+def do(key, fn, *args, name=None, **kwargs):
+    """같은 key 로 동시에 들어온 호출은 첫 호출(leader)의 결과를 함께 받는다."""
+    with _flights_lock:
+        future = _flights.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _flights[key] = future
+
+    if not leader:
+        SINGLEFLIGHT_CALLS.inc(function=name or key, role="follower")
+        return future.result()
+
+    SINGLEFLIGHT_CALLS.inc(function=name or key, role="leader")
+    try:
+        if LOCK_DIR and _file_locks():
+            value = _run_locked(key, fn, args, kwargs)
+        else:
+            value = fn(*args, **kwargs)
+        future.set_result(value)
+        return value
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _flights_lock:
+            _flights.pop(key, None)
+
+
+def single_flight(func):
+    """로더 / 무거운 분석 함수용 데코레이터."""
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = call_key(name, args, kwargs)
+        return do(key, func, *args, name=func.__name__, **kwargs)
+
+    return wrapper
@@ -0,0 +1,174 @@
+# analysis/common/table.py
+
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import text
+
+from analysis.common.db import get_engine, read_sql
+
+# 브라우저로 보내는 한 페이지 행 수
+PAGE_SIZE = int(os.environ.get("TABLE_PAGE_SIZE", "50"))
+
+# 내보내기 때 한 번에 읽고 쓰는 행 수 (전체 결과를 메모리에 올리지 않음)
+EXPORT_CHUNK_ROWS = int(os.environ.get("EXPORT_CHUNK_ROWS", "50000"))
+
+EXPORT_MIME = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+# ------------------
+# 표 원천
+#   FrameSource: 이미 계산된 결과 (캐시 / 아티팩트)
+#   QuerySource: DB 테이블 / 뷰 — 정렬 / 검색 / 페이지를 SQL 로 처리
+# 둘 다 columns / count / page / chunks 를 같은 모양으로 제공
+# search: (컬럼, 검색어) — 값에 검색어가 들어 있는 행만
+# ------------------
+class FrameSource:
+
+    def __init__(self, df):
+        # 의미 있는 index (연도 등) 는 컬럼으로 꺼내서 정렬 / 검색 / 내보내기에 포함
+        if not isinstance(df.index, pd.RangeIndex):
+            df = df.reset_index()
+        self.df = df.rename(columns=str)
+        self.columns = list(self.df.columns)
+
+    def _select(self, sort=None, ascending=True, search=None):
+        df = self.df
+        if search:
+            column, value = search
+            df = df[df[column].astype(str).str.contains(value, regex=False, na=False)]
+        if sort is not None:
+            df = df.sort_values(sort, ascending=ascending, kind="stable")
+        return df
+
+    def count(self, search=None):
+        return len(self._select(search=search))
+
+    def page(self, sort=None, ascending=True, search=None, offset=0, limit=PAGE_SIZE):
+        return self._select(sort, ascending, search).iloc[offset:offset + limit]
+
+    def chunks(self, sort=None, ascending=True, search=None, chunk_rows=EXPORT_CHUNK_ROWS):
+        df = self._select(sort, ascending, search)
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start:start + chunk_rows]
+
+
+class QuerySource:
+
+    def __init__(self, table, columns=None, where=None, params=None,
+                 order=None, engine=None):
+        """order: 기본 정렬 (유일 키, "-컬럼" 은 내림차순) — 정렬 컬럼 값이 같은 행의 페이지 경계를 고정."""
+        self.table = table
+        self.engine = engine or get_engine()
+        self.columns = list(columns) if columns else self._table_columns()
+        self.where = where
+        self.params = dict(params or {})
+        self.order = list(order or [])
+
+    def _table_columns(self):
+        with self.engine.connect() as conn:
+            result = conn.execute(text(f"SELECT * FROM {self.table} WHERE 1 = 0"))
+            return list(result.keys())
+
+    def _quote(self, column):
+        # 정렬 / 검색 컬럼은 위젯에서 오므로 테이블 컬럼인지 확인한 뒤 인용
+        if column not in self.columns:
+            raise ValueError(f"알 수 없는 컬럼: {column}")
+        return self.engine.dialect.identifier_preparer.quote(column)
+
+    def _filter(self, search):
+        clauses, params = [], dict(self.params)
+        if self.where:
+            clauses.append(f"({self.where})")
+        if search:
+            column, value = search
+            escaped = value.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+            clauses.append(f"CAST({self._quote(column)} AS CHAR) LIKE :search ESCAPE '!'")
+            params["search"] = f"%{escaped}%"
+        sql = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return sql, params
+
+    def _order_by(self, sort, ascending):
+        keys = []
+        if sort is not None:
+            keys.append(f"{self._quote(sort)} {'ASC' if ascending else 'DESC'}")
+        for c in self.order:
+            name = c.lstrip("-")
+            if name != sort:
+                keys.append(f"{self._quote(name)} {'DESC' if c.startswith('-') else 'ASC'}")
+        return f" ORDER BY {', '.join(keys)}" if keys else ""
+
+    def _select(self, sort, ascending, search):
+        where, params = self._filter(search)
+        columns = ", ".join(self._quote(c) for c in self.columns)
+        sql = f"SELECT {columns} FROM {self.table}{where}{self._order_by(sort, ascending)}"
+        return sql, params
+
+    def count(self, search=None):
+        where, params = self._filter(search)
+        df = read_sql(
+            text(f"SELECT COUNT(*) AS n FROM {self.table}{where}"),
+            loader="table_count", params=params, engine=self.engine
+        )
+        return int(df["n"].iloc[0])
+
+    def page(self, sort=None, ascending=True, search=None, offset=0, limit=PAGE_SIZE):
+        sql, params = self._select(sort, ascending, search)
+        params.update(limit=int(limit), offset=int(offset))
+        return read_sql(
+            text(sql + " LIMIT :limit OFFSET :offset"),
+            loader="table_page", params=params, engine=self.engine
+        )
+
+    def chunks(self, sort=None, ascending=True, search=None, chunk_rows=EXPORT_CHUNK_ROWS):
+        # 서버 쪽 커서로 chunk_rows 씩 받아옴 (전체 결과를 한 번에 가져오지 않음)
+        sql, params = self._select(sort, ascending, search)
+        with self.engine.connect().execution_options(stream_results=True) as conn:
+            for chunk in pd.read_sql(text(sql), conn, params=params, chunksize=chunk_rows):
+                yield chunk
+
+
+# ------------------
+# 내보내기: 청크 단위로 임시 파일에 쓰고 파일 객체를 돌려줌
+# (다운로드 버튼을 눌렀을 때만 실행, 파일은 닫히면 삭제)
+# ------------------
+def _write_csv(chunks, f):
+    header = True
+    for chunk in chunks:
+        f.write(chunk.to_csv(index=False, header=header).encode("utf-8-sig" if header else "utf-8"))
+        header = False
+
+
+def _write_parquet(chunks, f, columns):
+    writer = None
+    for chunk in chunks:
+        batch = pa.Table.from_pandas(chunk, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(f, batch.schema)
+        writer.write_table(batch.cast(writer.schema))
+    if writer is None:
+        # 결과가 비어도 컬럼만 있는 파일
+        pq.write_table(pa.Table.from_pandas(pd.DataFrame(columns=columns)), f)
+    else:
+        writer.close()
+
+
+def export_file(source, fmt, sort=None, ascending=True, search=None):
+    if fmt not in EXPORT_MIME:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+
+    f = tempfile.TemporaryFile()
+    chunks = source.chunks(sort, ascending, search)
+    if fmt == "csv":
+        _write_csv(chunks, f)
+    else:
+        _write_parquet(chunks, f, source.columns)
+
+    f.seek(0)
+    return f
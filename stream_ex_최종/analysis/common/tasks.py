@@ -0,0 +1,101 @@
+# analysis/common/tasks.py
+
+import importlib
+import multiprocessing
+import os
+import time
+import traceback
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from analysis.common.artifacts import encode
+from analysis.common.metrics import TASK_SECONDS
+from analysis.common.plotting import FIGURE_DPI
+
+TASK_WORKERS = int(os.environ.get("TASK_WORKERS", "4"))
+
+# "thread": 스레드 풀에서 계산 (기본)
+# "process": 캐시 miss 는 워커 프로세스에서 계산 (GIL 에 묶인 그림 렌더링도 병렬)
+TASK_EXECUTOR = os.environ.get("TASK_EXECUTOR", "thread")
+
+
+# 세션끼리 같은 풀을 공유 (요청마다 스레드를 만들지 않음)
+@lru_cache(maxsize=1)
+def task_pool():
+    return ThreadPoolExecutor(max_workers=TASK_WORKERS, thread_name_prefix="page-task")
+
+
+def _init_worker():
+    warnings.filterwarnings("ignore")
+
+
+@lru_cache(maxsize=1)
+def process_pool():
+    # 서버 프로세스는 스레드가 많아서 fork 대신 spawn
+    return ProcessPoolExecutor(
+        max_workers=TASK_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    )
+
+
+def _compute_in_worker(module, name, args, kwargs):
+    # 모듈 속성은 cached_result 로 감싼 함수 → 안쪽 원래 함수를 실행
+    func = getattr(importlib.import_module(module), name).__wrapped__
+    return encode(func(*args, **kwargs), dpi=FIGURE_DPI)
+
+
+def compute(func, args, kwargs):
+    """cached_result 의 miss 계산. 결과 캐시는 항상 서버 프로세스에 남는다."""
+    if TASK_EXECUTOR != "process":
+        return encode(func(*args, **kwargs), dpi=FIGURE_DPI)
+
+    future = process_pool().submit(
+        _compute_in_worker, func.__module__, func.__name__, args, kwargs
+    )
+    return future.result()
+
+
+class TaskFailed:
+    """실패한 작업 자리에 들어가는 값 (다른 작업 결과에는 영향 없음)."""
+
+    def __init__(self, name, error, trace):
+        self.name = name
+        self.error = error
+        self.trace = trace
+
+    def __repr__(self):
+        return f"TaskFailed({self.name!r}, {self.error!r})"
+
+
+def _run(name, func, args, ctx):
+    # 워커 스레드에서도 st.cache_* 가 현재 세션 기준으로 동작하도록
+    if ctx is not None:
+        add_script_run_ctx(ctx=ctx)
+
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    except Exception as e:
+        return TaskFailed(name, e, traceback.format_exc())
+    finally:
+        TASK_SECONDS.observe(time.perf_counter() - start, task=name)
+
+
+def run_tasks(tasks):
+    """서로 독립인 분석 호출을 동시에 실행.
+
+    tasks: {이름: (함수, 인자, ...)}
+    반환: {이름: 결과} — tasks 와 같은 순서, 실패한 작업은 TaskFailed
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+    pool = task_pool()
+
+    futures = {
+        name: pool.submit(_run, name, spec[0], spec[1:], ctx)
+        for name, spec in tasks.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
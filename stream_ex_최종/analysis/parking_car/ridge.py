@@ -1,26 +1,20 @@
 # analysis/population_car/ridge.py
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
 
 from sklearn.linear_model import Ridge
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 
-# ------------------
-# 한글 폰트 설정
-# ------------------
-def set_korean_font():
-    try:
-        font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-        font_name = fm.FontProperties(fname=font_path).get_name()
-        plt.rc("font", family=font_name)
-        plt.rcParams["axes.unicode_minus"] = False
-    except:
-        pass
+from analysis.common.cache import cached_result
+from analysis.common.metrics import track_fit
+from analysis.common.singleflight import single_flight
+from analysis.common.plotting import new_figure
 
 
+@cached_result
+@single_flight
+@track_fit("run_ridge")
 def run_ridge(df):
 
      # ------------------
@@ -61,7 +55,7 @@ def run_ridge(df):
     # ------------------
     # 시각화
     # ------------------
-    fig, ax = plt.subplots(figsize=(5, 3.5))
+    fig, ax = new_figure(figsize=(5, 3.5))
 
     ax.plot(np.log10(alpha_list), train_score, label="Train R²")
     ax.plot(np.log10(alpha_list), test_score, label="Test R²")
@@ -90,12 +84,12 @@ def run_ridge(df):
     return fig, best_scores
 
 import numpy as np
-import matplotlib.pyplot as plt
 from sklearn.pipeline import make_pipeline
 from sklearn.preprocessing import PolynomialFeatures
 from sklearn.linear_model import Ridge
 
 
+@cached_result
 def run_parking_poly_regression(df, degree=2, alpha=0.1):
 
     X = df[["car_count"]].values
@@ -110,11 +104,7 @@ def run_parking_poly_regression(df, degree=2, alpha=0.1):
     )
     model.fit(X_scaled, y_scaled)
 
-    plt.style.use("seaborn-v0_8-darkgrid")
-    plt.rcParams["font.family"] = "Malgun Gothic"
-    plt.rcParams["axes.unicode_minus"] = False
-
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = new_figure(figsize=(10, 6), style="seaborn-v0_8-darkgrid")
 
     ax.scatter(
         X_scaled,
@@ -148,8 +138,8 @@ def run_parking_poly_regression(df, degree=2, alpha=0.1):
     ax.set_ylabel("주차면 수 (단위: 만 면)", fontsize=14)
 
     ax.tick_params(axis="both", labelsize=12)
-    ax.legend(fontsize=12)
-    plt.tight_layout()
+    ax.legend(fontsize=12, frameon=False)
+    fig.tight_layout()
 
     return fig, model
 
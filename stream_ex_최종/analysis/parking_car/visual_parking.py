@@ -1,8 +1,6 @@
 from matplotlib import ticker
-import matplotlib.pyplot as plt
 import pandas as pd
 from scipy import stats
-import matplotlib.font_manager as fm
 import numpy as np
 
 from scipy import stats
@@ -13,22 +11,15 @@ from sklearn.metrics import (
     mean_absolute_error,
     mean_squared_error
 )
-# ------------------
-# 한글 폰트 설정
-# ------------------
-def set_korean_font():
-    try:
-        font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-        font_name = fm.FontProperties(fname=font_path).get_name()
-        plt.rc("font", family=font_name)
-        plt.rcParams["axes.unicode_minus"] = False
-    except:
-        pass
+
+from analysis.common.cache import cached_result
+from analysis.common.plotting import new_figure
 
 
 # ------------------
 # 1. 상관분석 + 산점도
 # ------------------
+@cached_result
 def plot_correlation(df):
 
     x = df["car_count"].values
@@ -39,11 +30,7 @@ def plot_correlation(df):
     x_scaled = x / 10000
     y_scaled = y / 10000
 
-    plt.style.use("seaborn-v0_8-whitegrid")
-    plt.rcParams["font.family"] = "Malgun Gothic"
-    plt.rcParams["axes.unicode_minus"] = False
-
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = new_figure(figsize=(10, 6), style="seaborn-v0_8-whitegrid")
 
     ax.scatter(
         x_scaled,
@@ -73,7 +60,7 @@ def plot_correlation(df):
 
     ax.tick_params(axis="both", labelsize=12)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     return fig, r, p
 
@@ -81,6 +68,7 @@ def plot_correlation(df):
 # ------------------
 # 2. 단순 선형 회귀 + 성능
 # ------------------
+@cached_result
 def run_parking_regression(df):
 
     X = df[["car_count"]].values
@@ -110,11 +98,7 @@ def run_parking_regression(df):
         "rmse": np.sqrt(mean_squared_error(y_test, y_test_pred))
     }
 
-    plt.style.use("seaborn-v0_8-darkgrid")
-    plt.rcParams["font.family"] = "Malgun Gothic"
-    plt.rcParams["axes.unicode_minus"] = False
-
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = new_figure(figsize=(10, 6), style="seaborn-v0_8-darkgrid")
 
     ax.scatter(
         X_train,
@@ -149,8 +133,8 @@ def run_parking_regression(df):
 
     ax.tick_params(axis="both", labelsize=12)
 
-    ax.legend(fontsize=12)
-    plt.tight_layout()
+    ax.legend(fontsize=12, frameon=False)
+    fig.tight_layout()
 
     return fig, model, metrics
 
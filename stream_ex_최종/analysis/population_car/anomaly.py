@@ -0,0 +1,205 @@
+# analysis/population_car/anomaly.py
+
+import json
+from collections import deque
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import bindparam, inspect, text
+
+from analysis.common.db import touch_table
+
+# ------------------
+# 감시 대상 지표
+# (테이블, 값 컬럼, 자치구 컬럼 여부)
+# ------------------
+METRICS = {
+    "car_diff": ("car", "car_diff", True),
+    "population_diff": ("population", "population_diff", True),
+    "car_diff_month": ("car_month", "car_diff_month", False),
+}
+
+WINDOW = 12          # robust z-score 롤링 윈도우 (개월)
+EWMA_ALPHA = 0.3
+SEASON_ALPHA = 0.3
+WARMUP = 6           # 이 개월 수 이전에는 알림 없음
+Z_LIMIT = 3.5
+
+STATE_TABLE = "anomaly_state"
+EVENT_TABLE = "anomaly_event"
+
+
+# ------------------
+# 지표 하나(자치구 x 지표)의 온라인 통계
+# 메모리 사용량은 이력 길이와 무관하게 고정
+# ------------------
+def new_state():
+    return {
+        "n": 0,
+        "window": [],
+        "ewma": 0.0,
+        "ewvar": 0.0,
+        "season": [None] * 12,
+        "season_var": 0.0,
+        "last": None,
+    }
+
+
+def _z(value, center, scale):
+    if scale is None or scale <= 1e-9:
+        return 0.0
+    return float((value - center) / scale)
+
+
+def update_state(state, value, month):
+    """새 관측값 하나로 상태를 갱신하고 방법별 z-score 를 돌려준다."""
+    window = deque(state["window"], maxlen=WINDOW)
+    slot = month - 1
+
+    scores = {}
+    if state["n"] >= WARMUP:
+        # 롤링 robust z-score (중앙값 / MAD)
+        arr = np.asarray(window)
+        med = np.median(arr)
+        mad = 1.4826 * np.median(np.abs(arr - med))
+        scores["robust_z"] = _z(value, med, mad)
+
+        # EWMA
+        scores["ewma_z"] = _z(value, state["ewma"], np.sqrt(state["ewvar"]))
+
+        # 계절(같은 월) 잔차
+        if state["season"][slot] is not None:
+            scores["season_z"] = _z(
+                value, state["season"][slot], np.sqrt(state["season_var"])
+            )
+
+    # ------------------
+    # 상태 갱신
+    # ------------------
+    if state["n"] == 0:
+        state["ewma"] = value
+    else:
+        diff = value - state["ewma"]
+        state["ewma"] += EWMA_ALPHA * diff
+        state["ewvar"] = (1 - EWMA_ALPHA) * (state["ewvar"] + EWMA_ALPHA * diff ** 2)
+
+    season = state["season"][slot]
+    if season is None:
+        state["season"][slot] = value
+    else:
+        resid = value - season
+        state["season"][slot] = season + SEASON_ALPHA * resid
+        state["season_var"] = (
+            (1 - SEASON_ALPHA) * state["season_var"] + SEASON_ALPHA * resid ** 2
+        )
+
+    window.append(value)
+    state["window"] = list(window)
+    state["n"] += 1
+
+    return scores
+
+
+# ------------------
+# DB 상태 저장 / 로드
+# ------------------
+def load_states(engine):
+    if not inspect(engine).has_table(STATE_TABLE):
+        return {}
+
+    df = pd.read_sql(f"SELECT * FROM {STATE_TABLE}", engine)
+    return {
+        (row.metric, int(row.district_id)): json.loads(row.state)
+        for row in df.itertuples()
+    }
+
+
+def save_states(engine, states):
+    df = pd.DataFrame([
+        {"metric": metric, "district_id": district_id, "state": json.dumps(state)}
+        for (metric, district_id), state in states.items()
+    ])
+    df.to_sql(STATE_TABLE, engine, if_exists="replace", index=False)
+
+
+def _last_seen(states, metric):
+    """자치구별 마지막 반영 월 — 자치구마다 적재 시점이 달라도 각자 이어서 반영."""
+    return {
+        district_id: pd.Timestamp(s["last"])
+        for (m, district_id), s in states.items() if m == metric and s["last"]
+    }
+
+
+def _read_new_rows(engine, metric, last):
+    table, column, has_district = METRICS[metric]
+    cols = "district_id, district, datetime" if has_district else "datetime"
+
+    # DB 에서는 가장 늦은 자치구 기준으로 줄이고 (+ 상태가 없는 새 자치구 전체)
+    # 정확한 자치구별 경계는 아래에서 다시 적용
+    query = f"SELECT {cols}, {column} AS value FROM {table}"
+    params = {}
+    if last:
+        query += " WHERE datetime > :since"
+        params["since"] = min(last.values()).strftime("%Y-%m-%d")
+        if has_district:
+            query += " OR district_id NOT IN :known"
+            params["known"] = list(last)
+    query += " ORDER BY datetime"
+
+    stmt = text(query)
+    if "known" in params:
+        stmt = stmt.bindparams(bindparam("known", expanding=True))
+
+    df = pd.read_sql(stmt, engine, params=params)
+    if not has_district:
+        df["district_id"] = 0
+        df["district"] = "전체"
+
+    df["datetime"] = pd.to_datetime(df["datetime"])
+    cutoff = pd.to_datetime(df["district_id"].map(last))
+    df = df[cutoff.isna() | (df["datetime"] > cutoff)]
+
+    return df.dropna(subset=["value"])
+
+
+# ------------------
+# 새로 적재된 월만 반영 (이력 재스캔 없음)
+# 상태 / 이벤트 테이블은 재적재 사이에도 유지 → 같은 월은 다시 반영하지 않음
+# (update_anomalies.py 로 월 추가 뒤 단독 실행)
+# ------------------
+def update_anomalies(engine):
+    states = load_states(engine)
+    events = []
+
+    for metric in METRICS:
+        new_rows = _read_new_rows(engine, metric, _last_seen(states, metric))
+
+        for row in new_rows.itertuples(index=False):
+            key = (metric, int(row.district_id))
+            state = states.setdefault(key, new_state())
+
+            date = row.datetime
+            scores = update_state(state, float(row.value), date.month)
+            state["last"] = date.strftime("%Y-%m-%d")
+
+            flagged = {k: v for k, v in scores.items() if abs(v) >= Z_LIMIT}
+            if flagged:
+                method = max(flagged, key=lambda k: abs(flagged[k]))
+                events.append({
+                    "district_id": int(row.district_id),
+                    "district": row.district,
+                    "datetime": date.date(),
+                    "metric": metric,
+                    "value": float(row.value),
+                    "method": method,
+                    "score": round(flagged[method], 2),
+                })
+
+    save_states(engine, states)
+    if events:
+        pd.DataFrame(events).to_sql(
+            EVENT_TABLE, engine, if_exists="append", index=False
+        )
+        touch_table(engine, EVENT_TABLE)
+
+    return len(events)
@@ -1,47 +1,40 @@
 # analysis/population_car/cluster.py
 
-import matplotlib.pyplot as plt
+import pandas as pd
 from sklearn.cluster import KMeans
 from sklearn.preprocessing import StandardScaler
-import matplotlib.font_manager as fm
 
+from analysis.common.cache import cached_result
+from analysis.common.metrics import track_fit
+from analysis.common.singleflight import single_flight
+from analysis.common.plotting import new_figure
+from analysis.population_car.data import load_panel
 
-# ------------------
-# 한글 폰트 설정
-# ------------------
-def set_korean_font():
-    try:
-        font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-        font_name = fm.FontProperties(fname=font_path).get_name()
-        plt.rc("font", family=font_name)
-        plt.rcParams["axes.unicode_minus"] = False
-    except:
-        pass
+# 점진 렌더링 때 먼저 보여 주는 근사 결과 (KMeans 초기값 1번만)
+APPROX_N_INIT = 1
 
 
-def run_clustering(df, selected_district, n_clusters=3):
-    set_korean_font()
+@cached_result
+@single_flight
+@track_fit("run_clustering")
+def run_clustering(df, selected_district, n_clusters=3, n_init=10):
     # ------------------
     # 자치구 단위 집계
     # 여러 년도를 하나의 자치구 특성 벡터로 압축
+    # 패널 (자치구 × 월) 의 월 축 평균 → 자치구별 평균
     # ------------------
-    
+    panel = load_panel(df)
+    features = ["population", "car_count"]
+
     # ------------------
     # 전체 행 제거 (군집은 자치구만)
     # ------------------
-    df_cluster_base = df[df["district"] != "전체"].copy()
+    keep = panel.districts != "전체"
 
-    # ------------------
-    # 자치구별 평균 집계
-    # ------------------
-    df_cluster = (
-        df_cluster_base
-        .groupby(["district"], as_index=False)
-        .agg({
-            "population": "mean",
-            "car_count": "mean"
-        })
+    df_cluster = pd.DataFrame(
+        panel.mean(features)[keep], columns=features
     )
+    df_cluster.insert(0, "district", panel.districts[keep])
 
     # ------------------
     # 표준화 (스케일 차이 해결)
@@ -55,7 +48,7 @@ def run_clustering(df, selected_district, n_clusters=3):
     kmeans = KMeans(
         n_clusters=n_clusters,
         random_state=42,
-        n_init=10
+        n_init=n_init
     )
 
     df_cluster["cluster"] = kmeans.fit_predict(X_scaled)
@@ -74,7 +67,7 @@ def run_clustering(df, selected_district, n_clusters=3):
     # ------------------
     # Figure 1: 군집별 평균 Bar
     # ------------------
-    fig_bar, ax_bar = plt.subplots(figsize=(4, 3))
+    fig_bar, ax_bar = new_figure(figsize=(4, 3))
 
     summary_df.set_index("cluster")[["population", "car_count"]].plot(
         kind="bar",
@@ -89,7 +82,7 @@ def run_clustering(df, selected_district, n_clusters=3):
     # ------------------
     # Figure 2: 군집 분포 Scatter
     # ------------------
-    fig_scatter, ax_scatter = plt.subplots(figsize=(4, 3))
+    fig_scatter, ax_scatter = new_figure(figsize=(4, 3))
 
     scatter = ax_scatter.scatter(
         df_cluster["population"],
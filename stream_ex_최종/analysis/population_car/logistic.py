@@ -2,32 +2,21 @@
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 from sklearn.linear_model import LogisticRegression
 import seaborn as sns
-import matplotlib.font_manager as fm
 
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, confusion_matrix
 
-# ------------------
-# 한글 폰트 설정 (Streamlit 대응)
-# ------------------
-def set_korean_font():
-    try:
-        font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-        font_name = fm.FontProperties(fname=font_path).get_name()
-        plt.rc("font", family=font_name)
-        plt.rcParams["axes.unicode_minus"] = False
-    except:
-        pass
+from analysis.common.cache import cached_result
+from analysis.common.plotting import new_figure
+from analysis.population_car.data import load_panel
 
 
+@cached_result
 def run_logistic(df, selected_district):
-    set_korean_font()
-
-    df = df.copy()
-    df = df[df['district']==selected_district]
+    # 자치구 하나의 월별 값 (공유 패널에서 꺼냄)
+    df = load_panel(df).frame(selected_district, ["population_diff", "car_diff"])
     # 증가했으면 1 : 안했으면 0
     df["car_increase"] = (df["car_diff"] > 0).astype(int)
 
@@ -63,7 +52,11 @@ def run_logistic(df, selected_district):
     # ------------------
     cm = confusion_matrix(y_test, y_pred)
 
-    fig_cm, ax_cm = plt.subplots(figsize=(4, 3))
+    pop_range = np.linspace(df["population_diff"].min(), df["population_diff"].max(), 100).reshape(-1, 1)
+    pop_range_df = pd.DataFrame(pop_range,columns=["population_diff"])
+    prob = model.predict_proba(pop_range_df)[:, 1]
+
+    fig_cm, ax_cm = new_figure(figsize=(4, 3))
 
     sns.heatmap(
         cm,
@@ -80,11 +73,7 @@ def run_logistic(df, selected_district):
     # ------------------
     # 확률 곡선
     # ------------------
-    pop_range = np.linspace(df["population_diff"].min(), df["population_diff"].max(), 100).reshape(-1, 1)
-    pop_range_df = pd.DataFrame(pop_range,columns=["population_diff"])
-    prob = model.predict_proba(pop_range_df)[:, 1]
-
-    fig_prob, ax_prob = plt.subplots(figsize=(4, 3.3))
+    fig_prob, ax_prob = new_figure(figsize=(4, 3.3))
 
     ax_prob.plot(pop_range, prob)
     ax_prob.set_xlabel("인구 변화량")
@@ -1,13 +1,17 @@
 # analysis/population_car/regression.py
 
 import pandas as pd
-import matplotlib.pyplot as plt
 from sklearn.linear_model import LinearRegression
 
+from analysis.common.cache import cached_result
+from analysis.common.plotting import new_figure
+from analysis.population_car.data import load_panel
 
+
+@cached_result
 def run_regression(df, selected_district):
-    
-    df = df[df['district']==selected_district]
+    # 자치구 하나의 월별 값 (공유 패널에서 꺼냄)
+    df = load_panel(df).frame(selected_district, ["population_diff", "car_diff"])
     X = df[["population_diff"]]
     y = df["car_diff"]
     # ------------------
@@ -38,7 +42,7 @@ def run_regression(df, selected_district):
     # ------------------
     # 시각화
     # ------------------
-    fig, ax = plt.subplots(figsize=(4, 3))
+    fig, ax = new_figure(figsize=(4, 3))
 
     ax.scatter(X, y, alpha=0.4)
     ax.plot(X, model_raw.predict(X), color="red")
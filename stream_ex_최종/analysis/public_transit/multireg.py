@@ -6,7 +6,13 @@ from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import PolynomialFeatures, StandardScaler
 from sklearn.pipeline import Pipeline
 
+from analysis.common.cache import cached_result
+from analysis.common.metrics import track_fit
+from analysis.common.singleflight import single_flight
 
+@cached_result
+@single_flight
+@track_fit("run_multireg")
 def run_multireg(df):
     X = df[['bus', 'subway', 'taxi']]
     y = df['car_diff_year']
@@ -1,25 +1,11 @@
-import matplotlib.pyplot as plt
-import streamlit as st
-import matplotlib.font_manager as fm
-
-# ------------------
-# 한글 폰트 설정
-# ------------------
-def set_korean_font():
-    try:
-        font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-        font_name = fm.FontProperties(fname=font_path).get_name()
-        plt.rc("font", family=font_name)
-        plt.rcParams["axes.unicode_minus"] = False
-    except:
-        pass
+from analysis.common.cache import cached_result
+from analysis.common.plotting import new_figure
 
 
+@cached_result
 def run_visual_transit(df):
-    set_korean_font()
-
     # 1️⃣ 버스 vs 자동차 증감
-    fig1, ax1 = plt.subplots(figsize=(5.5, 4))
+    fig1, ax1 = new_figure(figsize=(5.5, 4))
     ax1.scatter(
         df['bus'],
         df['car_diff_year'],
@@ -32,7 +18,7 @@ def run_visual_transit(df):
     ax1.grid(alpha=0.3)
 
     # 2️⃣ 버스 vs 지하철
-    fig2, ax2 = plt.subplots(figsize=(5.5, 4))
+    fig2, ax2 = new_figure(figsize=(5.5, 4))
     ax2.scatter(
         df['bus'],
         df['subway'],
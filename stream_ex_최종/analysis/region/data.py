@@ -0,0 +1,16 @@
+# analysis/region/data.py
+
+from analysis.common.cache import cached_loader
+from analysis.region.engine import NATIONWIDE, monthly_counts
+from analysis.region.store import list_regions
+
+
+@cached_loader
+def load_regions():
+    regions = list_regions()
+    return [NATIONWIDE] + regions if regions else []
+
+
+@cached_loader
+def load_region_counts(sido=NATIONWIDE):
+    return monthly_counts(sido)
@@ -0,0 +1,60 @@
+# analysis/region/engine.py
+
+import pandas as pd
+
+from analysis.common.features import TOTAL_DISTRICT, VEHICLE_SERIES, yearly_features
+from analysis.common.schema import VEHICLE_COUNTS
+from analysis.region.store import PARTITION_ROOT, list_partitions, read_partition
+
+# 전국 (시도 구분 없이 합계)
+NATIONWIDE = "전국"
+
+
+# ------------------
+# 파티션 단위 집계
+# 파티션 하나씩 읽어서 부분 합계를 더함 → 메모리는 파티션 하나 + 집계 결과
+# ------------------
+def aggregate(by, sido=None, years=None, columns=VEHICLE_COUNTS, root=PARTITION_ROOT):
+    if sido == NATIONWIDE:
+        sido = None
+
+    total = None
+    for _, _, path in list_partitions(root, sido=sido, years=years):
+        part = read_partition(path, columns=list(by) + list(columns))
+        partial = part.groupby(list(by)).sum()
+        total = partial if total is None else total.add(partial, fill_value=0)
+
+    if total is None:
+        raise FileNotFoundError(f"파티션이 없습니다: {root} (시도={sido or NATIONWIDE})")
+
+    return total.astype("int64").sort_index().reset_index()
+
+
+def monthly_counts(sido=None, root=PARTITION_ROOT):
+    """년월별 차종×용도 합계 — vehicle 테이블과 같은 컬럼 (make_monthly_summary 입력)."""
+    return aggregate(["년월"], sido=sido, root=root)
+
+
+# ------------------
+# 기존 분석 함수 입력 형태로 변환
+# ------------------
+def to_month_frame(total_summary):
+    """make_monthly_summary 결과 → load_data_car_month 와 같은 형태 (ARIMA / 예측용)."""
+    df = pd.DataFrame({
+        "datetime": pd.to_datetime(total_summary["년월"].astype(str), format="%Y%m"),
+        "car_count_month": total_summary["등록합계"].to_numpy(),
+    })
+    df = df.set_index("datetime").sort_index().asfreq("MS")
+    df["car_diff_month"] = df["car_count_month"].diff()
+    return df
+
+
+def to_yearly(total_summary):
+    """make_monthly_summary 결과 → load_features(..., yearly=True) 와 같은 형태."""
+    long = total_summary.melt(
+        id_vars=["년월"], value_vars=VEHICLE_SERIES,
+        var_name="series", value_name="value"
+    )
+    long["datetime"] = pd.to_datetime(long["년월"].astype(str), format="%Y%m")
+    long["district_id"] = TOTAL_DISTRICT
+    return yearly_features(long[["series", "district_id", "datetime", "value"]])
@@ -0,0 +1,125 @@
+# analysis/region/raw.py
+
+import re
+
+from analysis.common.schema import VEHICLE_COUNTS, VEHICLE_KINDS, VEHICLE_USES
+
+# 국토부 자동차등록현황보고 시도별 원데이터 (cp949, 헤더 2줄)
+RAW_ENCODING = "cp949"
+RAW_HEADER_LINES = 2
+
+# 시도 합계 행 (시군구 행의 합이라 저장하지 않음)
+TOTAL_ROW = "계"
+
+# 행 하나의 값 순서: 차종별 (관용, 자가용, 영업용, 계) × 4 + 총계 (관용, 자가용, 영업용, 계)
+N_USES = len(VEHICLE_USES)
+N_VALUES = (len(VEHICLE_KINDS) + 1) * (N_USES + 1)
+
+_HEAD = re.compile(r"\d{1,3}")
+_GROUP = re.compile(r"\d{3}")
+
+
+# ------------------
+# 원데이터는 천 단위 쉼표가 따옴표 없이 들어 있어서 "161,219,173,14,071" 처럼
+# 값 경계가 사라짐 → 차종별 '계' / 총계 합계가 맞는 분할만 채택
+# ------------------
+def _numbers_at(tokens, i):
+    """tokens[i] 부터 시작하는 숫자 후보 (값, 다음 위치) — 짧은 것부터."""
+    if i >= len(tokens) or not _HEAD.fullmatch(tokens[i]):
+        return
+
+    value, j = int(tokens[i]), i + 1
+    yield value, j
+    if tokens[i] == "0":
+        return
+
+    while j < len(tokens) and _GROUP.fullmatch(tokens[j]):
+        value, j = value * 1000 + int(tokens[j]), j + 1
+        yield value, j
+
+
+def _checksum_ok(values):
+    n = len(values)
+    block = N_USES + 1
+
+    # 차종 / 총계 블록이 끝날 때: 계 = 관용 + 자가용 + 영업용
+    if n % block == 0 and values[-1] != sum(values[-block:-1]):
+        return False
+
+    # 마지막 값: 총계 블록 = 차종별 같은 용도의 합
+    if n == N_VALUES:
+        kinds = len(VEHICLE_KINDS)
+        for u in range(block):
+            if values[kinds * block + u] != sum(values[k * block + u] for k in range(kinds)):
+                return False
+    return True
+
+
+def split_values(tokens):
+    """쉼표로 잘린 토큰 → 값 N_VALUES 개. 합계가 맞는 분할이 하나가 아니면 ValueError."""
+    found = []
+
+    def search(i, values):
+        if len(found) > 1:
+            return
+        if len(values) == N_VALUES:
+            if i == len(tokens):
+                found.append(list(values))
+            return
+
+        for value, j in _numbers_at(tokens, i):
+            values.append(value)
+            if _checksum_ok(values):
+                search(j, values)
+            values.pop()
+
+    search(0, [])
+    if len(found) != 1:
+        raise ValueError(f"값을 분리할 수 없는 행 ({len(found)}가지 해석): {','.join(tokens)}")
+    return found[0]
+
+
+def parse_line(line):
+    """원데이터 한 줄 → dict (년월, 시도, 시군구, 차종×용도 12개). 시도 합계 행은 None."""
+    month, sido, sigungu, *tokens = line.strip().split(",")
+    if sigungu == TOTAL_ROW:
+        return None
+
+    values = split_values(tokens)
+    block = N_USES + 1
+    counts = [
+        values[k * block + u]
+        for k in range(len(VEHICLE_KINDS))
+        for u in range(N_USES)
+    ]
+
+    row = {
+        "년월": int(month.replace("-", "").strip()),
+        "시도": sido.strip(),
+        "시군구": sigungu.strip(),
+    }
+    row.update(zip(VEHICLE_COUNTS, counts))
+    return row
+
+
+def iter_chunks(path, chunk_rows):
+    """원데이터를 chunk_rows 줄씩 파싱해서 dict 리스트로 돌려줌 (파일 전체를 읽지 않음)."""
+    chunk = []
+    with open(path, encoding=RAW_ENCODING) as f:
+        for _ in range(RAW_HEADER_LINES):
+            next(f)
+
+        for line in f:
+            if not line.strip():
+                continue
+            row = parse_line(line)
+            if row is None:
+                continue
+
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                yield chunk
+                chunk = []
+
+    if chunk:
+        yield chunk
@@ -0,0 +1,108 @@
+# analysis/region/store.py
+
+import json
+import os
+import shutil
+import time
+
+import pandas as pd
+
+from analysis.region.raw import iter_chunks
+
+PARTITION_ROOT = os.environ.get("PARTITION_DIR", "partitions")
+CHUNK_ROWS = int(os.environ.get("PARTITION_CHUNK_ROWS", "5000"))
+MANIFEST_FILE = "manifest.json"
+
+# partitions/sido=<시도>/year=<연도>/part-<청크번호>.parquet
+SIDO_KEY = "sido"
+YEAR_KEY = "year"
+
+
+def partition_path(root, sido, year):
+    return os.path.join(root, f"{SIDO_KEY}={sido}", f"{YEAR_KEY}={year}")
+
+
+# ------------------
+# 원데이터 → 파티션
+# 청크 단위로 파싱해서 (시도, 연도) 별 part 파일로 바로 씀
+# → 메모리는 청크 하나 크기, 파일 전체를 올리지 않음
+# 새 디렉터리에 다 쓴 뒤 교체해서 읽는 쪽이 반쯤 만든 파티션을 보지 않음
+# ------------------
+def build_partitions(raw_path, root=PARTITION_ROOT, chunk_rows=CHUNK_ROWS):
+    tmp_root = root.rstrip(os.sep) + ".tmp"
+    if os.path.exists(tmp_root):
+        shutil.rmtree(tmp_root)
+
+    rows = 0
+    partitions = {}
+    for n, chunk in enumerate(iter_chunks(raw_path, chunk_rows)):
+        df = pd.DataFrame(chunk)
+        df["년월"] = df["년월"].astype("int32")
+        year = df["년월"] // 100
+
+        for (sido, y), part in df.groupby([df["시도"], year], sort=False):
+            path = partition_path(tmp_root, sido, y)
+            os.makedirs(path, exist_ok=True)
+            part.to_parquet(os.path.join(path, f"part-{n:05d}.parquet"), index=False)
+            key = f"{sido}/{y}"
+            partitions[key] = partitions.get(key, 0) + len(part)
+
+        rows += len(df)
+
+    with open(os.path.join(tmp_root, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump({
+            "source": os.path.basename(raw_path),
+            "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "rows": rows,
+            "partitions": partitions,
+        }, f, ensure_ascii=False, indent=2)
+
+    if os.path.exists(root):
+        shutil.rmtree(root)
+    os.replace(tmp_root, root)
+
+    return rows, len(partitions)
+
+
+def manifest(root=PARTITION_ROOT):
+    path = os.path.join(root, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ------------------
+# 파티션 목록 (디렉터리 이름으로 거름 → 필요 없는 파티션은 열지 않음)
+# ------------------
+def _value(dirname, key):
+    prefix = key + "="
+    return dirname[len(prefix):] if dirname.startswith(prefix) else None
+
+
+def list_partitions(root=PARTITION_ROOT, sido=None, years=None):
+    """[(시도, 연도, 경로)] — sido / years 로 가지치기."""
+    if not os.path.isdir(root):
+        return []
+
+    found = []
+    for sido_dir in sorted(os.listdir(root)):
+        name = _value(sido_dir, SIDO_KEY)
+        if name is None or (sido is not None and name != sido):
+            continue
+
+        for year_dir in sorted(os.listdir(os.path.join(root, sido_dir))):
+            year = _value(year_dir, YEAR_KEY)
+            if year is None or (years is not None and int(year) not in years):
+                continue
+            found.append((name, int(year), os.path.join(root, sido_dir, year_dir)))
+
+    return found
+
+
+def list_regions(root=PARTITION_ROOT):
+    return sorted({sido for sido, _, _ in list_partitions(root)})
+
+
+def read_partition(path, columns=None):
+    return pd.read_parquet(path, columns=columns)
@@ -0,0 +1,113 @@
+# analysis/report/render.py
+
+import base64
+import html
+import io
+import textwrap
+
+import matplotlib.image as mpimg
+import pandas as pd
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from analysis.common.plotting import setup_fonts
+
+CSS = """
+body { font-family: 'Malgun Gothic', 'NanumGothic', sans-serif; margin: 32px; color: #222; }
+h1 { border-bottom: 2px solid #444; padding-bottom: 8px; }
+h2 { margin-top: 40px; color: #1f4e79; }
+h3 { margin-bottom: 6px; }
+img { max-width: 100%; }
+table { border-collapse: collapse; font-size: 13px; }
+th, td { border: 1px solid #ccc; padding: 4px 8px; text-align: right; }
+pre { background: #f6f6f6; padding: 12px; overflow-x: auto; }
+.metric { display: inline-block; margin: 4px 24px 4px 0; font-size: 18px; }
+.error { color: #b00020; }
+.meta { color: #888; font-size: 12px; }
+"""
+
+
+# ------------------
+# HTML (이미지는 base64 로 내장 → 파일 하나로 배포 가능)
+# ------------------
+def _block_html(kind, label, value):
+    title = html.escape(str(label))
+
+    if kind == "figure":
+        data = base64.b64encode(value).decode("ascii")
+        return f'<h3>{title}</h3><img src="data:image/png;base64,{data}">'
+    if kind == "table":
+        return f"<h3>{title}</h3>" + value.to_html(float_format=lambda v: f"{v:,.4g}")
+    if kind == "metric":
+        return f'<div class="metric">{title}: <b>{html.escape(str(value))}</b></div>'
+    return f"<h3>{title}</h3><pre>{html.escape(str(value))}</pre>"
+
+
+def to_html(results, title, generated_at):
+    parts = [
+        "<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'>",
+        f"<title>{html.escape(title)}</title><style>{CSS}</style></head><body>",
+        f"<h1>{html.escape(title)}</h1>",
+        f"<p class='meta'>생성 시각: {generated_at}</p>",
+    ]
+
+    for result in results:
+        parts.append(f"<h2>{html.escape(result['title'])}</h2>")
+        parts.append(f"<p class='meta'>{result['seconds']}s</p>")
+
+        if result["error"]:
+            parts.append(f"<pre class='error'>{html.escape(result['error'])}</pre>")
+            continue
+
+        for kind, label, value in result["blocks"]:
+            parts.append(_block_html(kind, label, value))
+
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+# ------------------
+# PDF (A4 한 장에 블록 하나)
+# ------------------
+def _text_page(pdf, heading, body):
+    setup_fonts()
+    fig = Figure(figsize=(8.27, 11.69))
+    fig.text(0.05, 0.96, heading, fontsize=14, weight="bold", va="top")
+    fig.text(0.05, 0.92, body, fontsize=8, family="monospace", va="top")
+    pdf.savefig(fig)
+
+
+def _image_page(pdf, heading, png):
+    setup_fonts()
+    fig = Figure(figsize=(8.27, 11.69))
+    fig.text(0.05, 0.96, heading, fontsize=14, weight="bold", va="top")
+    ax = fig.add_axes([0.05, 0.05, 0.9, 0.85])
+    ax.imshow(mpimg.imread(io.BytesIO(png), format="png"))
+    ax.axis("off")
+    pdf.savefig(fig)
+
+
+def to_pdf(results, path, title):
+    with PdfPages(path) as pdf:
+        _text_page(pdf, title, "")
+
+        for result in results:
+            if result["error"]:
+                _text_page(pdf, result["title"], result["error"])
+                continue
+
+            metrics = []
+            for kind, label, value in result["blocks"]:
+                heading = f"{result['title']} - {label}"
+                if kind == "figure":
+                    _image_page(pdf, heading, value)
+                elif kind == "table":
+                    with pd.option_context("display.width", 120):
+                        _text_page(pdf, heading, value.to_string(max_rows=60))
+                elif kind == "metric":
+                    metrics.append(f"{label}: {value}")
+                else:
+                    _text_page(pdf, heading, textwrap.dedent(str(value)))
+
+            if metrics:
+                _text_page(pdf, result["title"], "\n".join(metrics))
@@ -0,0 +1,247 @@
+# analysis/report/sections.py
+
+import time
+import traceback
+
+import pandas as pd
+from matplotlib.figure import Figure
+
+from analysis.common.plotting import render_png
+
+# ------------------
+# 섹션 = app.py 의 메뉴 / 탭 하나
+# 각 빌더는 (종류, 제목, 내용) 블록 리스트를 돌려줌
+#   종류: "figure" | "table" | "text" | "metric"
+# ------------------
+
+
+def section_timeseries(district=None):
+    from analysis.car.data import load_data_car_month
+    from analysis.car.time import (
+        fit_arima, forecast_12_months, plot_diff_1,
+        plot_forecast, plot_monthly, stationarity_test
+    )
+
+    from analysis.common.features import load_features
+
+    df = load_data_car_month()
+    fig_diff, diff_1 = plot_diff_1(load_features(["car_count_month"]))
+    result = stationarity_test(diff_1)
+    arima_result = fit_arima(df)
+    forecast_mean, conf_int = forecast_12_months(arima_result, df.index[-1])
+
+    stationarity = pd.DataFrame({
+        "statistic": [result["adf_stat"], result["kpss_stat"]],
+        "p-value": [result["adf_p"], result["kpss_p"]],
+    }, index=["ADF", "KPSS"])
+
+    forecast = pd.concat([forecast_mean.rename("forecast"), conf_int], axis=1)
+
+    return [
+        ("figure", "월별 자동차 등록 추세", plot_monthly(df)),
+        ("figure", "1차 차분", fig_diff),
+        ("table", "정상성 검정", stationarity),
+        ("metric", "AIC", f"{arima_result.aic:.2f}"),
+        ("metric", "BIC", f"{arima_result.bic:.2f}"),
+        ("text", "ARIMA(1,1,1) 모델 요약", arima_result.summary().as_text()),
+        ("figure", "미래 12개월 예측", plot_forecast(df, forecast_mean, conf_int)),
+        ("table", "예측값", forecast),
+    ]
+
+
+def section_cctv_eda(district=None):
+    from analysis.cctv.data import load_data_cctv
+    from analysis.cctv.eda import (
+        plot_cctv_vs_death, plot_corr_heatmap,
+        plot_histograms, plot_severity_box
+    )
+
+    df = load_data_cctv()
+    num_cols = [
+        '사망자수(명)', '발생건수(건)', '부상자수(명)',
+        '사고당사망률', '사고당부상률', 'CCTV설치대수'
+    ]
+
+    return [
+        ("figure", "CCTV vs 사고당 사망률", plot_cctv_vs_death(df)),
+        ("figure", "변수 분포", plot_histograms(df, num_cols)),
+        ("figure", "심각도별 사망률", plot_severity_box(df)),
+        ("figure", "변수 간 상관계수", plot_corr_heatmap(df, num_cols)),
+    ]
+
+
+def section_cctv_model(district=None):
+    from analysis.cctv.data import load_data_cctv
+    from analysis.cctv.model import evaluate_model, train_model
+
+    df = load_data_cctv()
+    pipe, le, X_test, y_test = train_model(df)
+    eval_result = evaluate_model(pipe, X_test, y_test, le)
+
+    confusion = pd.DataFrame(
+        eval_result["confusion"], index=le.classes_, columns=le.classes_
+    )
+
+    return [
+        ("metric", "정확도", f"{eval_result['accuracy']:.3f}"),
+        ("text", "분류 리포트", eval_result["report"]),
+        ("table", "혼동 행렬", confusion),
+    ]
+
+
+def section_traffic(district=None):
+    from analysis.traffic_car.data import load_data_traffic
+    from analysis.traffic_car.traffic import (
+        analyze_correlation, make_yearly_summary, plot_traffic_growth_bar
+    )
+    from analysis.traffic_car.vehicle import make_monthly_summary, plot_vehicle_trend
+
+    from analysis.common.features import TOTAL_DISTRICT, VEHICLE_SERIES, load_features
+
+    df, df_traffic = load_data_traffic()
+    total_summary = make_monthly_summary(df)
+    yearly = load_features(VEHICLE_SERIES, [TOTAL_DISTRICT], yearly=True)
+    corr, fig_trend, fig_scatter = analyze_correlation(yearly, df_traffic)
+
+    return [
+        ("figure", "차종별 및 전체 자동차 등록 추이", plot_vehicle_trend(total_summary)),
+        ("table", "연도별 자동차 등록 요약", make_yearly_summary(yearly)),
+        ("figure", "연도별 교통량 증감률 비교", plot_traffic_growth_bar(df_traffic)),
+        ("metric", "상관계수", f"{corr:.3f}"),
+        ("figure", "교통량 vs 등록대수 증감률 추이", fig_trend),
+        ("figure", "교통량 vs 등록대수 산점도", fig_scatter),
+    ]
+
+
+def section_transit(district=None):
+    from analysis.public_transit.data import load_data_transit
+    from analysis.public_transit.multireg import run_multireg
+    from analysis.public_transit.visual_transit import run_visual_transit
+
+    df = load_data_transit()
+    fig_bus_car, fig_bus_sub = run_visual_transit(df)
+    base_df, ridge_df, degree_df, best_alpha = run_multireg(df)
+
+    return [
+        ("figure", "버스 이용량 vs 연간 자동차 증감", fig_bus_car),
+        ("figure", "버스 이용량 vs 지하철 이용량", fig_bus_sub),
+        ("table", "다항 회귀 성능 비교", base_df),
+        ("table", "Ridge 회귀 α 튜닝 결과", ridge_df),
+        ("metric", "Best alpha", best_alpha),
+        ("table", "차수별 모델 성능 비교", degree_df),
+    ]
+
+
+def section_population_cluster(district=None):
+    from analysis.population_car.cluster import run_clustering
+    from analysis.population_car.data import load_data
+
+    df = load_data()
+    df_cluster, summary_df, fig_bar, fig_scatter = run_clustering(df, "전체")
+
+    return [
+        ("table", "자치구별 군집 결과", df_cluster),
+        ("table", "군집 요약", summary_df),
+        ("figure", "자치구별 군집 분포", fig_scatter),
+        ("figure", "군집별 평균", fig_bar),
+    ]
+
+
+def section_population_district(district="전체"):
+    from analysis.population_car.data import load_data
+    from analysis.population_car.logistic import run_logistic
+    from analysis.population_car.regression import run_regression
+
+    df = load_data()
+    fig, desc, corr, coef_df, r2 = run_regression(df, district)
+    blocks = [
+        ("table", "기초 통계", desc),
+        ("table", "상관계수", corr),
+        ("table", "회귀 결과", coef_df),
+        ("metric", "R²", f"{r2:.3f}"),
+        ("figure", "인구 수 변화가 자동차 등록 증감에 미치는 영향", fig),
+    ]
+
+    try:
+        fig_cm, fig_prob, acc, coef = run_logistic(df, district)
+        blocks += [
+            ("metric", "로지스틱 정확도", f"{acc:.2%}"),
+            ("metric", "인구 변화 계수", f"{coef:.4f}"),
+            ("figure", "혼동 행렬", fig_cm),
+            ("figure", "자동차 등록 증가 확률 곡선", fig_prob),
+        ]
+    except ValueError as e:
+        # 증가/감소 한쪽 클래스만 있는 자치구는 로지스틱 불가
+        blocks.append(("text", "로지스틱 회귀", f"계산 불가: {e}"))
+
+    return blocks
+
+
+def section_parking(district=None):
+    from analysis.parking_car.data import load_data_parking
+    from analysis.parking_car.ridge import run_parking_poly_regression, run_ridge
+    from analysis.parking_car.visual_parking import (
+        plot_correlation, predict_future, run_parking_regression
+    )
+
+    df = load_data_parking()
+    fig_corr, r, p = plot_correlation(df)
+    fig_reg, model, metrics = run_parking_regression(df)
+    pred = predict_future(df)
+    fig_ridge, best_scores = run_ridge(df)
+    fig_poly, poly_model = run_parking_poly_regression(df, degree=2)
+
+    return [
+        ("figure", "상관 분석", fig_corr),
+        ("figure", "선형 회귀 분석", fig_reg),
+        ("table", "회귀 성능", pd.DataFrame([metrics]).round(3)),
+        ("table", f"{pred['year']}년 예측", pd.DataFrame([pred])),
+        ("figure", "Ridge 규제 강도", fig_ridge),
+        ("table", "최적 규제 강도 결과", pd.DataFrame([best_scores]).round(3)),
+        ("figure", "다항 회귀", fig_poly),
+    ]
+
+
+SECTIONS = {
+    "timeseries": ("📘 시계열 분석", section_timeseries),
+    "cctv_eda": ("📊 CCTV & 사고 - EDA", section_cctv_eda),
+    "cctv_model": ("🤖 사고 심각도 모델", section_cctv_model),
+    "traffic": ("🚗 교통량 vs 자동차", section_traffic),
+    "transit": ("🚌 대중교통 영향", section_transit),
+    "population_cluster": ("🏙 인구 기반 군집 분석", section_population_cluster),
+    "population": ("🏙 인구 기반 회귀 / 로지스틱", section_population_district),
+    "parking": ("🅿️ 주차면 분석", section_parking),
+}
+
+# 자치구별 리포트에 들어가는 섹션
+DISTRICT_SECTIONS = ["population"]
+
+
+# ------------------
+# 워커 프로세스 진입점: 그림은 PNG 로 바꿔서 돌려줌 (pickle 부담 감소)
+# ------------------
+def build_section(name, district=None):
+    title, builder = SECTIONS[name]
+    start = time.perf_counter()
+
+    try:
+        kwargs = {"district": district} if district is not None else {}
+        # 값이 None 인 블록 (그릴 데이터 없음) 은 빼고
+        blocks = [
+            (kind, label, render_png(value) if isinstance(value, Figure) else value)
+            for kind, label, value in builder(**kwargs)
+            if value is not None
+        ]
+        error = None
+    except Exception:
+        blocks = []
+        error = traceback.format_exc()
+
+    return {
+        "name": name,
+        "title": title,
+        "district": district,
+        "blocks": blocks,
+        "seconds": round(time.perf_counter() - start, 2),
+        "error": error,
+    }
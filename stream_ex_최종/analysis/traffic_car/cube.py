@@ -0,0 +1,71 @@
+# analysis/traffic_car/cube.py
+
+from itertools import combinations
+
+import pandas as pd
+
+from analysis.common.cache import cached_result
+
+# 큐브 차원 (vehicle_fact 컬럼 순서)
+DIMS = ("년월", "district_id", "차종", "용도")
+
+
+# ------------------
+# 롤업 큐브: 차원 부분집합 16개 각각의 합계를 미리 계산
+#   cube[("년월", "차종")] → 년월 × 차종 별 count 합
+#   cube[()]              → 전체 합
+# ------------------
+@cached_result
+def build_cube(fact):
+    # 가장 세밀한 집계 한 번 → 나머지는 이 결과에서 다시 합산 (원본 행 재스캔 없음)
+    base = fact.groupby(list(DIMS), observed=True, as_index=False)["count"].sum()
+
+    cube = {DIMS: base}
+    for r in range(len(DIMS) - 1, 0, -1):
+        for dims in combinations(DIMS, r):
+            cube[dims] = base.groupby(list(dims), observed=True, as_index=False)["count"].sum()
+
+    cube[()] = pd.DataFrame({"count": [base["count"].sum()]})
+    return cube
+
+
+# ------------------
+# 조각 조회
+#   rollup(cube, ["년월", "district_id"], where={"차종": "화물", "용도": "영업용"})
+#   where 값은 하나 또는 리스트
+# ------------------
+def rollup(cube, by, where=None):
+    where = where or {}
+    unknown = (set(by) | set(where)) - set(DIMS)
+    if unknown:
+        raise ValueError(f"알 수 없는 차원: {sorted(unknown)}")
+
+    # by + where 차원을 모두 가진 가장 작은 cuboid 선택
+    dims = tuple(d for d in DIMS if d in by or d in where)
+    frame = cube[dims]
+
+    for dim, value in where.items():
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        frame = frame[frame[dim].isin(values)]
+
+    if not by:
+        return int(frame["count"].sum())
+
+    return (
+        frame.groupby(list(by), observed=True, as_index=False)["count"].sum()
+        .sort_values(list(by))
+        .reset_index(drop=True)
+    )
+
+
+# ------------------
+# 월별 추이 표 (행: 년월, 열: by 값 또는 '합계')
+# ------------------
+def trend_table(cube, where=None, by=None):
+    frame = rollup(cube, ["년월"] + ([by] if by else []), where)
+    frame["년월"] = pd.to_datetime(frame["년월"].astype(str), format="%Y%m")
+
+    if not by:
+        return frame.set_index("년월").rename(columns={"count": "합계"})
+
+    return frame.pivot(index="년월", columns=by, values="count")
@@ -0,0 +1,62 @@
+# analysis/traffic_car/fact.py
+
+import pandas as pd
+from sqlalchemy import Integer, String, text
+
+from analysis.common.db import touch_table
+from analysis.common.schema import VEHICLE_COUNTS
+
+FACT_TABLE = "vehicle_fact"
+
+# (년월, district_id) 조회 / (차종, 용도) 조각 조회용 인덱스
+FACT_INDEXES = [
+    "CREATE UNIQUE INDEX ux_vehicle_fact ON vehicle_fact (년월, district_id, 차종, 용도)",
+    "CREATE INDEX ix_vehicle_fact_kind ON vehicle_fact (차종, 용도, 년월)",
+]
+
+
+# ------------------
+# wide (차종×용도 12개 컬럼) → long (년월, district_id, 차종, 용도, count)
+# ------------------
+def to_fact(df):
+    fact = df.melt(
+        id_vars=["년월", "district_id"],
+        value_vars=VEHICLE_COUNTS,
+        var_name="column",
+        value_name="count"
+    )
+
+    # 컬럼 이름 = 차종(2글자) + 용도
+    fact["차종"] = fact["column"].str[:2]
+    fact["용도"] = fact["column"].str[2:]
+
+    return fact[["년월", "district_id", "차종", "용도", "count"]]
+
+
+# ------------------
+# 적재 시 vehicle 과 함께 생성 (init_db.py / localdb)
+# ------------------
+def write_fact_table(engine, csv_path="data/vehicle.csv"):
+    fact = to_fact(pd.read_csv(csv_path))
+
+    fact.to_sql(
+        FACT_TABLE,
+        engine,
+        if_exists="replace",
+        index=False,
+        # MySQL 은 TEXT 컬럼에 인덱스를 못 걸어서 길이 지정
+        dtype={
+            "년월": Integer(),
+            "district_id": Integer(),
+            "차종": String(8),
+            "용도": String(8),
+            "count": Integer(),
+        }
+    )
+
+    with engine.begin() as conn:
+        for ddl in FACT_INDEXES:
+            conn.execute(text(ddl))
+
+    touch_table(engine, FACT_TABLE)
+    return len(fact)
@@ -0,0 +1,58 @@
+# analysis/traffic_car/parse.py
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# '2022년(양방)', '2023년 (양방)', '2022년(양방).1' (중복 컬럼) → 2022
+YEAR_COLUMN = re.compile(r"^(\d{4})\s*년")
+
+# 전체 지점 합계 행의 유형 이름
+TOTAL_TYPE = "계"
+
+
+def _to_number(s):
+    # "9,932" 같은 천 단위 구분 문자열 → 숫자
+    return pd.to_numeric(s.astype(str).str.replace(",", "").str.strip())
+
+
+# ------------------
+# 원본 교통량 표 → (유형, 지점, year, volume, growth) long 표
+#
+# 원본은 조사 기준(지점 구성)이 바뀔 때마다 전년도 값을 다시 적어서
+# 같은 연도 컬럼이 두 번 나옴: 2021, 2022 | 2022, 2023 | 2023, 2024
+# → 바로 옆 컬럼이 (Y-1, Y) 인 쌍을 같은 기준의 비교로 보고 증감률 계산
+# ------------------
+def traffic_long(raw):
+    year_cols = []
+    for col in raw.columns:
+        m = YEAR_COLUMN.match(str(col).strip())
+        if m:
+            year_cols.append((col, int(m.group(1))))
+
+    years = [year for _, year in year_cols]
+    pairs = [i for i in range(len(years) - 1) if years[i + 1] == years[i] + 1]
+    if not pairs:
+        raise ValueError("교통량 표에서 연속된 연도 컬럼을 찾지 못했습니다.")
+
+    volumes = raw[[col for col, _ in year_cols]].apply(_to_number).to_numpy(float)
+    prev = volumes[:, pairs]
+    curr = volumes[:, [i + 1 for i in pairs]]
+
+    # 모든 유형 × 연도 한 번에 계산 (원본 표와 같은 소수 둘째 자리)
+    growth = ((curr - prev) / prev * 100).round(2)
+
+    # 첫 해는 비교 대상이 없으므로 증감률 NaN
+    out_years = [years[pairs[0]]] + [years[i + 1] for i in pairs]
+    volume = np.column_stack([prev[:, 0], curr])
+    growth = np.column_stack([np.full(len(raw), np.nan), growth])
+
+    n_years = len(out_years)
+    return pd.DataFrame({
+        "유형": np.repeat(raw["구분(유형)"].astype(str).str.strip().to_numpy(), n_years),
+        "지점": np.repeat(_to_number(raw["지점"]).to_numpy(), n_years),
+        "year": np.tile(out_years, len(raw)),
+        "volume": volume.ravel(),
+        "growth": growth.ravel(),
+    })
@@ -1,43 +1,30 @@
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import seaborn as sns
 
-
-# ------------------
-# 한글 폰트 설정
-# ------------------
-def set_korean_font():
-    plt.rcParams['font.family'] = 'Malgun Gothic'
-    plt.rcParams['axes.unicode_minus'] = False
+from analysis.common.cache import cached_result
+from analysis.common.plotting import new_figure
+from analysis.traffic_car.parse import TOTAL_TYPE
 
 # =========================
 # 1. 연도별 등록대수 요약
 # =========================
-def make_yearly_summary(total_summary):
-    total_summary = total_summary.copy()
-    total_summary.columns = total_summary.columns.str.strip()
-
-    total_summary['년월'] = pd.to_numeric(
-        total_summary['년월'].astype(str).str.strip(),
-        errors='coerce'
-    )
-    total_summary['연도'] = total_summary['년월'] // 100
-
+@cached_result
+def make_yearly_summary(yearly):
+    # yearly: load_features(VEHICLE_SERIES, districts=[0], yearly=True)
     vehicle_columns = ['승용합계', '승합합계', '화물합계', '특수합계', '등록합계']
 
+    wide = yearly.pivot(index='year', columns='series')
     yearly_df = (
-        total_summary
-        .groupby('연도')[vehicle_columns]
-        .mean()
+        wide['mean'][vehicle_columns]
         .round(0)
         .astype(int)
+        .rename_axis(index='연도', columns=None)
         .reset_index()
     )
 
     yearly_df['전년대비_증감률(%)'] = (
-        yearly_df['등록합계'].pct_change() * 100
-    ).round(2)
+        wide['yoy_pct']['등록합계'].round(2).to_numpy()
+    )
 
     return yearly_df
 
@@ -45,23 +32,33 @@ def make_yearly_summary(total_summary):
 # =========================
 # 2. 교통량 증감률 막대그래프
 # =========================
+@cached_result
 def plot_traffic_growth_bar(df_traffic):
-    categories = df_traffic['구분(유형)'].tolist()
-    rate_22 = df_traffic['22증감률(%)'].tolist()
-    rate_23 = df_traffic['23증감률(%)'].tolist()
-    rate_24 = df_traffic['24증감률(%)'].tolist()
+    # 행: 유형 (원본 순서), 열: 증감률이 있는 연도
+    order = list(dict.fromkeys(df_traffic['유형']))
+    growth = (
+        df_traffic
+        .dropna(subset=['growth'])
+        .pivot(index='유형', columns='year', values='growth')
+        .reindex(order)
+    )
 
-    plt.rcParams['font.family'] = 'Malgun Gothic'
-    plt.rcParams['axes.unicode_minus'] = False
+    categories = growth.index.astype(str).tolist()
+    years = growth.columns.tolist()
+
+    # 조사 연도가 하나뿐이면 증감률이 모두 NaN → 그릴 연도가 없음
+    if not years:
+        return None
 
     x = np.arange(len(categories))
-    width = 0.25
+    width = 0.75 / len(years)
 
-    fig, ax = plt.subplots(figsize=(5, 3.5))
+    fig, ax = new_figure(figsize=(5, 3.5))
 
-    r1 = ax.bar(x - width, rate_22, width, label='22년')
-    r2 = ax.bar(x, rate_23, width, label='23년')
-    r3 = ax.bar(x + width, rate_24, width, label='24년')
+    bars = []
+    for i, year in enumerate(years):
+        offset = (i - (len(years) - 1) / 2) * width
+        bars.append(ax.bar(x + offset, growth[year], width, label=f'{year % 100}년'))
 
     ax.set_title('지점 유형별 연도별 교통량 증감률', fontsize=15)
     ax.set_ylabel('증감률 (%)')
@@ -70,7 +67,7 @@ def plot_traffic_growth_bar(df_traffic):
     ax.legend()
     ax.axhline(0, color='black')
 
-    for rects in [r1, r2, r3]:
+    for rects in bars:
         for r in rects:
             h = r.get_height()
             ax.text(
@@ -83,37 +80,43 @@ def plot_traffic_growth_bar(df_traffic):
             )
 
     ax.grid(axis='y', linestyle=':', alpha=0.6)
-    plt.tight_layout()
+    fig.tight_layout()
+
     return fig
 
 
 # =========================
 # 3. 상관관계 분석 + 시각화
 # =========================
-def analyze_correlation(total_summary, df_traffic):
-    total_summary['연도'] = total_summary['년월'] // 100
+@cached_result
+def analyze_correlation(yearly, df_traffic):
     yearly_reg = (
-        total_summary
-        .groupby('연도')['등록합계']
-        .mean()
-        .reset_index()
+        yearly[yearly['series'] == '등록합계']
+        .rename(columns={'year': '연도', 'mean': '등록합계', 'yoy_pct': '등록증감률'})
+        .astype({'연도': int})
     )
-    yearly_reg['등록증감률'] = yearly_reg['등록합계'].pct_change() * 100
 
-    target_years = [2022, 2023, 2024]
-    traffic_growth = df_traffic[['22증감률(%)','23증감률(%)','24증감률(%)']].iloc[0].values
-    reg_growth = yearly_reg[yearly_reg['연도'].isin(target_years)]['등록증감률'].values
+    # 전체 지점 합계의 증감률과 등록 증감률이 둘 다 있는 연도만 비교
+    traffic_growth = (
+        df_traffic[df_traffic['유형'] == TOTAL_TYPE]
+        .dropna(subset=['growth'])
+        .rename(columns={'year': '연도', 'growth': '교통량증감률'})
+        [['연도', '교통량증감률']]
+        .astype({'연도': int})
+    )
 
-    corr = pd.Series(traffic_growth).corr(pd.Series(reg_growth))
+    plot_df = (
+        traffic_growth
+        .merge(yearly_reg[['연도', '등록증감률']], on='연도')
+        .dropna()
+        .sort_values('연도')
+        .reset_index(drop=True)
+    )
 
-    plot_df = pd.DataFrame({
-        '연도': target_years,
-        '교통량증감률': traffic_growth,
-        '등록증감률': reg_growth
-    })
+    corr = plot_df['교통량증감률'].corr(plot_df['등록증감률'])
 
     # 추이 그래프
-    fig1, ax1 = plt.subplots(figsize=(6, 3.5))
+    fig1, ax1 = new_figure(figsize=(6, 3.5))
     ax1.plot(plot_df['연도'], plot_df['등록증감률'], marker='o', label='등록대수')
     ax1.plot(plot_df['연도'], plot_df['교통량증감률'], marker='s', linestyle='--', label='교통량')
     ax1.set_title('교통량 vs 등록대수 증감률 추이')
@@ -121,7 +124,7 @@ def analyze_correlation(total_summary, df_traffic):
     ax1.grid(True)
 
     # 산점도
-    fig2, ax2 = plt.subplots(figsize=(5, 3.5))
+    fig2, ax2 = new_figure(figsize=(5, 3.5))
     sns.regplot(
         x='교통량증감률',
         y='등록증감률',
@@ -1,13 +1,10 @@
 # traffic.py
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
-# ------------------
-# 한글 폰트 설정
-# ------------------
-def set_korean_font():
-    plt.rcParams['font.family'] = 'Malgun Gothic'
-    plt.rcParams['axes.unicode_minus'] = False
+from analysis.common.cache import cached_result
+from analysis.common.downsample import downsample, marker_for, max_points, thin_ticks
+from analysis.common.plotting import new_figure
 
 
 # ------------------
@@ -26,6 +23,7 @@ def add_vehicle_totals(df):
 # ------------------
 # 년월별 합계 행 생성
 # ------------------
+@cached_result
 def make_monthly_summary(df):
     df = add_vehicle_totals(df)  # ⭐ 여기서 다시 한 번 보장
 
@@ -48,19 +46,23 @@ def make_monthly_summary(df):
 # ------------------
 # 📈 시각화 함수 (fig 반환)
 # ------------------
+@cached_result
 def plot_vehicle_trend(total_summary):
-    set_korean_font()
+    labels = total_summary['년월'].astype(str).tolist()
+    pos = np.arange(len(labels))
 
-    fig, ax1 = plt.subplots(figsize=(14, 8))
+    fig, ax1 = new_figure(figsize=(14, 8))
+    n_points = max_points(fig)
 
     categories = ['승용합계', '승합합계', '화물합계', '특수합계']
     colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
 
     for i, cat in enumerate(categories):
+        x, y = downsample(pos, total_summary[cat], n_points)
         ax1.plot(
-            total_summary['년월'].astype(str),
-            total_summary[cat],
-            marker='o',
+            x,
+            y,
+            marker=marker_for(len(y)),
             label=cat,
             color=colors[i],
             linewidth=2
@@ -72,13 +74,14 @@ def plot_vehicle_trend(total_summary):
 
     # ▶ 보조축 (전체 등록합계)
     ax2 = ax1.twinx()
+    x, y = downsample(pos, total_summary['등록합계'], n_points)
     ax2.plot(
-        total_summary['년월'].astype(str),
-        total_summary['등록합계'],
+        x,
+        y,
         color='purple',
         linestyle='--',
         linewidth=3,
-        marker='s',
+        marker=marker_for(len(y), 's'),
         label='전체 등록합계'
     )
 
@@ -86,11 +89,10 @@ def plot_vehicle_trend(total_summary):
     ax2.tick_params(axis='y', labelcolor='purple')
     ax2.legend(loc='upper left', bbox_to_anchor=(0, 0.85))
 
-    ax1.set_xticks(range(len(total_summary)))
-    ax1.set_xticklabels(total_summary['년월'].astype(str), rotation=45)
+    thin_ticks(ax1, labels)
 
-    plt.title('주요 차종 및 전체 등록합계 증감 추이')
-    plt.grid(True, axis='y', linestyle=':', alpha=0.7)
-    plt.tight_layout()
+    ax2.set_title('주요 차종 및 전체 등록합계 증감 추이')
+    ax2.grid(True, axis='y', linestyle=':', alpha=0.7)
+    fig.tight_layout()
 
     return fig
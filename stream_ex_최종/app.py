@@ -1,13 +1,27 @@
+import functools
+import math
 import os
 os.environ["OMP_NUM_THREADS"] = "1"
 
 import streamlit as st
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
+
+from analysis.common.artifacts import artifact, serve_only
+from analysis.common.db import query_summary
+from analysis.common.deps import check_for_changes, generation
+from analysis.common.features import (
+    TOTAL_DISTRICT, VEHICLE_SERIES, load_feature_months, load_features
+)
+from analysis.common.metrics import FIGURE_RENDER_SECONDS, start_metrics_server
+from analysis.common.plotting import setup_fonts
+from analysis.common.prefetch import warm_status, warm_up
+from analysis.common.progressive import APPROX, STALE, Progressive
+from analysis.common.schema import VEHICLE_KINDS, VEHICLE_USES, memory_report
+from analysis.common.table import EXPORT_MIME, PAGE_SIZE, FrameSource, export_file
+from analysis.common.tasks import TaskFailed, run_tasks
 
 from analysis.car.time import (
-    fit_arima, forecast_12_months, plot_diff_1,
-    plot_forecast, plot_monthly, stationarity_test
+    APPROX_MONTHS, MIN_WINDOW_MONTHS, approx_arima, arima_summary, fit_arima,
+    forecast_12_months, plot_diff_1, plot_forecast, plot_monthly, stationarity_test
 )
 
 from analysis.cctv.data import load_data_cctv
@@ -16,11 +30,15 @@ from analysis.cctv.eda import (
     plot_histograms, plot_severity_box
 )
 from analysis.cctv.model import (
-    evaluate_model, predict_severity, train_model
+    APPROX_TREES, FEATURES, build_severity_model, evaluate_model, predict_severity
 )
+from analysis.cctv.batch import score_file, scored_file
 
-from analysis.car.data import load_data_car_month
-from analysis.traffic_car.data import load_data_traffic
+from analysis.car.data import (
+    car_month_frame, car_series, load_district_names, window_key
+)
+from analysis.traffic_car.cube import build_cube, trend_table
+from analysis.traffic_car.data import load_data_traffic, load_vehicle_fact
 from analysis.traffic_car.traffic import (
     analyze_correlation, make_yearly_summary, plot_traffic_growth_bar
 )
@@ -34,10 +52,15 @@ from analysis.parking_car.visual_parking import (
 )
 from analysis.parking_car.data import load_data_parking
 
-from analysis.population_car.cluster import run_clustering
+from analysis.population_car.cluster import APPROX_N_INIT, run_clustering
 from analysis.population_car.regression import run_regression
 from analysis.population_car.logistic import run_logistic
-from analysis.population_car.data import load_data
+from analysis.population_car.data import (
+    anomaly_event_source, load_anomaly_events, load_data
+)
+
+from analysis.region.data import load_region_counts, load_regions
+from analysis.region.engine import to_month_frame, to_yearly
 
 from analysis.public_transit.data import load_data_transit
 from analysis.public_transit.visual_transit import run_visual_transit
@@ -51,15 +74,97 @@ st.set_page_config(
     layout="wide"
 )
 
-st.cache_data.clear()  
-
-plt.rc("font", family="Malgun Gothic")
-plt.rcParams["axes.unicode_minus"] = False
+setup_fonts()
+start_metrics_server()
+
+# 바뀐 CSV / 테이블에 의존하는 캐시만 비움
+if not serve_only():
+    cleared = check_for_changes()
+    if cleared:
+        st.toast(f"데이터 변경 감지: {len(cleared)}개 캐시 갱신")
+
+
+def show_figure(fig):
+    # 캐시 / 아티팩트에서 온 그림은 미리 인코딩된 PNG
+    if isinstance(fig, bytes):
+        st.image(fig, width="stretch")
+        return
+
+    with FIGURE_RENDER_SECONDS.time():
+        st.pyplot(fig)
+
+
+# ------------------
+# 지연 탭: 선택된 탭의 본문만 실행 (탭을 바꾸면 rerun)
+# 다른 탭 결과는 캐시에 남아 있어서 다시 열 때 바로 표시
+# ------------------
+def lazy_tabs(labels, key):
+    return st.tabs(labels, key=key, on_change="rerun")
+
+
+def is_open(tab):
+    # .open 을 지원하지 않는 streamlit 에서는 모든 탭 실행
+    return getattr(tab, "open", None) is not False
+
+
+# ------------------
+# 페이지 안의 독립적인 분석 호출을 동시에 실행
+# 실패한 작업은 그 자리에만 오류 표시
+# ------------------
+def page_tasks(tasks, key=None):
+    # key: 같은 함수를 선택값별로 따로 저장할 때 (serve-only 아티팩트 이름)
+    run = functools.partial(artifact, key=key)
+    return run_tasks({
+        name: (run, *spec) for name, spec in tasks.items()
+    })
+
+
+def task_ok(value):
+    if isinstance(value, TaskFailed):
+        st.error(f"분석 실패: {value.error}")
+        return False
+    return True
+
+
+def show_state(state, approx_note=None):
+    # 점진 렌더링: 지금 보이는 결과가 근사 / 이전 데이터 결과면 표시
+    if state == APPROX:
+        st.caption(f"⚡ 근사 결과 ({approx_note}) — 정밀 결과 계산 중")
+    elif state == STALE:
+        st.caption("🕘 이전 데이터 기준 결과 — 최신 데이터로 다시 계산 중")
+
+
+# ------------------
+# Home 에 있는 동안 다른 페이지의 로더 / 가벼운 파생 결과를 백그라운드로 캐시에 올림
+# (페이지와 같은 인자로 호출해야 같은 캐시 항목이 채워짐)
+# ------------------
+def warm_car_window(district_id=TOTAL_DISTRICT):
+    # 시계열 페이지 기본값 (서울시 전체, 전체 기간) 과 같은 인자
+    series = car_series(district_id)
+    months = load_feature_months(series, district_id)
+    if not months:
+        # feature store 가 아직 없음 (init_db.py 전) → 데울 구간 없음
+        return None
+    return load_features([series], [district_id], start=months[0], end=months[-1])
+
+
+WARM_UP_TASKS = {
+    "load_district_names": load_district_names,
+    "car_window": warm_car_window,
+    "load_data_cctv": load_data_cctv,
+    "load_data_traffic": load_data_traffic,
+    "load_vehicle_fact": load_vehicle_fact,
+    "load_data_transit": load_data_transit,
+    "load_data": load_data,
+    "load_data_parking": load_data_parking,
+    "load_regions": load_regions,
+    "monthly_summary": lambda: make_monthly_summary(load_data_traffic()[0]),
+    "yearly_summary": lambda: make_yearly_summary(
+        load_features(VEHICLE_SERIES, [TOTAL_DISTRICT], yearly=True)
+    ),
+    "vehicle_cube": lambda: build_cube(load_vehicle_fact()),
+}
 
-font_path = "/usr/share/fonts/truetype/nanum/NanumGothic.ttf"
-if os.path.exists(font_path):
-    font_name = fm.FontProperties(fname=font_path).get_name()
-    plt.rc("font", family=font_name)
 
 def load_css(file_name):
     with open(file_name, encoding="utf-8") as f:
@@ -67,6 +172,234 @@ def load_css(file_name):
 
 load_css("styles/style.css")
 
+
+# ------------------
+# fragment: 위젯을 바꾸면 이 함수만 다시 실행
+# (폰트 / CSS / 데이터 로딩 / 페이지의 다른 그림은 그대로)
+# ------------------
+@st.fragment
+def severity_prediction(compiled, le):
+    st.subheader("🔮 사고 심각도 예측")
+
+    # 입력값은 제출할 때 한 번에 반영
+    with st.form("severity_form"):
+        sample = {
+            '발생건수(건)': st.number_input("발생 건수", 0, 10000, 1500),
+            '부상자수(명)': st.number_input("부상자 수", 0, 10000, 2000),
+            '사고당사망률': st.number_input("사고당 사망률", 0.0, 1.0, 0.01, format="%.3f"),
+            '사고당부상률': st.number_input("사고당 부상률", 0.0, 10.0, 1.4),
+            'CCTV설치대수': st.number_input("CCTV 설치 대수", 0, 5000, 300)
+        }
+        st.form_submit_button("예측")
+
+    pred = predict_severity(compiled, le, sample)
+    st.success(f"예측 사고 심각도: **{pred}**")
+
+
+@st.fragment
+def batch_prediction(compiled, le):
+    st.subheader("📂 일괄 예측 (CSV / Parquet)")
+    st.caption("필수 컬럼: " + ", ".join(FEATURES))
+
+    uploaded = st.file_uploader(
+        "자치구 데이터 파일 업로드",
+        type=["csv", "parquet"]
+    )
+
+    if uploaded is not None:
+        try:
+            # 화면에는 건수 / 분포만 — 결과 파일은 다운로드를 누를 때 다시 청크 단위로 만듦
+            with st.spinner("일괄 예측 중..."):
+                batch_result = score_file(compiled, le, uploaded, uploaded.name)
+        except ValueError as e:
+            st.error(str(e))
+            return
+
+        st.success(f"총 {batch_result['rows']:,}건 예측 완료")
+        st.write(batch_result["counts"])
+
+        st.download_button(
+            "⬇ 예측 결과 다운로드",
+            data=functools.partial(scored_file, compiled, le, uploaded, uploaded.name),
+            file_name="severity_prediction.csv",
+            mime="text/csv",
+            on_click="ignore"
+        )
+
+
+# ------------------
+# 서버 쪽 정렬 / 검색 / 페이지 표: 보이는 페이지만 브라우저로 보냄
+# 내보내기는 버튼을 눌렀을 때만 전체 결과를 청크 단위로 파일에 씀
+# ------------------
+@st.fragment
+def paged_table(source, key, file_name):
+    col1, col2, col3, col4 = st.columns([2, 1, 2, 2])
+    with col1:
+        sort = st.selectbox(
+            "정렬", [None, *source.columns], key=f"{key}_sort",
+            format_func=lambda c: "기본 순서" if c is None else c
+        )
+    with col2:
+        ascending = st.toggle("오름차순", value=True, key=f"{key}_asc")
+    with col3:
+        column = st.selectbox("검색 컬럼", source.columns, key=f"{key}_column")
+    with col4:
+        value = st.text_input("검색어", key=f"{key}_search")
+    search = (column, value) if value else None
+
+    total = source.count(search)
+    n_pages = max(1, math.ceil(total / PAGE_SIZE))
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page = min(st.number_input("페이지", min_value=1, value=1, key=f"{key}_page"), n_pages)
+    with col2:
+        st.caption(f"{total:,}행 · {page}/{n_pages} 페이지")
+
+    st.dataframe(
+        source.page(sort, ascending, search, (page - 1) * PAGE_SIZE, PAGE_SIZE),
+        hide_index=True
+    )
+
+    for col, fmt in zip(st.columns(len(EXPORT_MIME)), EXPORT_MIME):
+        with col:
+            st.download_button(
+                f"⬇ {fmt.upper()} 내보내기",
+                data=functools.partial(export_file, source, fmt, sort, ascending, search),
+                file_name=f"{file_name}.{fmt}",
+                mime=EXPORT_MIME[fmt],
+                key=f"{key}_{fmt}",
+                on_click="ignore"
+            )
+
+
+@st.fragment
+def vehicle_slice(cube, district_names):
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        kinds = st.multiselect("차종", VEHICLE_KINDS, default=["화물"])
+    with col2:
+        uses = st.multiselect("용도", VEHICLE_USES, default=["영업용"])
+    with col3:
+        by_district = st.toggle("자치구별", value=True)
+
+    if not kinds or not uses:
+        st.info("차종과 용도를 하나 이상 선택하세요.")
+        return
+
+    # 미리 집계된 큐브에서 바로 조회 (원본 행 재스캔 없음)
+    table = trend_table(
+        cube,
+        where={"차종": kinds, "용도": uses},
+        by="district_id" if by_district else None
+    )
+    table = table.rename(columns=district_names)
+
+    st.line_chart(table)
+    paged_table(FrameSource(table), "vehicle_slice", "vehicle_slice")
+
+
+@st.fragment
+def population_panels(df, district_list):
+    progress = Progressive()
+
+    selected_district = st.selectbox(
+        "자치구 선택",
+        district_list
+    )
+    st.toast(f"{selected_district} 분석 실행됨")
+
+    tab1, tab2, tab3 = lazy_tabs([
+        "📊 군집 분석",
+        "📈 회귀 분석",
+        "🧠 로지스틱 회귀"
+    ], key="population_tab")
+
+    # ------------------
+    # 군집
+    # ------------------
+    if is_open(tab1):
+        with tab1:
+            st.markdown("### 📊 군집 분석")
+
+            if selected_district != "전체":
+                st.warning("⚠️ 군집 분석은 전체 선택 시만 가능합니다.")
+            else:
+                (df_cluster, summary_df, fig_bar, fig_scatter), cluster_state = progress.result(
+                    run_clustering, df, selected_district,
+                    approx=lambda: run_clustering(df, selected_district, n_init=APPROX_N_INIT)
+                )
+                show_state(cluster_state, f"KMeans 초기값 {APPROX_N_INIT}회")
+
+                st.subheader("📋 자치구별 군집 결과")
+                paged_table(FrameSource(df_cluster), "cluster", "district_cluster")
+
+                st.subheader("📊 군집 요약")
+                st.dataframe(summary_df)
+
+            
+                col1, col2 = st.columns(2)
+                with col1:
+                    show_figure(fig_scatter)
+                with col2:
+                    show_figure(fig_bar)
+    # ------------------
+    # 회귀
+    # ------------------
+    if is_open(tab2):
+        with tab2:
+            st.markdown("### 📈 선형 회귀 분석")
+
+            fig, desc, corr, coef_df, r2 = artifact(
+                run_regression, df, selected_district, key=selected_district
+            )
+
+            st.markdown("#### 📊 기초 통계")
+            st.dataframe(desc)
+
+            st.markdown("#### 🔗 상관계수")
+            st.dataframe(corr)
+
+            st.markdown("#### 📈 회귀 결과")
+            st.dataframe(coef_df)
+
+            st.markdown("#### 📊 모델 성능 (R²)")
+            col1, col2, col3 = st.columns(3)
+            col1.metric(" ",f"{r2:.3f}")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("#### 인구 수 변화가 자동차 등록 증감에 미치는 영향")
+                show_figure(fig)
+        
+    # ------------------
+    # 로지스틱
+    # ------------------
+    if is_open(tab3):
+        with tab3:
+            st.markdown("### 🧠 로지스틱 회귀 분석")
+
+            fig_cm, fig_prob, acc, coef = artifact(
+                run_logistic, df, selected_district, key=selected_district
+            )
+
+            st.metric("모델 정확도", f"{acc:.2%}")
+
+            st.markdown("#### 📐 회귀 계수")
+            st.write(f"인구 변화 계수: **{coef:.4f}**")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("#### 🔍 혼동 행렬")
+                show_figure(fig_cm)
+            with col2:
+                st.markdown("#### 📈 자동차 등록 증가 확률 곡선")
+                show_figure(fig_prob)
+
+    # fragment 만 다시 실행될 때도 정밀 결과로 교체되도록
+    progress.refresh()
+
+
 st.markdown("## 🚦 서울시 교통 데이터 분석 프로젝트")
 st.caption(
     "자동차 등록 · 교통량 · CCTV · 인구 · 대중교통 데이터를 활용한 종합 분석 대시보드"
@@ -84,11 +417,23 @@ menu = st.sidebar.radio(
         "🚗 교통량 vs 자동차",
         "🚌 대중교통 영향",
         "🏙 인구 기반 분석",
-        "🅿️ 주차면 분석"
+        "🅿️ 주차면 분석",
+        "🗺 지역별 등록 분석"
     ],
     label_visibility="collapsed"
 )
 
+# 무거운 분석은 근사 결과부터 표시하고 정밀 결과는 백그라운드에서 (페이지 끝에서 교체)
+progress = Progressive()
+
+if serve_only():
+    st.sidebar.caption("📦 serve-only: 미리 계산된 결과 표시 중")
+else:
+    with st.sidebar.expander("🛠 쿼리 통계"):
+        st.dataframe(query_summary(), hide_index=True)
+    with st.sidebar.expander("🛠 메모리"):
+        st.dataframe(memory_report(), hide_index=True)
+
 if menu == "🏠 Home":
 
     st.markdown("### 📌 분석 주제 개요")
@@ -112,346 +457,452 @@ if menu == "🏠 Home":
 
     st.info("⬅ 좌측 메뉴에서 분석을 선택하세요.")
 
+    if not serve_only():
+        warm_up(WARM_UP_TASKS, generation=generation())
+        status = warm_status()
+        if status["done"] < status["total"]:
+            st.caption(f"🔥 다른 페이지 데이터 미리 불러오는 중 ({status['done']}/{status['total']})")
+        elif status["failed"]:
+            st.caption(f"⚠️ 미리 불러오기 실패: {', '.join(status['failed'])}")
+
+    st.markdown("### 🚨 이상 변동 알림")
+    st.caption("자치구별 월간 자동차 · 인구 증감 중 평소와 크게 다른 달")
+
+    # serve-only 는 DB 없이 미리 저장한 최근 이벤트만
+    if serve_only():
+        events = artifact(load_anomaly_events)
+        source = None if events.empty else FrameSource(
+            events[["datetime", "district", "metric", "value", "method", "score"]]
+        )
+    else:
+        source = anomaly_event_source()
+
+    if source is None or source.count() == 0:
+        st.success("감지된 이상 변동이 없습니다.")
+    else:
+        paged_table(source, "anomaly", "anomaly_events")
+
 elif menu == "📘 시계열 분석":
 
-    df = load_data_car_month()
+    district_names = artifact(load_district_names)
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        district_id = st.selectbox(
+            "지역 선택",
+            list(district_names),
+            format_func=lambda i: "서울시 전체" if i == TOTAL_DISTRICT else district_names[i]
+        )
+    region = "서울시" if district_id == TOTAL_DISTRICT else district_names[district_id]
+    series = car_series(district_id)
+
+    months = artifact(load_feature_months, series, district_id, key=district_id)
+    if not months:
+        st.info("이 지역의 월별 데이터가 없습니다. `python init_db.py` 로 feature store 를 먼저 만들어 주세요.")
+        st.stop()
+
+    with col2:
+        # serve-only 는 지역별 전체 기간만 미리 계산되어 있음
+        start, end = st.select_slider(
+            "기간",
+            options=months,
+            value=(months[0], months[-1]),
+            format_func=lambda m: m.strftime("%Y-%m"),
+            disabled=serve_only()
+        )
+
+    n_months = months.index(end) - months.index(start) + 1
+    if n_months < MIN_WINDOW_MONTHS:
+        st.info(f"기간을 {MIN_WINDOW_MONTHS}개월 이상 선택하세요. (현재 {n_months}개월)")
+        st.stop()
+
+    # 선택한 지역 / 구간만 인덱스 범위로 조회 → 구간별로 캐시
+    window = window_key(district_id, start, end)
+    features = artifact(
+        load_features, [series], [district_id], start=start, end=end, key=window
+    )
+    df = car_month_frame(features)
+
+    # ARIMA 는 정밀 적합을 백그라운드로 보내고, 오래 걸리면 최근 구간 근사 모델부터 표시
+    arima_result, arima_state = progress.result(
+        fit_arima, df, approx=lambda: approx_arima(df), key=window
+    )
+
+    # 추세 / 차분은 서로 독립 → 동시에 계산
+    results = page_tasks({
+        "monthly": (plot_monthly, df, region),
+        "diff": (plot_diff_1, features, region),
+    }, key=window)
 
+    diff_1 = None
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("📈 월별 자동차 등록 추세")
-        fig1 = plot_monthly(df)
-        st.pyplot(fig1)
+        if task_ok(results["monthly"]):
+            show_figure(results["monthly"])
     with col2:
         st.subheader("📉 1차 차분")
-        fig2, diff_1 = plot_diff_1(df)
-        st.pyplot(fig2)
+        if task_ok(results["diff"]):
+            fig2, diff_1 = results["diff"]
+            show_figure(fig2)
 
-    st.subheader("🧪 정상성 검정")
-    result = stationarity_test(diff_1)
+    if diff_1 is not None:
+        st.subheader("🧪 정상성 검정")
+        result = artifact(stationarity_test, diff_1, key=window)
 
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown("### ADF Test")
-        st.write(f"ADF Statistic: **{result['adf_stat']:.4f}**")
-        st.write(f"p-value: **{result['adf_p']:.4f}**")
-        st.json(result['adf_crit'])
-    with col2:
-        st.markdown("### KPSS Test")
-        st.write(f"KPSS Statistic: **{result['kpss_stat']:.4f}**")
-        st.write(f"p-value: **{result['kpss_p']:.4f}**")
-        st.json(result['kpss_crit'])
-    
-    arima_result = fit_arima(df)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.markdown("### ADF Test")
+            st.write(f"ADF Statistic: **{result['adf_stat']:.4f}**")
+            st.write(f"p-value: **{result['adf_p']:.4f}**")
+            st.json(result['adf_crit'])
+        with col2:
+            st.markdown("### KPSS Test")
+            st.write(f"KPSS Statistic: **{result['kpss_stat']:.4f}**")
+            st.write(f"p-value: **{result['kpss_p']:.4f}**")
+            st.json(result['kpss_crit'])
 
     st.subheader("📊 ARIMA(1,1,1) 모델 요약")
+    show_state(arima_state, f"최근 {APPROX_MONTHS}개월로 적합한 모델")
+
     col1, col2, col3 = st.columns(3)
     col1.metric("AIC", f"{arima_result.aic:.2f}")
     col2.metric("BIC", f"{arima_result.bic:.2f}")
     col3.metric("관측치 수", arima_result.nobs)
 
     with st.expander("📄 ARIMA 상세 결과 (원본)"):
-        st.text(arima_result.summary().as_text())
+        st.text(artifact(arima_summary, arima_result, key=window))
 
     st.subheader("🔮 미래 12개월 자동차 등록 대수 예측")
 
-    forecast_mean, conf_int = forecast_12_months(
+    forecast_mean, conf_int = artifact(
+        forecast_12_months,
         arima_result,
-        df.index[-1]
+        df.index[-1],
+        key=window
     )
 
-    fig_forecast = plot_forecast(df, forecast_mean, conf_int)
-    st.pyplot(fig_forecast)
+    fig_forecast = artifact(
+        plot_forecast, df, forecast_mean, conf_int, region, key=window
+    )
+    show_figure(fig_forecast)
 
 elif menu == "📊 CCTV & 사고":
     st.header("📊 교통 관련 CCTV 갯수 / 설치된 CCTV 지역의 사고건수 분석")
-    df = load_data_cctv()
+    df = artifact(load_data_cctv)
 
-    tabs = st.tabs([
+    tabs = lazy_tabs([
         "📊 EDA",
         "🔥 상관관계",
         "🤖 사고 심각도 모델"
-    ])
+    ], key="cctv_tab")
 
     num_cols = [
         '사망자수(명)', '발생건수(건)', '부상자수(명)',
         '사고당사망률', '사고당부상률', 'CCTV설치대수'
     ]
 
-    with tabs[0]:
-        col1, col2 = st.columns(2)
-        with col1:
-            st.subheader("CCTV vs 사고당 사망률")
-            st.pyplot(plot_cctv_vs_death(df))
-        
-
-        st.subheader("변수 분포")
-        st.pyplot(plot_histograms(df, num_cols))
+    if is_open(tabs[0]):
+        with tabs[0]:
+            results = page_tasks({
+                "cctv_vs_death": (plot_cctv_vs_death, df),
+                "histograms": (plot_histograms, df, num_cols),
+                "severity_box": (plot_severity_box, df),
+            })
 
-        col1, col2 = st.columns(2)
-        with col1:
-            st.subheader("심각도별 사망률")
-            st.pyplot(plot_severity_box(df))
+            col1, col2 = st.columns(2)
+            with col1:
+                st.subheader("CCTV vs 사고당 사망률")
+                if task_ok(results["cctv_vs_death"]):
+                    show_figure(results["cctv_vs_death"])
+        
 
-    with tabs[1]:
-        st.subheader("변수 간 상관계수")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.pyplot(plot_corr_heatmap(df, num_cols))        
+            st.subheader("변수 분포")
+            if task_ok(results["histograms"]):
+                show_figure(results["histograms"])
 
-    with tabs[2]:
-        pipe, le, X_test, y_test = train_model(df)
-        eval_result = evaluate_model(pipe, X_test, y_test, le)
+            col1, col2 = st.columns(2)
+            with col1:
+                st.subheader("심각도별 사망률")
+                if task_ok(results["severity_box"]):
+                    show_figure(results["severity_box"])
 
-        st.metric("정확도", f"{eval_result['accuracy']:.3f}")
+    if is_open(tabs[1]):
+        with tabs[1]:
+            st.subheader("변수 간 상관계수")
+            col1, col2 = st.columns(2)
+            with col1:
+                show_figure(artifact(plot_corr_heatmap, df, num_cols))        
 
-        with st.expander("📄 분류 리포트"):
-            st.text(eval_result['report'])
+    if is_open(tabs[2]):
+        with tabs[2]:
+            # 트리 200개 정밀 모델은 백그라운드, 그동안 트리 수를 줄인 근사 모델로 표시 / 예측
+            (pipe, le, X_test, y_test, compiled), model_state = progress.result(
+                build_severity_model, df,
+                approx=lambda: build_severity_model(df, APPROX_TREES)
+            )
+            eval_result = artifact(evaluate_model, pipe, X_test, y_test, le)
 
-        st.subheader("🔮 사고 심각도 예측")
+            st.metric("정확도", f"{eval_result['accuracy']:.3f}")
+            show_state(model_state, f"트리 {APPROX_TREES}개 모델")
 
-        sample = {
-            '발생건수(건)': st.number_input("발생 건수", 0, 10000, 1500),
-            '부상자수(명)': st.number_input("부상자 수", 0, 10000, 2000),
-            '사고당사망률': st.number_input("사고당 사망률", 0.0, 1.0, 0.01, format="%.3f"),
-            '사고당부상률': st.number_input("사고당 부상률", 0.0, 10.0, 1.4),
-            'CCTV설치대수': st.number_input("CCTV 설치 대수", 0, 5000, 300)
-        }
+            with st.expander("📄 분류 리포트"):
+                st.text(eval_result['report'])
 
-        pred = predict_severity(pipe, le, sample)
-        st.success(f"예측 사고 심각도: **{pred}**")
+            severity_prediction(compiled, le)
+            batch_prediction(compiled, le)
 
 elif menu == "🚗 교통량 vs 자동차":
     st.header("📈 자동차 등록과 교통량 관계 분석")
     
-    df, df_traffic = load_data_traffic()
-    total_summary = make_monthly_summary(df)
+    df, df_traffic = artifact(load_data_traffic)
+    total_summary = artifact(make_monthly_summary, df)
+    yearly = artifact(
+        load_features, VEHICLE_SERIES, [TOTAL_DISTRICT], yearly=True, key="vehicle_yearly"
+    )
 
-    tab1, tab2, tab3, tab4 = st.tabs([
+    tab1, tab2, tab3, tab4, tab5 = lazy_tabs([
         "📊 차종별 및 전체 자동차 등록 추이",
         "📊 교통량 증감 시각화",
         "📈 자동차 등록과 교통량 관계 분석",
+        "🔎 차종·용도별 조회",
         "📈 test page"
-    ])
-
-    with tab1:
-        st.subheader("📊 차종별 및 전체 자동차 등록 추이")
-
-        fig_trend_all = plot_vehicle_trend(total_summary)
-        st.pyplot(fig_trend_all)
-
-        st.subheader("📋 연도별 자동차 등록 요약")
-        yearly_df = make_yearly_summary(total_summary)
-        st.dataframe(yearly_df)
-
-    with tab2:
-        st.subheader("📊 연도별 교통량 증감률 비교")
-
-        fig_bar = plot_traffic_growth_bar(df_traffic)
-        col1, col2 = st.columns(2)
-        with col1:
-            st.pyplot(fig_bar)
+    ], key="traffic_tab")
+
+    if is_open(tab1):
+        with tab1:
+            results = page_tasks({
+                "trend": (plot_vehicle_trend, total_summary),
+                "yearly": (make_yearly_summary, yearly),
+            })
+
+            st.subheader("📊 차종별 및 전체 자동차 등록 추이")
+            if task_ok(results["trend"]):
+                show_figure(results["trend"])
+
+            st.subheader("📋 연도별 자동차 등록 요약")
+            if task_ok(results["yearly"]):
+                paged_table(FrameSource(results["yearly"]), "vehicle_yearly", "vehicle_yearly")
+
+    if is_open(tab2):
+        with tab2:
+            st.subheader("📊 연도별 교통량 증감률 비교")
+
+            fig_bar = artifact(plot_traffic_growth_bar, df_traffic)
+            if fig_bar is None:
+                st.info("증감률을 계산할 수 있는 연도가 없습니다. (조사 연도가 2개 이상 필요)")
+            else:
+                col1, col2 = st.columns(2)
+                with col1:
+                    show_figure(fig_bar)
         
 
-    with tab3:
-        st.subheader("📈 교통량 증가와 자동차 등록 증가의 관계")
+    if is_open(tab3):
+        with tab3:
+            st.subheader("📈 교통량 증가와 자동차 등록 증가의 관계")
 
-        corr, fig_trend, fig_scatter = analyze_correlation(
-            total_summary,
-            df_traffic
-        )
+            corr, fig_trend, fig_scatter = artifact(
+                analyze_correlation,
+                yearly,
+                df_traffic
+            )
 
-        st.metric("상관계수", f"{corr:.3f}")
+            st.metric("상관계수", f"{corr:.3f}")
 
-        col1, col2 = st.columns(2)
-        with col1:
-            st.pyplot(fig_trend)
-        with col2:
-            st.pyplot(fig_scatter)
+            col1, col2 = st.columns(2)
+            with col1:
+                show_figure(fig_trend)
+            with col2:
+                show_figure(fig_scatter)
             
-    with tab4:
-        st.subheader("📊 test")
+    if is_open(tab4):
+        with tab4:
+            st.subheader("🔎 차종·용도별 등록 대수 추이")
+
+            cube = artifact(build_cube, artifact(load_vehicle_fact))
+            district_names = dict(zip(df["district_id"], df["시군구"]))
+            vehicle_slice(cube, district_names)
+
+    if is_open(tab5):
+        with tab5:
+            st.subheader("📊 test")
 
         
         
 elif menu == "🚌 대중교통 영향":
     st.header("🚌 대중교통 이용 영향 분석")
-    df = load_data_transit()
+    df = artifact(load_data_transit)
     
-    tab1, tab2, tab3 = st.tabs([
+    tab1, tab2, tab3 = lazy_tabs([
         "📊 교통 데이터 시각화",
         "📈 자동차 증가 예측 모델",
         "⚖️ 교통수단 영향력 비교"
-    ])
-
-
-    with tab1:
-        st.header("📊 대중교통 · 자동차 변화 관계 시각화")
-        st.caption("버스·지하철 지표와 연간 자동차 증감 관계를 확인합니다.")
-
-        fig_bus_car, fig_bus_sub = run_visual_transit(df)
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.pyplot(fig_bus_car)
-        with col2:
-            st.pyplot(fig_bus_sub)
-
-    with tab2:
-        st.header("📈 다항 회귀 및 Ridge 회귀 분석")
-        st.caption("과적합 여부와 규제 강도(α)에 따른 성능 변화를 비교합니다.")
-
-        base_df, ridge_df, degree_df, best_alpha = run_multireg(df)
-
-        st.subheader("① 다항 회귀 성능 비교 (과적합 확인)")
-        st.dataframe(base_df)
-
-        st.subheader("② Ridge 회귀 α 튜닝 결과")
-        st.dataframe(ridge_df)
+    ], key="transit_tab")
 
-        st.success(f"✅ Best alpha (Test R² 기준): **{best_alpha}**")
 
-        st.subheader("③ 차수별 모델 성능 비교")
-        st.dataframe(degree_df)
-    with tab3:
-        st.subheader("📉 Ridge 회귀 계수 비교 (α = 100, 표준화)")
-        st.image("images/transit_ridge.png", width=700)
+    if is_open(tab1):
+        with tab1:
+            st.header("📊 대중교통 · 자동차 변화 관계 시각화")
+            st.caption("버스·지하철 지표와 연간 자동차 증감 관계를 확인합니다.")
 
-elif menu == "🏙 인구 기반 분석":
-    st.header("🏙 인구 변화 기반 자동차 분석")
-    df = load_data()
-    district_list = df["district"].unique()
-
-    selected_district = st.selectbox(
-        "자치구 선택",
-        district_list
-    )
-    st.toast(f"{selected_district} 분석 실행됨")
+            fig_bus_car, fig_bus_sub = artifact(run_visual_transit, df)
 
-    tab1, tab2, tab3 = st.tabs([
-        "📊 군집 분석",
-        "📈 회귀 분석",
-        "🧠 로지스틱 회귀"
-    ])
-
-    # ------------------
-    # 군집
-    # ------------------
-    with tab1:
-        st.markdown("### 📊 군집 분석")
-
-        if selected_district != "전체":
-            st.warning("⚠️ 군집 분석은 전체 선택 시만 가능합니다.")
-        else:
-            df_cluster, summary_df, fig_bar, fig_scatter = run_clustering(df, selected_district)
-
-            st.subheader("📋 자치구별 군집 결과")
-            st.dataframe(df_cluster)
-
-            st.subheader("📊 군집 요약")
-            st.dataframe(summary_df)
-
-            
             col1, col2 = st.columns(2)
             with col1:
-                st.pyplot(fig_scatter)
+                show_figure(fig_bus_car)
             with col2:
-                st.pyplot(fig_bar)
-    # ------------------
-    # 회귀
-    # ------------------
-    with tab2:
-        st.markdown("### 📈 선형 회귀 분석")
+                show_figure(fig_bus_sub)
 
-        fig, desc, corr, coef_df, r2 = run_regression(df, selected_district)
+    if is_open(tab2):
+        with tab2:
+            st.header("📈 다항 회귀 및 Ridge 회귀 분석")
+            st.caption("과적합 여부와 규제 강도(α)에 따른 성능 변화를 비교합니다.")
 
-        st.markdown("#### 📊 기초 통계")
-        st.dataframe(desc)
+            # 근사 없음 — 데이터가 바뀌어 다시 계산하는 동안은 이전 결과를 표시
+            (base_df, ridge_df, degree_df, best_alpha), multireg_state = progress.result(
+                run_multireg, df
+            )
+            show_state(multireg_state)
 
-        st.markdown("#### 🔗 상관계수")
-        st.dataframe(corr)
-
-        st.markdown("#### 📈 회귀 결과")
-        st.dataframe(coef_df)
-
-        st.markdown("#### 📊 모델 성능 (R²)")
-        col1, col2, col3 = st.columns(3)
-        col1.metric(" ",f"{r2:.3f}")
+            st.subheader("① 다항 회귀 성능 비교 (과적합 확인)")
+            st.dataframe(base_df)
 
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("#### 인구 수 변화가 자동차 등록 증감에 미치는 영향")
-            st.pyplot(fig)
-        
-    # ------------------
-    # 로지스틱
-    # ------------------
-    with tab3:
-        st.markdown("### 🧠 로지스틱 회귀 분석")
+            st.subheader("② Ridge 회귀 α 튜닝 결과")
+            paged_table(FrameSource(ridge_df), "ridge", "transit_ridge")
 
-        fig_cm, fig_prob, acc, coef = run_logistic(df, selected_district)
+            st.success(f"✅ Best alpha (Test R² 기준): **{best_alpha}**")
 
-        st.metric("모델 정확도", f"{acc:.2%}")
+            st.subheader("③ 차수별 모델 성능 비교")
+            paged_table(FrameSource(degree_df), "degree", "transit_degree")
+    if is_open(tab3):
+        with tab3:
+            st.subheader("📉 Ridge 회귀 계수 비교 (α = 100, 표준화)")
+            st.image("images/transit_ridge.png", width=700)
 
-        st.markdown("#### 📐 회귀 계수")
-        st.write(f"인구 변화 계수: **{coef:.4f}**")
+elif menu == "🏙 인구 기반 분석":
+    st.header("🏙 인구 변화 기반 자동차 분석")
+    df = artifact(load_data)
+    district_list = df["district"].unique()
 
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("#### 🔍 혼동 행렬")
-            st.pyplot(fig_cm)
-        with col2:
-            st.markdown("#### 📈 자동차 등록 증가 확률 곡선")
-            st.pyplot(fig_prob)
+    population_panels(df, district_list)
 
 elif menu == "🅿️ 주차면 분석":
     st.header("🅿️ 자동차 수 vs 주차면 분석")
-    df = load_data_parking()
-    tab1, tab2 = st.tabs([
+    df = artifact(load_data_parking)
+    tab1, tab2 = lazy_tabs([
         "📊 기초 분석 및 예측",
         "📈 정규화 회귀 (Ridge)"
-    ])
-    with tab1:
-        fig_corr, r, p = plot_correlation(df)
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.subheader("상관 분석")
-            st.pyplot(fig_corr)
-        with col2:
-            fig_reg, model, metrics = run_parking_regression(df)
-            st.subheader("선형 회귀 분석")
-            st.pyplot(fig_reg)        
-
-        st.metric("Train R²", f"{metrics['train_r2']:.3f}")
-        st.metric("Test R²", f"{metrics['test_r2']:.3f}")
-        st.metric("MAE", f"{metrics['mae']:.1f}")
-        st.metric("RMSE", f"{metrics['rmse']:.1f}")
+    ], key="parking_tab")
+    if is_open(tab1):
+        with tab1:
+            results = page_tasks({
+                "corr": (plot_correlation, df),
+                "regression": (run_parking_regression, df),
+                "future": (predict_future, df),
+            })
 
-        # 미래 예측
-        pred = predict_future(df)
-        st.subheader(f"📈 {pred['year']}년 예측")
-        st.write(f"예상 자동차 수: {pred['pred_car']:,}")
-        st.write(f"예상 주차면 수: {pred['pred_parking']:,}")
-        st.write(f"예상 주차 확보율: {pred['parking_ratio']:.2f}%")
-
-    with tab2:
-        st.markdown("### 🧩 Ridge 회귀 (규제 강도 분석)")
-        st.caption("과적합을 줄이기 위한 정규화(Regularization) 효과 확인")
-
-        fig_ridge, best_scores = run_ridge(df)
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.pyplot(fig_ridge)
+            col1, col2 = st.columns(2)
+            with col1:
+                st.subheader("상관 분석")
+                if task_ok(results["corr"]):
+                    fig_corr, r, p = results["corr"]
+                    show_figure(fig_corr)
+            with col2:
+                st.subheader("선형 회귀 분석")
+                if task_ok(results["regression"]):
+                    fig_reg, model, metrics = results["regression"]
+                    show_figure(fig_reg)
+
+            if task_ok(results["regression"]):
+                st.metric("Train R²", f"{metrics['train_r2']:.3f}")
+                st.metric("Test R²", f"{metrics['test_r2']:.3f}")
+                st.metric("MAE", f"{metrics['mae']:.1f}")
+                st.metric("RMSE", f"{metrics['rmse']:.1f}")
+
+            # 미래 예측
+            pred = results["future"]
+            if task_ok(pred):
+                st.subheader(f"📈 {pred['year']}년 예측")
+                st.write(f"예상 자동차 수: {pred['pred_car']:,}")
+                st.write(f"예상 주차면 수: {pred['pred_parking']:,}")
+                st.write(f"예상 주차 확보율: {pred['parking_ratio']:.2f}%")
+
+    if is_open(tab2):
+        with tab2:
+            st.markdown("### 🧩 Ridge 회귀 (규제 강도 분석)")
+            st.caption("과적합을 줄이기 위한 정규화(Regularization) 효과 확인")
+
+            results = page_tasks({
+                "ridge": (run_ridge, df),
+                "poly": (run_parking_poly_regression, df, 2),
+            })
+
+            if task_ok(results["ridge"]):
+                fig_ridge, best_scores = results["ridge"]
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    show_figure(fig_ridge)
+
+                st.subheader("📌 최적 규제 강도 결과")
+                st.metric("Best alpha", best_scores["best_alpha"])
+                st.metric("Train R²", f"{best_scores['train_r2']:.3f}")
+                st.metric("Test R²", f"{best_scores['test_r2']:.3f}")
 
-        st.subheader("📌 최적 규제 강도 결과")
-        st.metric("Best alpha", best_scores["best_alpha"])
-        st.metric("Train R²", f"{best_scores['train_r2']:.3f}")
-        st.metric("Test R²", f"{best_scores['test_r2']:.3f}")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.subheader("📈 다항 회귀 (비선형 관계 확인)")
+                if task_ok(results["poly"]):
+                    fig_poly, poly_model = results["poly"]
+                    show_figure(fig_poly)
+
+
+elif menu == "🗺 지역별 등록 분석":
+    st.header("🗺 시도별 자동차 등록 분석")
+
+    regions = artifact(load_regions)
+    if not regions:
+        st.info("시도별 파티션이 없습니다. `python partition.py` 로 원데이터를 먼저 나눠 주세요.")
+        st.stop()
+
+    region = st.selectbox("지역 선택", regions)
+
+    # 파티션 단위로 집계한 년월별 합계 → 기존 추이 / 요약 / 예측 함수 그대로 사용
+    counts = artifact(load_region_counts, region, key=region)
+    total_summary = artifact(make_monthly_summary, counts, key=region)
+    month_df = to_month_frame(total_summary)
+
+    # 예측은 시계열 페이지와 같은 최소 기간 이상일 때만 (짧으면 ARIMA 가 수렴하지 않음)
+    tasks = {
+        "trend": (plot_vehicle_trend, total_summary),
+        "yearly": (make_yearly_summary, to_yearly(total_summary)),
+    }
+    if len(month_df) >= MIN_WINDOW_MONTHS:
+        tasks["arima"] = (fit_arima, month_df)
+    results = page_tasks(tasks, key=region)
+
+    st.subheader(f"📊 {region} 차종별 및 전체 자동차 등록 추이")
+    if task_ok(results["trend"]):
+        show_figure(results["trend"])
+
+    st.subheader(f"📋 {region} 연도별 자동차 등록 요약")
+    if task_ok(results["yearly"]):
+        paged_table(FrameSource(results["yearly"]), "region_yearly", f"{region}_yearly")
+
+    st.subheader(f"🔮 {region} 미래 12개월 자동차 등록 대수 예측")
+    arima_result = results.get("arima")
+    if arima_result is None:
+        st.info(
+            f"예측에는 {MIN_WINDOW_MONTHS}개월 이상의 데이터가 필요합니다. "
+            f"(현재 {len(month_df)}개월)"
+        )
+    elif task_ok(arima_result):
+        forecast_mean, conf_int = artifact(
+            forecast_12_months, arima_result, month_df.index[-1], key=region
+        )
+        show_figure(artifact(
+            plot_forecast, month_df, forecast_mean, conf_int, region, key=region
+        ))
 
-        col1, col2 = st.columns(2)
-        with col1:
-            st.subheader("📈 다항 회귀 (비선형 관계 확인)")
-            fig_poly, poly_model = run_parking_poly_regression(df, degree=2)
-            st.pyplot(fig_poly)
-        
+# 근사 결과를 먼저 그렸으면 정밀 결과가 끝날 때 다시 실행
+progress.refresh()
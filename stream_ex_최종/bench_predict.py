@@ -0,0 +1,50 @@
+# bench_predict.py
+# 사고 심각도 단건 예측 마이크로벤치마크 (sklearn 파이프라인 vs 컴파일 모델)
+#   python bench_predict.py
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from analysis.cctv.compiled import compile_pipeline
+from analysis.cctv.model import FEATURES, predict_severity, train_model
+
+
+def main(n_calls=500, n_random=5000):
+    df = pd.read_csv("data/cctv_accident.csv")
+    pipe, le, X_test, y_test = train_model(df)
+    compiled = compile_pipeline(pipe)
+
+    # ------------------
+    # 예측 결과 일치 확인
+    # ------------------
+    rng = np.random.default_rng(42)
+    lo = df[FEATURES].min().values
+    hi = df[FEATURES].max().values
+    X_rand = pd.DataFrame(rng.uniform(lo, hi, size=(n_random, len(FEATURES))), columns=FEATURES)
+    X_all = pd.concat([df[FEATURES], X_rand], ignore_index=True)
+
+    assert np.array_equal(pipe.predict(X_all), compiled.predict(X_all.values))
+    assert np.allclose(pipe.predict_proba(X_all), compiled.predict_proba(X_all.values))
+
+    for _, row in X_test.iterrows():
+        sample = row.to_dict()
+        assert predict_severity(pipe, le, sample) == predict_severity(compiled, le, sample)
+
+    print(f"예측 일치: {len(X_all)}건 + 테스트셋 {len(X_test)}건")
+
+    # ------------------
+    # 단건 예측 지연 시간
+    # ------------------
+    sample = X_test.iloc[0].to_dict()
+    for name, model in [("sklearn", pipe), ("compiled", compiled)]:
+        sec = min(timeit.repeat(
+            lambda: predict_severity(model, le, sample),
+            number=n_calls, repeat=3
+        ))
+        print(f"{name:>9}: {sec / n_calls * 1e6:8.1f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
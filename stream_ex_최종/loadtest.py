@@ -0,0 +1,227 @@
+# loadtest.py
+# 동시 사용자 부하 테스트 (Streamlit AppTest 기반, 로컬 SQLite 사용)
+#   python loadtest.py --concurrency 1,2,4,8 --iterations 3
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+PAGES = [
+    "🏠 Home",
+    "📘 시계열 분석",
+    "📊 CCTV & 사고",
+    "🚗 교통량 vs 자동차",
+    "🚌 대중교통 영향",
+    "🏙 인구 기반 분석",
+    "🅿️ 주차면 분석",
+    "🗺 지역별 등록 분석",
+]
+
+
+# ------------------
+# 페이지별 위젯 조작 (페이지 진입 후 한 번 더 rerun)
+# ------------------
+def change_severity_input(at):
+    # 모델 탭은 지연 탭이라 먼저 열어야 입력 위젯이 생김
+    at.session_state["cctv_tab"] = "🤖 사고 심각도 모델"
+    at.run()
+    at.number_input[0].increment()
+    # 예측 입력은 form 이라 제출해야 반영
+    at.button[0].click()
+
+
+def change_district(at):
+    options = at.selectbox[0].options
+    at.selectbox[0].select(options[-1])
+
+
+WIDGET_ACTIONS = {
+    "📊 CCTV & 사고": change_severity_input,
+    "🏙 인구 기반 분석": change_district,
+}
+
+# 지연 탭 (lazy_tabs) 의 session key — 기본 탭 외의 탭 본문 / fragment 는 탭을 바꿔야 실행됨
+TAB_KEYS = {
+    "📊 CCTV & 사고": "cctv_tab",
+    "🚗 교통량 vs 자동차": "traffic_tab",
+    "🚌 대중교통 영향": "transit_tab",
+    "🏙 인구 기반 분석": "population_tab",
+    "🅿️ 주차면 분석": "parking_tab",
+}
+
+
+def cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def rss_mb():
+    from analysis.common.metrics import process_rss_bytes
+    return process_rss_bytes() / 1024 ** 2
+
+
+# ------------------
+# 세션 하나: 모든 메뉴를 순서대로 방문 (지연 탭도 하나씩 열어 봄)
+# ------------------
+def run_session(pages, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    records = []
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+    start = time.perf_counter()
+    at.run()
+    records.append(("(start)", "load", time.perf_counter() - start, len(at.exception)))
+
+    for page in pages:
+        start = time.perf_counter()
+        at.sidebar.radio[0].set_value(page).run()
+        records.append((page, "open", time.perf_counter() - start, len(at.exception)))
+
+        key = TAB_KEYS.get(page)
+        if key is not None:
+            for label in [tab.label for tab in at.tabs][1:]:
+                at.session_state[key] = label
+                start = time.perf_counter()
+                at.run()
+                records.append((page, f"tab:{label}", time.perf_counter() - start, len(at.exception)))
+
+        action = WIDGET_ACTIONS.get(page)
+        if action is not None:
+            action(at)
+            start = time.perf_counter()
+            at.run()
+            records.append((page, "widget", time.perf_counter() - start, len(at.exception)))
+
+    return records
+
+
+def run_level(concurrency, iterations, pages, timeout):
+    cpu_start = cpu_seconds()
+    wall_start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [
+            pool.submit(run_session, pages, timeout)
+            for _ in range(concurrency * iterations)
+        ]
+        records = [r for f in futures for r in f.result()]
+
+    wall = time.perf_counter() - wall_start
+    df = pd.DataFrame(records, columns=["page", "step", "latency", "errors"])
+    df["concurrency"] = concurrency
+
+    return df, {
+        "concurrency": concurrency,
+        "sessions": concurrency * iterations,
+        "wall_s": round(wall, 2),
+        "cpu_s": round(cpu_seconds() - cpu_start, 2),
+        "rss_mb": round(rss_mb(), 1),
+    }
+
+
+# ------------------
+# 페이지별 CPU (동시성 1 에서 rerun 한 번의 프로세스 CPU 시간)
+# ------------------
+def page_cpu(pages, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout).run()
+    rows = []
+    for page in pages:
+        rss_before = rss_mb()
+        cpu_before = cpu_seconds()
+        at.sidebar.radio[0].set_value(page).run()
+        rows.append({
+            "page": page,
+            "cpu_s": round(cpu_seconds() - cpu_before, 3),
+            "rss_delta_mb": round(rss_mb() - rss_before, 1),
+        })
+    return pd.DataFrame(rows)
+
+
+def summarize(df):
+    def pct(q):
+        return lambda s: np.percentile(s, q) * 1000
+
+    return (
+        df.groupby(["concurrency", "page", "step"], sort=False)["latency"]
+        .agg(
+            n="size",
+            p50_ms=pct(50),
+            p95_ms=pct(95),
+            p99_ms=pct(99),
+        )
+        .round(1)
+        .reset_index()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 동시 사용자 부하 테스트")
+    parser.add_argument("--concurrency", default="1,2,4,8",
+                        help="동시 세션 수 목록 (쉼표 구분)")
+    parser.add_argument("--iterations", type=int, default=2,
+                        help="동시성 단계마다 세션 수 = concurrency x iterations")
+    parser.add_argument("--pages", default=None,
+                        help="방문할 메뉴 (쉼표 구분, 기본: 전체)")
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--db", default=None,
+                        help="SQLite 파일 경로 (기본: 임시 파일)")
+    parser.add_argument("--out", default=None, help="원시 측정값 CSV 저장 경로")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+
+    # app.py 는 styles/, data/ 를 상대 경로로 읽음
+    os.chdir(os.path.dirname(APP_PATH))
+
+    # ------------------
+    # 로컬 DB 준비 (외부 MySQL 불필요)
+    # ------------------
+    from analysis.common.localdb import build_sqlite
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), "loadtest.db")
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    os.environ["DB_URL"] = build_sqlite(db_path)
+    os.environ.setdefault("LOG_DIR", os.path.join(os.path.dirname(db_path), "logs"))
+
+    pages = args.pages.split(",") if args.pages else PAGES
+    levels = [int(c) for c in args.concurrency.split(",")]
+
+    print("▶ 페이지별 CPU / 메모리 (동시성 1)")
+    print(page_cpu(pages, args.timeout).to_string(index=False))
+
+    raw, totals = [], []
+    for level in levels:
+        df, total = run_level(level, args.iterations, pages, args.timeout)
+        raw.append(df)
+        totals.append(total)
+        print(f"✅ concurrency={level} 완료 ({total['wall_s']}s)")
+
+    raw = pd.concat(raw, ignore_index=True)
+
+    print("\n▶ rerun 지연 시간")
+    print(summarize(raw).to_string(index=False))
+    print("\n▶ 동시성 단계별 합계")
+    print(pd.DataFrame(totals).to_string(index=False))
+
+    n_errors = int(raw["errors"].sum())
+    if n_errors:
+        print(f"\n⚠️ 예외가 발생한 rerun: {n_errors}")
+
+    if args.out:
+        raw.to_csv(args.out, index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# partition.py
+# 전국 시도별 자동차 등록 원데이터 → partitions/sido=<시도>/year=<연도>/ (parquet)
+#   python partition.py
+#   python partition.py --raw <원데이터.csv> --root partitions --chunk-rows 2000
+# 이후 앱의 '🗺 지역별 등록 분석' 페이지가 파티션 단위로 집계해서 사용
+
+import argparse
+import os
+import time
+
+RAW_DEFAULT = os.path.join(
+    "..", "data",
+    "자동차등록현황보고_자동차등록대수현황 시도별 (201101 ~ 202511)_원데이터.csv"
+)
+
+
+def main():
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    from analysis.region.store import CHUNK_ROWS, PARTITION_ROOT, build_partitions
+
+    parser = argparse.ArgumentParser(description="시도 / 연도별 파티션 생성")
+    parser.add_argument("--raw", default=RAW_DEFAULT, help="원데이터 CSV (cp949)")
+    parser.add_argument("--root", default=PARTITION_ROOT,
+                        help="파티션 디렉터리 (기본: PARTITION_DIR 또는 partitions)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS,
+                        help="한 번에 파싱하는 행 수")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows, n_partitions = build_partitions(args.raw, args.root, args.chunk_rows)
+
+    print(f"🎉 {rows}행 → 파티션 {n_partitions}개, "
+          f"{time.perf_counter() - start:.1f}s → {os.path.abspath(args.root)}")
+
+
+if __name__ == "__main__":
+    main()
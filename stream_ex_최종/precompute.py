@@ -0,0 +1,254 @@
+# precompute.py
+# 배포 시점에 모델 / 그림 / 표를 미리 계산해서 artifacts/<버전>/ 에 저장
+#   python precompute.py
+#   python precompute.py --local --root artifacts
+# 이후 SERVE_ONLY=1 streamlit run app.py 로 계산 없이 서빙
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import traceback
+import warnings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 결과 사전 계산")
+    parser.add_argument("--root", default=None,
+                        help="아티팩트 디렉터리 (기본: ARTIFACT_DIR 또는 artifacts)")
+    parser.add_argument("--local", action="store_true",
+                        help="MySQL 대신 data/*.csv 로 만든 SQLite 사용")
+    parser.add_argument("--no-publish", action="store_true",
+                        help="LATEST 를 갱신하지 않음 (ARTIFACT_VERSION 으로 직접 지정)")
+    parser.add_argument("--allow-partial", action="store_true",
+                        help="실패한 아티팩트가 있어도 LATEST 를 갱신 (기본: 갱신하지 않고 실패 종료)")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    if args.local:
+        from analysis.common.localdb import build_sqlite
+        os.environ["DB_URL"] = build_sqlite(
+            os.path.join(tempfile.mkdtemp(), "precompute.db")
+        )
+
+    # 사전 계산은 항상 직접 계산
+    os.environ["SERVE_ONLY"] = "0"
+
+    from analysis.common.artifacts import (
+        ARTIFACT_ROOT, artifact_name, data_fingerprint,
+        new_version_dir, publish, save, write_manifest
+    )
+
+    root = args.root or ARTIFACT_ROOT
+    version, path = new_version_dir(root)
+    timings, failures = {}, {}
+
+    # ------------------
+    # 계산 → 저장 (값은 그대로 돌려줘서 다음 단계 입력으로 사용)
+    # 실패하면 None → 그 값을 입력으로 쓰는 단계는 건너뜀
+    # ------------------
+    def build(func, *a, key=None, **kw):
+        name = artifact_name(func, key)
+        start = time.perf_counter()
+        try:
+            value = func(*a, **kw)
+            save(path, name, value)
+        except Exception:
+            failures[name] = traceback.format_exc()
+            print(f"❌ {name}")
+            return None
+
+        timings[name] = round(time.perf_counter() - start, 3)
+        print(f"✅ {name}: {timings[name]}s")
+        return value
+
+    start = time.perf_counter()
+
+    # Home
+    from analysis.population_car.data import load_anomaly_events
+    build(load_anomaly_events)
+
+    # 시계열 — 지역별 전체 기간 (serve-only 에서는 기간 선택을 막음)
+    from analysis.car.data import (
+        car_month_frame, car_series, load_district_names, window_key
+    )
+    from analysis.car.time import (
+        MIN_WINDOW_MONTHS, arima_summary, fit_arima, forecast_12_months, plot_diff_1,
+        plot_forecast, plot_monthly, stationarity_test
+    )
+
+    from analysis.common.features import (
+        TOTAL_DISTRICT, VEHICLE_SERIES, load_feature_months, load_features
+    )
+
+    district_names = build(load_district_names) or {}
+    for district_id, name in district_names.items():
+        region = "서울시" if district_id == TOTAL_DISTRICT else name
+        series = car_series(district_id)
+        months = build(load_feature_months, series, district_id, key=district_id)
+        if not months:
+            continue
+
+        window = window_key(district_id, months[0], months[-1])
+        features = build(
+            load_features, [series], [district_id],
+            start=months[0], end=months[-1], key=window
+        )
+        if features is None:
+            continue
+
+        df = car_month_frame(features)
+        build(plot_monthly, df, region, key=window)
+        diff = build(plot_diff_1, features, region, key=window)
+        if diff is not None:
+            build(stationarity_test, diff[1], key=window)
+
+        arima_result = build(fit_arima, df, key=window)
+        if arima_result is None:
+            continue
+        build(arima_summary, arima_result, key=window)
+        forecast = build(forecast_12_months, arima_result, df.index[-1], key=window)
+        if forecast is not None:
+            build(plot_forecast, df, *forecast, region, key=window)
+
+    # CCTV
+    from analysis.cctv.data import load_data_cctv
+    from analysis.cctv.eda import (
+        plot_cctv_vs_death, plot_corr_heatmap,
+        plot_histograms, plot_severity_box
+    )
+    from analysis.cctv.model import build_severity_model, evaluate_model
+
+    df = build(load_data_cctv)
+    if df is not None:
+        num_cols = [
+            '사망자수(명)', '발생건수(건)', '부상자수(명)',
+            '사고당사망률', '사고당부상률', 'CCTV설치대수'
+        ]
+        build(plot_cctv_vs_death, df)
+        build(plot_histograms, df, num_cols)
+        build(plot_severity_box, df)
+        build(plot_corr_heatmap, df, num_cols)
+        model = build(build_severity_model, df)
+        if model is not None:
+            pipe, le, X_test, y_test, _ = model
+            build(evaluate_model, pipe, X_test, y_test, le)
+
+    # 교통량
+    from analysis.traffic_car.cube import build_cube
+    from analysis.traffic_car.data import load_data_traffic, load_vehicle_fact
+    from analysis.traffic_car.traffic import (
+        analyze_correlation, make_yearly_summary, plot_traffic_growth_bar
+    )
+    from analysis.traffic_car.vehicle import make_monthly_summary, plot_vehicle_trend
+
+    yearly = build(
+        load_features, VEHICLE_SERIES, [TOTAL_DISTRICT], yearly=True, key="vehicle_yearly"
+    )
+    if yearly is not None:
+        build(make_yearly_summary, yearly)
+
+    traffic = build(load_data_traffic)
+    if traffic is not None:
+        df, df_traffic = traffic
+        total_summary = build(make_monthly_summary, df)
+        if total_summary is not None:
+            build(plot_vehicle_trend, total_summary)
+        build(plot_traffic_growth_bar, df_traffic)
+        if yearly is not None:
+            build(analyze_correlation, yearly, df_traffic)
+
+    fact = build(load_vehicle_fact)
+    if fact is not None:
+        build(build_cube, fact)
+
+    # 대중교통
+    from analysis.public_transit.data import load_data_transit
+    from analysis.public_transit.multireg import run_multireg
+    from analysis.public_transit.visual_transit import run_visual_transit
+
+    df = build(load_data_transit)
+    if df is not None:
+        build(run_visual_transit, df)
+        build(run_multireg, df)
+
+    # 인구 (자치구별)
+    from analysis.population_car.cluster import run_clustering
+    from analysis.population_car.data import load_data
+    from analysis.population_car.logistic import run_logistic
+    from analysis.population_car.regression import run_regression
+
+    df = build(load_data)
+    if df is not None:
+        build(run_clustering, df, "전체")
+        for district in df["district"].unique():
+            build(run_regression, df, district, key=district)
+            build(run_logistic, df, district, key=district)
+
+    # 주차면
+    from analysis.parking_car.data import load_data_parking
+    from analysis.parking_car.ridge import run_parking_poly_regression, run_ridge
+    from analysis.parking_car.visual_parking import (
+        plot_correlation, predict_future, run_parking_regression
+    )
+
+    df = build(load_data_parking)
+    if df is not None:
+        build(plot_correlation, df)
+        build(run_parking_regression, df)
+        build(predict_future, df)
+        build(run_ridge, df)
+        build(run_parking_poly_regression, df, degree=2)
+
+    # 시도별 (partition.py 로 파티션을 만든 경우만)
+    from analysis.region.data import load_region_counts, load_regions
+    from analysis.region.engine import to_month_frame, to_yearly
+
+    for region in build(load_regions) or []:
+        counts = build(load_region_counts, region, key=region)
+        if counts is None:
+            continue
+        total_summary = build(make_monthly_summary, counts, key=region)
+        if total_summary is None:
+            continue
+        month_df = to_month_frame(total_summary)
+        build(plot_vehicle_trend, total_summary, key=region)
+        build(make_yearly_summary, to_yearly(total_summary), key=region)
+        if len(month_df) < MIN_WINDOW_MONTHS:
+            # 앱도 이 길이에서는 예측하지 않음
+            continue
+        arima_result = build(fit_arima, month_df, key=region)
+        if arima_result is not None:
+            forecast = build(forecast_12_months, arima_result, month_df.index[-1], key=region)
+            if forecast is not None:
+                build(plot_forecast, month_df, *forecast, region, key=region)
+
+    # ------------------
+    # manifest 기록 후 LATEST 교체
+    # 실패가 있으면 (--allow-partial 이 아니면) 교체하지 않음
+    # → serve-only 가 빠진 아티팩트를 찾다가 페이지에서 실패하지 않도록
+    # ------------------
+    write_manifest(path, {
+        "version": version,
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "data_fingerprint": data_fingerprint(),
+        "artifacts": timings,
+        "failures": failures,
+    })
+
+    print(f"🎉 {len(timings)}개 저장 ({len(failures)}개 실패), "
+          f"{time.perf_counter() - start:.1f}s → {os.path.abspath(path)}")
+
+    if failures and not args.allow_partial:
+        print(f"⛔ 실패한 아티팩트가 있어 LATEST 를 갱신하지 않았습니다: {', '.join(failures)}")
+        sys.exit(1)
+
+    if not args.no_publish:
+        publish(version, root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# report.py
+# Streamlit 없이 전체 분석 결과를 HTML / PDF 리포트로 생성
+#   python report.py --out reports/2026-01
+#   python report.py --out reports/local --local --districts all --pdf
+
+import argparse
+import os
+import re
+import tempfile
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _init_worker():
+    warnings.filterwarnings("ignore")
+
+
+def _safe_name(name):
+    return re.sub(r"[^\w가-힣-]+", "_", name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분석 리포트 일괄 생성")
+    parser.add_argument("--out", default="reports", help="출력 디렉터리")
+    parser.add_argument("--sections", default=None,
+                        help="생성할 섹션 (쉼표 구분, 기본: 전체)")
+    parser.add_argument("--districts", default=None,
+                        help="자치구별 리포트: 'all' 또는 쉼표 구분 자치구 이름")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--pdf", action="store_true", help="PDF 도 함께 생성")
+    parser.add_argument("--local", action="store_true",
+                        help="MySQL 대신 data/*.csv 로 만든 SQLite 사용")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    # 워커 프로세스가 같은 DB 를 보도록 풀 생성 전에 환경 변수 설정
+    if args.local:
+        from analysis.common.localdb import build_sqlite
+        os.environ["DB_URL"] = build_sqlite(
+            os.path.join(tempfile.mkdtemp(), "report.db")
+        )
+
+    from analysis.report.render import to_html, to_pdf
+    from analysis.report.sections import DISTRICT_SECTIONS, SECTIONS, build_section
+
+    names = args.sections.split(",") if args.sections else [
+        n for n in SECTIONS if n not in DISTRICT_SECTIONS
+    ]
+
+    districts = []
+    if args.districts == "all":
+        from analysis.population_car.data import load_data
+        districts = list(load_data()["district"].unique())
+    elif args.districts:
+        districts = args.districts.split(",")
+
+    os.makedirs(args.out, exist_ok=True)
+    generated_at = time.strftime("%Y-%m-%d %H:%M:%S")
+    start = time.perf_counter()
+
+    # ------------------
+    # 섹션 / 자치구 단위 작업을 워커 프로세스에 분배
+    # ------------------
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+        main_jobs = [pool.submit(build_section, name) for name in names]
+        district_jobs = {
+            district: [pool.submit(build_section, name, district) for name in DISTRICT_SECTIONS]
+            for district in districts
+        }
+
+        results = [job.result() for job in main_jobs]
+        district_results = {
+            district: [job.result() for job in jobs]
+            for district, jobs in district_jobs.items()
+        }
+
+    # ------------------
+    # 결과 저장
+    # ------------------
+    title = "서울시 교통 데이터 분석 리포트"
+    with open(os.path.join(args.out, "index.html"), "w", encoding="utf-8") as f:
+        f.write(to_html(results, title, generated_at))
+    if args.pdf:
+        to_pdf(results, os.path.join(args.out, "report.pdf"), title)
+
+    if district_results:
+        district_dir = os.path.join(args.out, "district")
+        os.makedirs(district_dir, exist_ok=True)
+
+        for district, parts in district_results.items():
+            name = _safe_name(district)
+            district_title = f"{title} - {district}"
+            with open(os.path.join(district_dir, f"{name}.html"), "w", encoding="utf-8") as f:
+                f.write(to_html(parts, district_title, generated_at))
+            if args.pdf:
+                to_pdf(parts, os.path.join(district_dir, f"{name}.pdf"), district_title)
+
+    # ------------------
+    # 요약 출력
+    # ------------------
+    all_results = results + [r for parts in district_results.values() for r in parts]
+    for r in all_results:
+        status = "❌" if r["error"] else "✅"
+        label = r["name"] + (f" [{r['district']}]" if r["district"] else "")
+        print(f"{status} {label}: {r['seconds']}s")
+
+    failed = sum(1 for r in all_results if r["error"])
+    print(f"🎉 {len(all_results)}개 섹션 ({failed}개 실패), "
+          f"{time.perf_counter() - start:.1f}s → {os.path.abspath(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
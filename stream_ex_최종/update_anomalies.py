@@ -0,0 +1,38 @@
+# update_anomalies.py
+# 새 월을 적재한 뒤 이상 변동 탐지만 단독 실행 (저장된 상태에서 이어서, 이력 재스캔 없음)
+#   python update_anomalies.py
+#   python update_anomalies.py --reset     # 상태 / 이벤트를 지우고 전체 이력으로 다시 계산
+# DB 는 DB_URL 환경 변수 (앱과 같음)
+
+import argparse
+import os
+
+
+def main():
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    from sqlalchemy import text
+
+    from analysis.common.db import get_engine, touch_table
+    from analysis.population_car.anomaly import EVENT_TABLE, STATE_TABLE, update_anomalies
+
+    parser = argparse.ArgumentParser(description="월별 증감 이상치 탐지 (신규 월만 반영)")
+    parser.add_argument("--reset", action="store_true",
+                        help="저장된 상태 / 이벤트를 지우고 처음부터 계산")
+    args = parser.parse_args()
+
+    engine = get_engine()
+
+    if args.reset:
+        with engine.connect() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {STATE_TABLE}"))
+            conn.execute(text(f"DROP TABLE IF EXISTS {EVENT_TABLE}"))
+            conn.commit()
+        touch_table(engine, EVENT_TABLE)
+
+    n_events = update_anomalies(engine)
+    print(f"🚨 이상 변동 {n_events}건 기록")
+
+
+if __name__ == "__main__":
+    main()